@@ -1,13 +1,29 @@
 from django.contrib import admin
 
+from breemind_back.common.pagination import EstimatedCountPaginator
+
 from .models import Appointment
 from .models import Note
 from .models import Patient
 from .models import PlanOfCare
+from .models import WorkingHours
+from .selectors import patient_search
+
+
+class CareModelAdmin(admin.ModelAdmin):
+    """
+    Base admin for large care tables.
+
+    Changelists use the planner's row estimate instead of COUNT(*) on big
+    unfiltered tables and skip the second "full result" count entirely.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Patient)
-class PatientAdmin(admin.ModelAdmin):
+class PatientAdmin(CareModelAdmin):
     list_display = (
         "id",
         "first_name",
@@ -19,9 +35,15 @@ class PatientAdmin(admin.ModelAdmin):
     search_fields = ("first_name", "last_name", "whatsapp_number", "email")
     list_filter = ("is_active",)
 
+    def get_search_results(self, request, queryset, search_term):
+        # Index-backed search instead of icontains over every search field.
+        if not search_term:
+            return queryset, False
+        return patient_search(query=search_term, queryset=queryset), False
+
 
 @admin.register(Appointment)
-class AppointmentAdmin(admin.ModelAdmin):
+class AppointmentAdmin(CareModelAdmin):
     list_display = (
         "id",
         "patient",
@@ -30,19 +52,36 @@ class AppointmentAdmin(admin.ModelAdmin):
         "duration_minutes",
         "status",
     )
-    list_filter = ("status", "doctor")
+    list_filter = ("status", ("doctor", admin.RelatedOnlyFieldListFilter))
+    list_select_related = ("patient", "doctor")
     search_fields = ("patient__first_name", "patient__last_name", "doctor__username")
+    autocomplete_fields = ("patient", "doctor")
+    date_hierarchy = "scheduled_start_at"
 
 
 @admin.register(Note)
-class NoteAdmin(admin.ModelAdmin):
+class NoteAdmin(CareModelAdmin):
     list_display = ("id", "patient", "author", "note_type", "is_locked", "created_at")
     list_filter = ("note_type", "is_locked")
+    list_select_related = ("patient", "author")
     search_fields = ("patient__first_name", "patient__last_name", "author__username")
+    autocomplete_fields = ("patient", "author")
+    raw_id_fields = ("appointment",)
 
 
 @admin.register(PlanOfCare)
-class PlanOfCareAdmin(admin.ModelAdmin):
+class PlanOfCareAdmin(CareModelAdmin):
     list_display = ("id", "patient", "title", "status", "start_date", "end_date")
     list_filter = ("status",)
+    list_select_related = ("patient",)
     search_fields = ("patient__first_name", "patient__last_name", "title")
+    autocomplete_fields = ("patient", "created_by")
+
+
+@admin.register(WorkingHours)
+class WorkingHoursAdmin(admin.ModelAdmin):
+    list_display = ("id", "doctor", "weekday", "start_time", "end_time")
+    list_filter = ("weekday",)
+    list_select_related = ("doctor",)
+    search_fields = ("doctor__username",)
+    autocomplete_fields = ("doctor",)
@@ -0,0 +1,534 @@
+from datetime import datetime
+from datetime import timedelta
+
+from django.conf import settings
+from django.http import Http404
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Note
+from breemind_back.care.permissions import IsClinicalStaff
+from breemind_back.care.selectors import TIMELINE_SOURCES
+from breemind_back.care.selectors import aappointment_list_doctor_agenda
+from breemind_back.care.selectors import appointment_list
+from breemind_back.care.selectors import doctor_list_available
+from breemind_back.care.selectors import doctor_list_free_slots
+from breemind_back.care.selectors import note_list
+from breemind_back.care.selectors import note_search
+from breemind_back.care.selectors import patient_list_visible
+from breemind_back.care.selectors import patient_search
+from breemind_back.care.selectors import patient_timeline
+from breemind_back.common.pagination import KeysetPagination
+from breemind_back.common.pagination import aget_paginated_response
+from breemind_back.common.pagination import decode_cursor
+from breemind_back.common.pagination import encode_cursor
+from breemind_back.common.serializers import ReadOnlySerializer
+from breemind_back.common.utils import get_object
+from breemind_back.common.views import AsyncAPIView
+from breemind_back.users.models import User
+
+
+class PatientSearchApi(APIView):
+    """Patient search API."""
+
+    permission_classes = [IsClinicalStaff]
+
+    class FilterSerializer(serializers.Serializer):
+        q = serializers.CharField(max_length=100)
+        limit = serializers.IntegerField(
+            required=False,
+            default=20,
+            min_value=1,
+            max_value=50,
+        )
+
+    class OutputSerializer(ReadOnlySerializer):
+        id = serializers.IntegerField()
+        first_name = serializers.CharField()
+        last_name = serializers.CharField()
+        whatsapp_number = serializers.CharField()
+        email = serializers.EmailField(allow_null=True)
+        is_active = serializers.BooleanField()
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={200: OutputSerializer(many=True)},
+    )
+    def get(self, request):
+        """Search patients, best matches first."""
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        patients = patient_search(
+            query=filters["q"],
+            queryset=patient_list_visible(user=request.user),
+        )[: filters["limit"]]
+
+        output_serializer = self.OutputSerializer(patients, many=True)
+
+        return Response(data=output_serializer.data, status=status.HTTP_200_OK)
+
+
+class AppointmentListApi(AsyncAPIView):
+    """Appointment list API."""
+
+    permission_classes = [IsClinicalStaff]
+
+    class Pagination(KeysetPagination):
+        default_limit = 20
+
+    class FilterSerializer(serializers.Serializer):
+        patient_id = serializers.IntegerField(required=False)
+        doctor_id = serializers.IntegerField(required=False)
+        status = serializers.ChoiceField(
+            choices=Appointment.Status.choices,
+            required=False,
+        )
+
+    class OutputSerializer(ReadOnlySerializer):
+        id = serializers.IntegerField()
+        patient_id = serializers.IntegerField()
+        patient_name = serializers.CharField(source="patient.full_name")
+        doctor_id = serializers.IntegerField()
+        scheduled_start_at = serializers.DateTimeField()
+        scheduled_end_at = serializers.DateTimeField()
+        duration_minutes = serializers.IntegerField()
+        status = serializers.CharField()
+        notes_summary = serializers.CharField()
+        created_at = serializers.DateTimeField()
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={200: OutputSerializer(many=True)},
+    )
+    async def get(self, request):
+        """List appointments, newest first."""
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+
+        appointments = appointment_list(
+            filters=filters_serializer.validated_data,
+            user=request.user,
+        )
+
+        return await aget_paginated_response(
+            pagination_class=self.Pagination,
+            serializer_class=self.OutputSerializer,
+            queryset=appointments,
+            request=request,
+            view=self,
+        )
+
+
+class NoteListApi(AsyncAPIView):
+    """Note list API."""
+
+    permission_classes = [IsClinicalStaff]
+
+    class Pagination(KeysetPagination):
+        default_limit = 20
+
+    class FilterSerializer(serializers.Serializer):
+        patient_id = serializers.IntegerField(required=False)
+        author_id = serializers.IntegerField(required=False)
+        note_type = serializers.ChoiceField(
+            choices=Note.NoteType.choices,
+            required=False,
+        )
+        is_locked = serializers.BooleanField(
+            required=False,
+            allow_null=True,
+            default=None,
+        )
+
+    class OutputSerializer(ReadOnlySerializer):
+        id = serializers.IntegerField()
+        patient_id = serializers.IntegerField()
+        appointment_id = serializers.IntegerField(allow_null=True)
+        author_id = serializers.IntegerField()
+        note_type = serializers.CharField()
+        content = serializers.CharField()
+        is_locked = serializers.BooleanField()
+        created_at = serializers.DateTimeField()
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={200: OutputSerializer(many=True)},
+    )
+    async def get(self, request):
+        """List notes, newest first."""
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+
+        notes = note_list(
+            filters=filters_serializer.validated_data,
+            user=request.user,
+        )
+
+        return await aget_paginated_response(
+            pagination_class=self.Pagination,
+            serializer_class=self.OutputSerializer,
+            queryset=notes,
+            request=request,
+            view=self,
+        )
+
+
+class NoteSearchApi(APIView):
+    """Note full-text search API."""
+
+    permission_classes = [IsClinicalStaff]
+
+    class FilterSerializer(serializers.Serializer):
+        q = serializers.CharField(max_length=200)
+        patient_id = serializers.IntegerField(required=False)
+        author_id = serializers.IntegerField(required=False)
+        note_type = serializers.ChoiceField(
+            choices=Note.NoteType.choices,
+            required=False,
+        )
+        created_from = serializers.DateField(required=False)
+        created_to = serializers.DateField(required=False)
+        limit = serializers.IntegerField(
+            required=False,
+            default=20,
+            min_value=1,
+            max_value=50,
+        )
+
+        def validate(self, attrs):
+            created_from = attrs.get("created_from")
+            created_to = attrs.get("created_to")
+            if created_from and created_to and created_to < created_from:
+                raise serializers.ValidationError(
+                    {"created_to": "Must not be before created_from."},
+                )
+            return attrs
+
+    class OutputSerializer(ReadOnlySerializer):
+        id = serializers.IntegerField()
+        patient_id = serializers.IntegerField()
+        appointment_id = serializers.IntegerField(allow_null=True)
+        author_id = serializers.IntegerField()
+        note_type = serializers.CharField()
+        is_locked = serializers.BooleanField()
+        created_at = serializers.DateTimeField()
+        headline = serializers.CharField()
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={200: OutputSerializer(many=True)},
+    )
+    def get(self, request):
+        """Search note content, best matches first."""
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        notes = note_search(
+            query=filters["q"],
+            filters=filters,
+            user=request.user,
+        )[: filters["limit"]]
+
+        output_serializer = self.OutputSerializer(notes, many=True)
+
+        return Response(data=output_serializer.data, status=status.HTTP_200_OK)
+
+
+class PatientTimelineApi(APIView):
+    """Patient timeline API."""
+
+    permission_classes = [IsClinicalStaff]
+
+    invalid_cursor_message = "Invalid cursor"
+
+    class FilterSerializer(serializers.Serializer):
+        cursor = serializers.CharField(required=False)
+        limit = serializers.IntegerField(
+            required=False,
+            default=20,
+            min_value=1,
+            max_value=50,
+        )
+
+    class OutputSerializer(ReadOnlySerializer):
+        class AppointmentSerializer(ReadOnlySerializer):
+            doctor_id = serializers.IntegerField()
+            doctor_name = serializers.CharField(source="doctor.name")
+            scheduled_start_at = serializers.DateTimeField()
+            duration_minutes = serializers.IntegerField()
+            status = serializers.CharField()
+
+        class NoteSerializer(ReadOnlySerializer):
+            author_id = serializers.IntegerField()
+            author_name = serializers.CharField(source="author.name")
+            appointment_id = serializers.IntegerField(allow_null=True)
+            note_type = serializers.CharField()
+            content = serializers.CharField()
+            is_locked = serializers.BooleanField()
+
+        class PlanOfCareSerializer(ReadOnlySerializer):
+            created_by_id = serializers.IntegerField()
+            title = serializers.CharField()
+            status = serializers.CharField()
+            start_date = serializers.DateField()
+            end_date = serializers.DateField(allow_null=True)
+            review_date = serializers.DateField(allow_null=True)
+
+        type = serializers.ChoiceField(choices=list(TIMELINE_SOURCES))
+        id = serializers.IntegerField()
+        occurred_at = serializers.DateTimeField()
+        # Only the one matching `type` is present.
+        appointment = AppointmentSerializer(required=False)
+        note = NoteSerializer(required=False)
+        plan_of_care = PlanOfCareSerializer(required=False)
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={
+            200: inline_serializer(
+                name="PatientTimelinePage",
+                fields={
+                    "limit": serializers.IntegerField(),
+                    "next": serializers.URLField(allow_null=True),
+                    "results": OutputSerializer(many=True),
+                },
+            ),
+        },
+    )
+    def get(self, request, patient_id):
+        """List a patient's appointments, notes and plans of care, newest first."""
+        patient = get_object(patient_list_visible(user=request.user), id=patient_id)
+        if patient is None:
+            raise Http404
+
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        events, next_positions = patient_timeline(
+            patient_id=patient.id,
+            limit=filters["limit"],
+            positions=self._decode_cursor(filters.get("cursor")),
+        )
+
+        output_serializer = self.OutputSerializer(
+            [
+                {
+                    "type": event.type,
+                    "id": event.id,
+                    "occurred_at": event.occurred_at,
+                    event.type: event.object,
+                }
+                for event in events
+            ],
+            many=True,
+        )
+
+        next_link = None
+        if next_positions is not None:
+            next_link = replace_query_param(
+                request.build_absolute_uri(),
+                "cursor",
+                self._encode_cursor(next_positions),
+            )
+
+        return Response(
+            data={
+                "limit": filters["limit"],
+                "next": next_link,
+                "results": output_serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @staticmethod
+    def _encode_cursor(positions):
+        # One (created_at, id) position per source, so each seeks independently.
+        return encode_cursor(
+            {
+                source: [created_at.isoformat(), pk]
+                for source, (created_at, pk) in positions.items()
+            },
+        )
+
+    def _decode_cursor(self, cursor):
+        if not cursor:
+            return None
+
+        try:
+            return {
+                source: (datetime.fromisoformat(created_at), int(pk))
+                for source, (created_at, pk) in decode_cursor(cursor).items()
+                if source in TIMELINE_SOURCES
+            }
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+
+class DoctorAgendaApi(AsyncAPIView):
+    """Doctor agenda API."""
+
+    permission_classes = [IsClinicalStaff]
+    other_agenda_message = "Only staff may read other doctors' agendas."
+
+    class FilterSerializer(serializers.Serializer):
+        doctor_id = serializers.IntegerField(required=False)
+        date = serializers.DateField(required=False)
+
+    class OutputSerializer(ReadOnlySerializer):
+        id = serializers.IntegerField()
+        patient_id = serializers.IntegerField()
+        patient_name = serializers.CharField(source="patient.full_name")
+        scheduled_start_at = serializers.DateTimeField()
+        scheduled_end_at = serializers.DateTimeField()
+        duration_minutes = serializers.IntegerField()
+        status = serializers.CharField()
+        notes_summary = serializers.CharField()
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={200: OutputSerializer(many=True)},
+    )
+    async def get(self, request):
+        """List a doctor's appointments for a day, defaulting to my agenda today."""
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        doctor_id = filters.get("doctor_id", request.user.id)
+        if doctor_id != request.user.id and not request.user.is_staff:
+            raise PermissionDenied(self.other_agenda_message)
+
+        appointments = await aappointment_list_doctor_agenda(
+            doctor_id=doctor_id,
+            day=filters.get("date"),
+        )
+
+        output_serializer = self.OutputSerializer(appointments, many=True)
+
+        return Response(data=output_serializer.data, status=status.HTTP_200_OK)
+
+
+class DoctorAvailabilityApi(APIView):
+    """Doctor availability API."""
+
+    permission_classes = [IsClinicalStaff]
+
+    class FilterSerializer(serializers.Serializer):
+        start_date = serializers.DateField(required=False)
+        end_date = serializers.DateField(required=False)
+        slot_minutes = serializers.IntegerField(
+            required=False,
+            default=30,
+            min_value=5,
+            max_value=480,
+        )
+        limit = serializers.IntegerField(required=False, min_value=1)
+
+        def validate(self, attrs):
+            start_date = attrs.get("start_date") or timezone.localdate()
+            end_date = attrs.get("end_date") or start_date + timedelta(days=6)
+
+            if end_date < start_date:
+                raise serializers.ValidationError(
+                    {"end_date": "Must not be before start_date."},
+                )
+
+            max_days = settings.CARE_AVAILABILITY_MAX_DAYS
+            if (end_date - start_date).days >= max_days:
+                raise serializers.ValidationError(
+                    {"end_date": f"Range must not exceed {max_days} days."},
+                )
+
+            attrs["start_date"] = start_date
+            attrs["end_date"] = end_date
+            return attrs
+
+    class OutputSerializer(ReadOnlySerializer):
+        start = serializers.DateTimeField()
+        end = serializers.DateTimeField()
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={200: OutputSerializer(many=True)},
+    )
+    def get(self, request, doctor_id):
+        """List a doctor's open slots."""
+        doctor = get_object(User, id=doctor_id)
+        if doctor is None:
+            raise Http404
+
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+
+        slots = doctor_list_free_slots(
+            doctor=doctor,
+            **filters_serializer.validated_data,
+        )
+
+        output_serializer = self.OutputSerializer(
+            [{"start": start, "end": end} for start, end in slots],
+            many=True,
+        )
+
+        return Response(data=output_serializer.data, status=status.HTTP_200_OK)
+
+
+class ClinicAvailabilityApi(APIView):
+    """Clinic-wide availability API."""
+
+    permission_classes = [IsClinicalStaff]
+
+    class FilterSerializer(serializers.Serializer):
+        date = serializers.DateField()
+        start_time = serializers.TimeField()
+        end_time = serializers.TimeField()
+        doctor_ids = serializers.ListField(
+            child=serializers.IntegerField(),
+            required=False,
+        )
+
+        def validate(self, attrs):
+            if attrs["end_time"] <= attrs["start_time"]:
+                raise serializers.ValidationError(
+                    {"end_time": "Must be after start_time."},
+                )
+            return attrs
+
+    class OutputSerializer(ReadOnlySerializer):
+        id = serializers.IntegerField()
+        username = serializers.CharField()
+        name = serializers.CharField()
+
+    @extend_schema(
+        parameters=[FilterSerializer],
+        responses={200: OutputSerializer(many=True)},
+    )
+    def get(self, request):
+        """List the doctors free for a whole time window."""
+        filters_serializer = self.FilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+        filters = filters_serializer.validated_data
+
+        tz = timezone.get_current_timezone()
+        doctors = doctor_list_available(
+            start=datetime.combine(filters["date"], filters["start_time"], tzinfo=tz),
+            end=datetime.combine(filters["date"], filters["end_time"], tzinfo=tz),
+            doctor_ids=filters.get("doctor_ids"),
+        )
+
+        output_serializer = self.OutputSerializer(doctors, many=True)
+
+        return Response(data=output_serializer.data, status=status.HTTP_200_OK)
@@ -1,3 +1,5 @@
+import contextlib
+
 from django.apps import AppConfig
 
 
@@ -5,3 +7,7 @@ class CareConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "breemind_back.care"
     verbose_name = "Care"
+
+    def ready(self):
+        with contextlib.suppress(ImportError):
+            import breemind_back.care.signals  # noqa: F401, PLC0415
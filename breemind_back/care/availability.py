@@ -0,0 +1,155 @@
+"""
+Pure availability computations.
+
+Nothing in this module touches the database: selectors fetch booked intervals
+and working-hour templates, and hand them over as plain, sorted tuples.
+"""
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import tzinfo
+
+Interval = tuple[datetime, datetime]
+# (weekday, start_time, end_time), weekday follows date.weekday().
+WorkingHoursTemplate = tuple[int, time, time]
+
+
+def working_windows(
+    *,
+    templates: Iterable[WorkingHoursTemplate],
+    start_date: date,
+    end_date: date,
+    tz: tzinfo,
+) -> list[Interval]:
+    """
+    Expand weekly templates into aware, sorted windows for [start_date, end_date].
+    """
+    by_weekday: dict[int, list[tuple[time, time]]] = {}
+    for weekday, start_time, end_time in templates:
+        by_weekday.setdefault(weekday, []).append((start_time, end_time))
+
+    windows = []
+    day = start_date
+    while day <= end_date:
+        for start_time, end_time in sorted(by_weekday.get(day.weekday(), [])):
+            windows.append(
+                (
+                    datetime.combine(day, start_time, tzinfo=tz),
+                    datetime.combine(day, end_time, tzinfo=tz),
+                ),
+            )
+        day += timedelta(days=1)
+
+    return windows
+
+
+def free_intervals(
+    *,
+    windows: list[Interval],
+    busy: list[Interval],
+) -> Iterator[Interval]:
+    """
+    Yield the gaps of `windows` not covered by `busy`.
+
+    Both inputs must be sorted by start. A single sweep walks the two lists
+    together, so the cost is O(len(windows) + len(busy)).
+    """
+    first_busy = 0
+
+    for window_start, window_end in windows:
+        # Busy intervals that end before this window can never matter again.
+        while first_busy < len(busy) and busy[first_busy][1] <= window_start:
+            first_busy += 1
+
+        cursor = window_start
+        index = first_busy
+        while index < len(busy) and busy[index][0] < window_end:
+            busy_start, busy_end = busy[index]
+            if busy_start > cursor:
+                yield cursor, busy_start
+            cursor = max(cursor, busy_end)
+            if cursor >= window_end:
+                break
+            index += 1
+
+        if cursor < window_end:
+            yield cursor, window_end
+
+
+def split_into_slots(
+    *,
+    intervals: Iterable[Interval],
+    slot_minutes: int,
+    not_before: datetime | None = None,
+) -> Iterator[Interval]:
+    """
+    Cut free intervals into fixed-size slots aligned to the slot grid.
+
+    Slots are aligned to whole multiples of `slot_minutes` since local
+    midnight, so a gap that opens at 10:10 offers 10:30 for 30 minute slots.
+    """
+    step = timedelta(minutes=slot_minutes)
+
+    for interval_start, interval_end in intervals:
+        start = interval_start
+        if not_before is not None and not_before > start:
+            start = not_before
+
+        midnight = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        remainder = (start - midnight) % step
+        if remainder:
+            start += step - remainder
+
+        while start + step <= interval_end:
+            yield start, start + step
+            start += step
+
+
+# Per-day slot bitsets: bit i is the i-th SLOT_MINUTES slot after local midnight.
+# Python ints keep this compact and make AND/OR over many doctors run in C.
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+
+def _slot_index(*, moment: datetime, day_start: datetime, round_up: bool) -> int:
+    offset = (moment - day_start) // timedelta(minutes=SLOT_MINUTES)
+    if round_up and (moment - day_start) % timedelta(minutes=SLOT_MINUTES):
+        offset += 1
+    return min(max(offset, 0), SLOTS_PER_DAY)
+
+
+def slot_range_mask(first_slot: int, last_slot: int) -> int:
+    """Mask with bits [first_slot, last_slot) set."""
+    if last_slot <= first_slot:
+        return 0
+    return ((1 << (last_slot - first_slot)) - 1) << first_slot
+
+
+def covered_mask(*, intervals: Iterable[Interval], day_start: datetime) -> int:
+    """Mask of the slots entirely inside any of `intervals`."""
+    mask = 0
+    for start, end in intervals:
+        mask |= slot_range_mask(
+            _slot_index(moment=start, day_start=day_start, round_up=True),
+            _slot_index(moment=end, day_start=day_start, round_up=False),
+        )
+    return mask
+
+
+def touched_mask(*, intervals: Iterable[Interval], day_start: datetime) -> int:
+    """Mask of the slots that overlap any of `intervals`."""
+    mask = 0
+    for start, end in intervals:
+        mask |= slot_range_mask(
+            _slot_index(moment=start, day_start=day_start, round_up=False),
+            _slot_index(moment=end, day_start=day_start, round_up=True),
+        )
+    return mask
+
+
+def mask_contains(mask: int, required: int) -> bool:
+    return mask & required == required
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:57
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Indexes are built CONCURRENTLY so large patient tables stay writable.
+    atomic = False
+
+    dependencies = [
+        ('care', '0003_workinghours'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='patient',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), name='gin_trgm_ops'), name='patient_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='patient',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('whatsapp_number', name='varchar_pattern_ops'), name='patient_whatsapp_prefix'),
+        ),
+        AddIndexConcurrently(
+            model_name='patient',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Lower('email'), name='text_pattern_ops'), name='patient_email_prefix'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:01
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction. It does not
+    # block writes, so these can be applied to large live tables.
+    atomic = False
+
+    dependencies = [
+        ('care', '0005_appointment_doctor_start_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='appointment',
+            index=models.Index(condition=models.Q(('status', 'SCHEDULED')), fields=['doctor', 'scheduled_start_at'], name='appointment_scheduled_start'),
+        ),
+        AddIndexConcurrently(
+            model_name='appointment',
+            index=models.Index(fields=['doctor', 'created_at'], name='appointment_doctor_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='appointment',
+            index=models.Index(fields=['patient', 'created_at'], name='appointment_patient_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='note',
+            index=models.Index(fields=['patient', 'created_at'], name='note_patient_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='note',
+            index=models.Index(condition=models.Q(('is_locked', False)), fields=['author', 'created_at'], name='note_unlocked_author_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='planofcare',
+            index=models.Index(fields=['status', 'review_date'], name='planofcare_status_review'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:04
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('care', '0006_hot_path_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='planofcare',
+            index=models.Index(fields=['patient', 'created_at'], name='planofcare_patient_created'),
+        ),
+    ]
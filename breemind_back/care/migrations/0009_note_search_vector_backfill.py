@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.db import migrations
+
+# Rows updated per statement. Each batch commits on its own, so no lock on
+# care_note is held for longer than one batch takes.
+BATCH_SIZE = 5000
+
+
+def backfill_search_vector(apps, schema_editor):
+    # Notes saved since 0008 already have their vector; skip them.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT min(id), max(id) FROM care_note")
+        first_id, last_id = cursor.fetchone()
+        if first_id is None:
+            return
+
+        for start in range(first_id, last_id + 1, BATCH_SIZE):
+            cursor.execute(
+                "UPDATE care_note "
+                "SET search_vector = "
+                "setweight(to_tsvector('english'::regconfig, note_type), 'A') || "
+                "setweight(to_tsvector('english'::regconfig, content), 'B') "
+                "WHERE id >= %s AND id < %s AND search_vector IS NULL",
+                [start, start + BATCH_SIZE],
+            )
+
+
+class Migration(migrations.Migration):
+
+    # Backfill in batches that commit one by one instead of rewriting the
+    # largest table in one transaction. Safe to re-run after a failure.
+    atomic = False
+
+    dependencies = [
+        ('care', '0008_note_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.db import migrations
+
+# Rows updated per statement. Each batch commits on its own, so no lock on
+# care_appointment is held for longer than one batch takes.
+BATCH_SIZE = 5000
+
+BACKFILL_SQL = (
+    "UPDATE care_appointment "
+    "SET scheduled_range = tstzrange("
+    "scheduled_start_at, "
+    "scheduled_start_at + duration_minutes * interval '1 minute', "
+    "'[)') "
+    "WHERE scheduled_range IS NULL"
+)
+
+
+def backfill_scheduled_range(apps, schema_editor):
+    # Appointments saved since 0002 already have their range; skip them.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT min(id), max(id) FROM care_appointment")
+        first_id, last_id = cursor.fetchone()
+        if first_id is None:
+            return
+
+        for start in range(first_id, last_id + 1, BATCH_SIZE):
+            cursor.execute(
+                f"{BACKFILL_SQL} AND id >= %s AND id < %s",
+                [start, start + BATCH_SIZE],
+            )
+
+
+class Migration(migrations.Migration):
+
+    # Backfill in batches that commit one by one instead of rewriting the
+    # table in one transaction. Safe to re-run after a failure.
+    atomic = False
+
+    dependencies = [
+        ('care', '0010_note_search_vector_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_scheduled_range, migrations.RunPython.noop),
+    ]
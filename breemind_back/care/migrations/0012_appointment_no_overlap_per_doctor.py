@@ -0,0 +1,101 @@
+import logging
+
+import django.contrib.postgres.constraints
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Doctors with SCHEDULED appointments overlapping an earlier one.
+CONFLICTING_DOCTORS_SQL = """
+SELECT DISTINCT doctor_id FROM (
+    SELECT
+        doctor_id,
+        lower(scheduled_range) < max(upper(scheduled_range)) OVER (
+            PARTITION BY doctor_id
+            ORDER BY lower(scheduled_range), id
+            ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+        ) AS overlapping
+    FROM care_appointment
+    WHERE status = 'SCHEDULED'
+) appointments
+WHERE overlapping
+"""
+
+
+def resolve_overlaps(apps, schema_editor):
+    """
+    Reschedule SCHEDULED appointments that double-book their doctor.
+
+    The appointment booked first keeps its slot; later ones it overlaps are
+    set to RESCHEDULED, which frees the slot without losing the row, and are
+    logged for the clinic to follow up.
+    """
+    Appointment = apps.get_model("care", "Appointment")
+
+    with schema_editor.connection.cursor() as cursor:
+        # Rows written since the backfill stay put until the constraint holds;
+        # reads go on.
+        cursor.execute("LOCK TABLE care_appointment IN SHARE ROW EXCLUSIVE MODE")
+        cursor.execute(
+            "UPDATE care_appointment SET scheduled_range = tstzrange("
+            "scheduled_start_at, "
+            "scheduled_start_at + duration_minutes * interval '1 minute', "
+            "'[)') "
+            "WHERE scheduled_range IS NULL",
+        )
+        cursor.execute(CONFLICTING_DOCTORS_SQL)
+        doctor_ids = [doctor_id for (doctor_id,) in cursor.fetchall()]
+
+    rescheduled = []
+    for doctor_id in doctor_ids:
+        kept = []
+        for appointment_id, booked in (
+            Appointment.objects.filter(doctor_id=doctor_id, status="SCHEDULED")
+            .order_by("created_at", "id")
+            .values_list("id", "scheduled_range")
+        ):
+            if any(
+                booked.lower < other.upper and other.lower < booked.upper
+                for other in kept
+            ):
+                rescheduled.append(appointment_id)
+            else:
+                kept.append(booked)
+
+    if rescheduled:
+        Appointment.objects.filter(id__in=rescheduled).update(
+            status="RESCHEDULED",
+            updated_at=timezone.now(),
+        )
+        logger.warning(
+            "Rescheduled %d double-booked appointments: %s",
+            len(rescheduled),
+            ", ".join(map(str, rescheduled)),
+        )
+
+
+class Migration(migrations.Migration):
+
+    # Postgres builds the exclusion constraint's GiST index under an ACCESS
+    # EXCLUSIVE lock, with no concurrent variant. Everything else has been
+    # done beforehand, so the lock only lasts for the index build, and
+    # lock_timeout gives up instead of queueing requests behind a long
+    # transaction.
+    dependencies = [
+        ('care', '0011_appointment_scheduled_range_backfill'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="SET LOCAL lock_timeout = '10s'",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunPython(resolve_overlaps, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='appointment',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('status', 'SCHEDULED')), expressions=[('doctor', '='), ('scheduled_range', '&&')], name='appointment_no_overlap_per_doctor', violation_error_message='Doctor already has an appointment during this time.'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+import datetime
+
+import django.contrib.postgres.fields.ranges
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+SCHEDULED_RANGE_SQL = (
+    "tstzrange("
+    "scheduled_start_at, "
+    "scheduled_start_at + duration_minutes * interval '1 minute', "
+    "'[)')"
+)
+
+
+class Migration(migrations.Migration):
+
+    # The constraint is added NOT VALID, so only rows written from then on are
+    # checked and the ACCESS EXCLUSIVE lock is brief. Rows that bulk_create or
+    # QuerySet.update left NULL or stale are then fixed, and validating scans
+    # the table without blocking writes.
+    atomic = False
+
+    dependencies = [
+        ('care', '0012_appointment_no_overlap_per_doctor'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        "ALTER TABLE care_appointment "
+                        "ADD CONSTRAINT appointment_scheduled_range_synced "
+                        f"CHECK (scheduled_range = {SCHEDULED_RANGE_SQL} "
+                        "AND scheduled_range IS NOT NULL) NOT VALID"
+                    ),
+                    reverse_sql=(
+                        "ALTER TABLE care_appointment "
+                        "DROP CONSTRAINT appointment_scheduled_range_synced"
+                    ),
+                ),
+                migrations.RunSQL(
+                    sql=(
+                        f"UPDATE care_appointment SET scheduled_range = {SCHEDULED_RANGE_SQL} "
+                        f"WHERE scheduled_range IS DISTINCT FROM {SCHEDULED_RANGE_SQL}"
+                    ),
+                    reverse_sql=migrations.RunSQL.noop,
+                ),
+                migrations.RunSQL(
+                    sql=(
+                        "ALTER TABLE care_appointment "
+                        "VALIDATE CONSTRAINT appointment_scheduled_range_synced"
+                    ),
+                    reverse_sql=migrations.RunSQL.noop,
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='appointment',
+                    constraint=models.CheckConstraint(condition=models.Q(('scheduled_range', models.Func(models.F('scheduled_start_at'), django.db.models.expressions.CombinedExpression(models.F('scheduled_start_at'), '+', django.db.models.expressions.CombinedExpression(models.F('duration_minutes'), '*', models.Value(datetime.timedelta(seconds=60)))), models.Value('[)'), function='tstzrange', output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField())), ('scheduled_range__isnull', False)), name='appointment_scheduled_range_synced'),
+                ),
+            ],
+        ),
+    ]
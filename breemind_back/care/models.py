@@ -1,14 +1,43 @@
 from datetime import timedelta
 
 from django.conf import settings
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.contrib.postgres.fields import RangeOperators
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import OpClass
+from django.contrib.postgres.search import SearchVector
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
 from django.db.models import F
+from django.db.models import Func
 from django.db.models import Q
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 from breemind_back.users.models import BaseModel
 
+APPOINTMENT_OVERLAP_CONSTRAINT = "appointment_no_overlap_per_doctor"
+# [scheduled_start_at, scheduled_end_at) as Postgres computes it. A check
+# constraint keeps Appointment.scheduled_range equal to it, so writes that
+# skip save() (bulk_create, QuerySet.update) fail instead of leaving it stale.
+APPOINTMENT_SCHEDULED_RANGE = Func(
+    F("scheduled_start_at"),
+    F("scheduled_start_at") + F("duration_minutes") * Value(timedelta(minutes=1)),
+    Value("[)"),
+    function="tstzrange",
+    output_field=DateTimeRangeField(),
+)
+# Shared by the trigram index and the patient search selector; both must
+# compile to the same SQL for Postgres to use the index.
+PATIENT_SEARCH_NAME = Concat("first_name", Value(" "), "last_name")
+# Text search configuration of Note.search_vector; queries must use the same.
+NOTE_SEARCH_CONFIG = "english"
+
 
 class Patient(BaseModel):
     first_name = models.CharField(max_length=150)
@@ -18,6 +47,22 @@ class Patient(BaseModel):
     date_of_birth = models.DateField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(PATIENT_SEARCH_NAME, name="gin_trgm_ops"),
+                name="patient_name_trgm",
+            ),
+            models.Index(
+                OpClass("whatsapp_number", name="varchar_pattern_ops"),
+                name="patient_whatsapp_prefix",
+            ),
+            models.Index(
+                OpClass(Lower("email"), name="text_pattern_ops"),
+                name="patient_email_prefix",
+            ),
+        ]
+
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}".strip()
@@ -26,7 +71,32 @@ class Patient(BaseModel):
         return self.full_name or f"Patient {self.pk}"
 
 
-class Appointment(BaseModel):
+class DoctorScheduleModel(BaseModel):
+    """Part of a doctor's schedule, remembering which doctor it was saved for."""
+
+    # Doctor as last read from or written to the database.
+    _doctor_id_in_db = None
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "doctor_id" in field_names:
+            instance._doctor_id_in_db = instance.doctor_id  # noqa: SLF001
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.track_db_state()
+
+    def track_db_state(self):
+        """Remember the doctor as now stored in the database."""
+        self._doctor_id_in_db = self.doctor_id
+
+
+class Appointment(DoctorScheduleModel):
     class Status(models.TextChoices):
         SCHEDULED = "SCHEDULED", "Scheduled"
         COMPLETED = "COMPLETED", "Completed"
@@ -52,6 +122,13 @@ class Appointment(BaseModel):
         default=Status.SCHEDULED,
     )
     notes_summary = models.CharField(max_length=255, blank=True)
+    # Stored copy of [scheduled_start_at, scheduled_end_at), kept in sync on save
+    # and checked by the database. Backs the GiST exclusion constraint that
+    # prevents double booking.
+    scheduled_range = DateTimeRangeField(blank=True, null=True, editable=False)
+
+    # Statuses that occupy the doctor's calendar.
+    ACTIVE_STATUSES = (Status.SCHEDULED,)
 
     class Meta:
         constraints = [
@@ -59,16 +136,80 @@ class Appointment(BaseModel):
                 name="appointment_duration_gt_zero",
                 condition=Q(duration_minutes__gt=0),
             ),
+            models.CheckConstraint(
+                name="appointment_scheduled_range_synced",
+                condition=Q(
+                    scheduled_range__isnull=False,
+                    scheduled_range=APPOINTMENT_SCHEDULED_RANGE,
+                ),
+            ),
+            ExclusionConstraint(
+                name=APPOINTMENT_OVERLAP_CONSTRAINT,
+                index_type="gist",
+                expressions=[
+                    ("doctor", RangeOperators.EQUAL),
+                    ("scheduled_range", RangeOperators.OVERLAPS),
+                ],
+                condition=Q(status="SCHEDULED"),
+                violation_error_message=(
+                    "Doctor already has an appointment during this time."
+                ),
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["doctor", "scheduled_start_at"],
+                name="appointment_doctor_start",
+            ),
+            models.Index(
+                fields=["doctor", "scheduled_start_at"],
+                condition=Q(status="SCHEDULED"),
+                name="appointment_scheduled_start",
+            ),
+            models.Index(
+                fields=["doctor", "created_at"],
+                name="appointment_doctor_created",
+            ),
+            models.Index(
+                fields=["patient", "created_at"],
+                name="appointment_patient_created",
+            ),
         ]
 
     @property
     def scheduled_end_at(self):
         return self.scheduled_start_at + timedelta(minutes=int(self.duration_minutes))
 
+    def sync_scheduled_range(self) -> None:
+        """Recompute the stored range from start and duration."""
+        if self.scheduled_start_at is None or self.duration_minutes is None:
+            self.scheduled_range = None
+            return
+
+        self.scheduled_range = DateTimeTZRange(
+            self.scheduled_start_at,
+            self.scheduled_end_at,
+            bounds="[)",
+        )
+
+    def clean(self):
+        super().clean()
+        self.sync_scheduled_range()
+
+    def save(self, *args, **kwargs):
+        self.sync_scheduled_range()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and (
+            {"scheduled_start_at", "duration_minutes"} & set(update_fields)
+        ):
+            kwargs["update_fields"] = {*update_fields, "scheduled_range"}
+
+        super().save(*args, **kwargs)
+
     @property
     def is_today(self) -> bool:
-        now = timezone.now()
-        return self.scheduled_start_at.date() == now.date()
+        return timezone.localdate(self.scheduled_start_at) == timezone.localdate()
 
     def __str__(self) -> str:
         return (
@@ -76,6 +217,19 @@ class Appointment(BaseModel):
         )
 
 
+def note_search_vector(*, note_type, content) -> SearchVector:
+    """Note.search_vector of note_type and content, field names or expressions."""
+    return SearchVector(
+        note_type,
+        weight="A",
+        config=NOTE_SEARCH_CONFIG,
+    ) + SearchVector(
+        content,
+        weight="B",
+        config=NOTE_SEARCH_CONFIG,
+    )
+
+
 class Note(BaseModel):
     class NoteType(models.TextChoices):
         GENERAL = "GENERAL", "General"
@@ -99,15 +253,79 @@ class Note(BaseModel):
     note_type = models.CharField(max_length=16, choices=NoteType.choices)
     content = models.TextField()
     is_locked = models.BooleanField(default=False)
+    # Weighted note type (A) and content (B), kept in sync on save.
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
+    # Lock state as last read from or written to the database.
+    _locked_in_db = False
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="note_search_vector"),
+            models.Index(
+                fields=["patient", "created_at"],
+                name="note_patient_created",
+            ),
+            models.Index(
+                fields=["author", "created_at"],
+                condition=Q(is_locked=False),
+                name="note_unlocked_author_created",
+            ),
+        ]
 
     def clean(self):
         super().clean()
         if self.appointment and self.appointment.patient_id != self.patient_id:
             raise ValidationError("Appointment patient does not match note patient.")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "is_locked" in field_names:
+            instance._locked_in_db = instance.is_locked  # noqa: SLF001
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Locked notes never change, so their vector is final.
+        update_fields = kwargs.get("update_fields")
+        if not self._locked_in_db and (
+            update_fields is None or {"content", "note_type"} & set(update_fields)
+        ):
+            self.search_vector = note_search_vector(
+                note_type=Value(self.note_type),
+                content=Value(self.content),
+            )
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_vector"}
+
+        super().save(*args, **kwargs)
+        self.track_db_state()
+
+    def track_db_state(self):
+        """Remember the lock state as now stored in the database."""
+        self._locked_in_db = self.is_locked
+        # Computed by the database; reloaded on next access.
+        self.__dict__.pop("search_vector", None)
+
     def __str__(self) -> str:
         return f"{self.get_note_type_display()} note for {self.patient.full_name}"
 
+    @classmethod
+    def bulk_update_derived(cls, fields: set[str]) -> dict:
+        """
+        Fields save() derives from `fields`, as expressions over the row.
+
+        Written by common.services.model_bulk_update, which skips save().
+        """
+        if not {"content", "note_type"} & fields:
+            return {}
+        return {
+            "search_vector": note_search_vector(
+                note_type="note_type",
+                content="content",
+            ),
+        }
+
 
 class PlanOfCare(BaseModel):
     class Status(models.TextChoices):
@@ -148,6 +366,51 @@ class PlanOfCare(BaseModel):
                 name="unique_active_plan_per_patient",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["status", "review_date"],
+                name="planofcare_status_review",
+            ),
+            models.Index(
+                fields=["patient", "created_at"],
+                name="planofcare_patient_created",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"PlanOfCare({self.patient.full_name} - {self.title})"
+
+
+class WorkingHours(DoctorScheduleModel):
+    class Weekday(models.IntegerChoices):
+        MONDAY = 0, "Monday"
+        TUESDAY = 1, "Tuesday"
+        WEDNESDAY = 2, "Wednesday"
+        THURSDAY = 3, "Thursday"
+        FRIDAY = 4, "Friday"
+        SATURDAY = 5, "Saturday"
+        SUNDAY = 6, "Sunday"
+
+    doctor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="working_hours",
+    )
+    weekday = models.PositiveSmallIntegerField(choices=Weekday.choices)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+
+    class Meta:
+        verbose_name_plural = "working hours"
+        constraints = [
+            models.CheckConstraint(
+                name="workinghours_start_before_end",
+                condition=Q(start_time__lt=F("end_time")),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"{self.doctor} {self.get_weekday_display()} "
+            f"{self.start_time:%H:%M}-{self.end_time:%H:%M}"
+        )
@@ -0,0 +1,18 @@
+from rest_framework.permissions import BasePermission
+
+
+class IsClinicalStaff(BasePermission):
+    """
+    Allow staff and clinicians only.
+
+    Registering gives anyone an active account, and clinical data must not
+    be readable by every account.
+    """
+
+    message = "Only clinicians and staff may access clinical data."
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(
+            user and user.is_authenticated and (user.is_staff or user.is_clinician),
+        )
@@ -0,0 +1,686 @@
+import heapq
+import re
+from collections.abc import Iterator
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from itertools import islice
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
+from django.db import router
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.db.models import Exists
+from django.db.models import F
+from django.db.models import Model
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from breemind_back.care.availability import Interval
+from breemind_back.care.availability import WorkingHoursTemplate
+from breemind_back.care.availability import covered_mask
+from breemind_back.care.availability import free_intervals
+from breemind_back.care.availability import mask_contains
+from breemind_back.care.availability import split_into_slots
+from breemind_back.care.availability import touched_mask
+from breemind_back.care.availability import working_windows
+from breemind_back.care.models import NOTE_SEARCH_CONFIG
+from breemind_back.care.models import PATIENT_SEARCH_NAME
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Note
+from breemind_back.care.models import Patient
+from breemind_back.care.models import PlanOfCare
+from breemind_back.care.models import WorkingHours
+from breemind_back.common.pagination import seek_filter
+from breemind_back.users.models import User
+
+PHONE_QUERY_RE = re.compile(r"^\+?[\d\s().-]{3,}$")
+
+
+def patient_search(
+    *,
+    query: str,
+    queryset: QuerySet[Patient] | None = None,
+) -> QuerySet[Patient]:
+    """
+    Search patients by name, WhatsApp number prefix or email prefix.
+
+    Phone numbers and emails are prefix matches on pattern-ops btree indexes.
+    Names are matched by trigram word similarity on the patient_name_trgm GIN
+    index, which tolerates typos and partial names, and are ranked by it.
+    """
+    if queryset is None:
+        queryset = Patient.objects.all()
+
+    query = query.strip()
+    if not query:
+        return queryset.none()
+
+    if PHONE_QUERY_RE.match(query):
+        digits = re.sub(r"[^\d+]", "", query)
+        prefixes = [digits] if digits.startswith("+") else [digits, f"+{digits}"]
+        prefix_filter = Q()
+        for prefix in prefixes:
+            prefix_filter |= Q(whatsapp_number__startswith=prefix)
+        return queryset.filter(prefix_filter).order_by("whatsapp_number")
+
+    if "@" in query:
+        return (
+            queryset.annotate(email_lower=Lower("email"))
+            .filter(email_lower__startswith=query.lower())
+            .order_by("email_lower")
+        )
+
+    # `%>` uses the GIN index, filtering by the connection's
+    # pg_trgm.word_similarity_threshold (see config.settings.base); the rank
+    # filter holds the threshold even where the connection's differs.
+    return (
+        queryset.annotate(
+            search_name=PATIENT_SEARCH_NAME,
+            rank=TrigramWordSimilarity(query, "search_name"),
+        )
+        .filter(
+            search_name__trigram_word_similar=query,
+            rank__gte=settings.CARE_PATIENT_SEARCH_SIMILARITY,
+        )
+        .order_by("-rank", "id")
+    )
+
+
+def patient_list_visible(*, user: User) -> QuerySet[Patient]:
+    """
+    Get the patients whose records user may read.
+
+    Staff see every patient; clinicians the patients they have an
+    appointment with.
+    """
+    if user.is_staff:
+        return Patient.objects.all()
+
+    return Patient.objects.filter(
+        Exists(Appointment.objects.filter(patient=OuterRef("pk"), doctor=user)),
+    )
+
+
+def _visible_to(queryset: QuerySet, user: User | None) -> QuerySet:
+    if user is None or user.is_staff:
+        return queryset
+    return queryset.filter(patient__in=patient_list_visible(user=user))
+
+
+def appointment_list(
+    *,
+    filters: dict | None = None,
+    user: User | None = None,
+) -> QuerySet[Appointment]:
+    """
+    List appointments, optionally filtered by patient, doctor or status.
+
+    With a user, only appointments of patients visible to them are listed.
+    """
+    filters = filters or {}
+
+    queryset = _visible_to(Appointment.objects.all(), user)
+    return queryset.select_related("patient", "doctor").filter(
+        **{
+            field: filters[field]
+            for field in ("patient_id", "doctor_id", "status")
+            if filters.get(field) is not None
+        },
+    )
+
+
+def note_list(
+    *,
+    filters: dict | None = None,
+    user: User | None = None,
+) -> QuerySet[Note]:
+    """
+    List notes, optionally filtered by patient, author, note type or lock state.
+
+    With a user, only notes of patients visible to them are listed.
+    """
+    filters = filters or {}
+
+    queryset = _visible_to(Note.objects.all(), user)
+    return queryset.select_related("patient", "author").filter(
+        **{
+            field: filters[field]
+            for field in ("patient_id", "author_id", "note_type", "is_locked")
+            if filters.get(field) is not None
+        },
+    )
+
+
+def note_search(
+    *,
+    query: str,
+    filters: dict | None = None,
+    user: User | None = None,
+) -> QuerySet[Note]:
+    """
+    Full-text search notes, best matches first, with highlighted snippets.
+
+    Matches web-search style queries against the GIN-indexed
+    Note.search_vector, optionally narrowed by patient, author, note type
+    and a local created_from/created_to date range. Each note is annotated
+    with `rank` and a `headline` marking matches with <mark> tags. With a
+    user, only notes of patients visible to them are searched.
+    """
+    filters = filters or {}
+
+    search_query = SearchQuery(
+        query,
+        config=NOTE_SEARCH_CONFIG,
+        search_type="websearch",
+    )
+
+    queryset = _visible_to(Note.objects.all(), user).filter(
+        search_vector=search_query,
+        **{
+            field: filters[field]
+            for field in ("patient_id", "author_id", "note_type")
+            if filters.get(field) is not None
+        },
+    )
+    if filters.get("created_from") is not None:
+        queryset = queryset.filter(
+            created_at__gte=local_day_bounds(filters["created_from"])[0],
+        )
+    if filters.get("created_to") is not None:
+        queryset = queryset.filter(
+            created_at__lt=local_day_bounds(filters["created_to"])[1],
+        )
+
+    # Postgres only computes the headline for rows that survive the LIMIT.
+    return queryset.annotate(
+        rank=SearchRank(F("search_vector"), search_query),
+        headline=SearchHeadline(
+            "content",
+            search_query,
+            config=NOTE_SEARCH_CONFIG,
+            start_sel="<mark>",
+            stop_sel="</mark>",
+            max_fragments=3,
+        ),
+    ).order_by("-rank", "-created_at", "-id")
+
+
+class TimelineEvent(NamedTuple):
+    occurred_at: datetime
+    type: str
+    id: int
+    object: Model
+
+
+# Timeline source -> rows of that source for one patient, lightest joins only.
+TIMELINE_SOURCES = {
+    "appointment": lambda patient_id: Appointment.objects.select_related(
+        "doctor",
+    ).filter(patient_id=patient_id),
+    "note": lambda patient_id: Note.objects.select_related("author").filter(
+        patient_id=patient_id,
+    ),
+    "plan_of_care": lambda patient_id: PlanOfCare.objects.select_related(
+        "created_by",
+    ).filter(patient_id=patient_id),
+}
+
+# Per-source position: (created_at, id) of the last event already returned.
+TimelinePosition = tuple[datetime, int]
+
+
+def _timeline_source_events(
+    *,
+    source: str,
+    queryset: QuerySet,
+) -> Iterator[TimelineEvent]:
+    for instance in queryset:
+        yield TimelineEvent(instance.created_at, source, instance.id, instance)
+
+
+def patient_timeline(
+    *,
+    patient_id: int,
+    limit: int,
+    positions: dict[str, TimelinePosition] | None = None,
+) -> tuple[list[TimelineEvent], dict[str, TimelinePosition] | None]:
+    """
+    Get a page of a patient's appointments, notes and plans of care, newest first.
+
+    Each source runs one query that seeks past its own position and reads at
+    most limit + 1 rows off its (patient, created_at) index. The sorted
+    streams are then merged lazily with a heap, so building a page is
+    O(limit * log(sources)) regardless of how long the patient's history is.
+
+    Returns the events and the positions to pass for the next page, or None
+    when there is no next page.
+    """
+    positions = positions or {}
+
+    streams = []
+    for source, source_queryset in TIMELINE_SOURCES.items():
+        queryset = source_queryset(patient_id).order_by("-created_at", "-id")
+        if source in positions:
+            queryset = queryset.filter(
+                seek_filter(
+                    fields=("created_at", "id"),
+                    values=positions[source],
+                    before=True,
+                ),
+            )
+        streams.append(
+            _timeline_source_events(source=source, queryset=queryset[: limit + 1]),
+        )
+
+    events = list(
+        islice(
+            heapq.merge(
+                *streams,
+                key=lambda event: (event.occurred_at, event.type, event.id),
+                reverse=True,
+            ),
+            limit + 1,
+        ),
+    )
+    if len(events) <= limit:
+        return events, None
+
+    events = events[:limit]
+    next_positions = dict(positions)
+    for event in events:
+        next_positions[event.type] = (event.occurred_at, event.id)
+
+    return events, next_positions
+
+
+def appointment_list_upcoming(
+    *,
+    doctor_id: int,
+    limit: int = 10,
+) -> QuerySet[Appointment]:
+    """
+    Get a doctor's next scheduled appointments.
+
+    Served by the SCHEDULED-only appointment_scheduled_start partial index.
+    """
+    return (
+        Appointment.objects.select_related("patient")
+        .filter(
+            doctor_id=doctor_id,
+            status=Appointment.Status.SCHEDULED,
+            scheduled_start_at__gte=timezone.now(),
+        )
+        .order_by("scheduled_start_at")[:limit]
+    )
+
+
+def plan_of_care_list_due_for_review(
+    *,
+    on_or_before: date | None = None,
+) -> QuerySet[PlanOfCare]:
+    """
+    Get active plans of care whose review date has come, oldest first.
+    """
+    if on_or_before is None:
+        on_or_before = timezone.localdate()
+
+    return (
+        PlanOfCare.objects.select_related("patient")
+        .filter(
+            status=PlanOfCare.Status.ACTIVE,
+            review_date__lte=on_or_before,
+        )
+        .order_by("review_date", "id")
+    )
+
+
+def local_day_bounds(day: date) -> tuple[datetime, datetime]:
+    """
+    Get the aware [start, end) of a calendar day in the current time zone.
+    """
+    tz = timezone.get_current_timezone()
+    start = datetime.combine(day, time.min, tzinfo=tz)
+    end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=tz)
+    return start, end
+
+
+def _agenda_cache_key(*, doctor_id: int, version: str, day: date) -> str:
+    return f"care:agenda:{doctor_id}:{version}:{day.isoformat()}"
+
+
+def appointment_list_doctor_agenda(
+    *,
+    doctor_id: int,
+    day: date | None = None,
+) -> list[Appointment]:
+    """
+    Get a doctor's appointments for a local day (today by default).
+
+    The day's boundaries are computed once in the current time zone and
+    matched with an index range scan on (doctor, scheduled_start_at). Results
+    are cached per (doctor, day) under the doctor's schedule version.
+    """
+    if day is None:
+        day = timezone.localdate()
+
+    version = _doctor_schedule_versions(doctor_ids=[doctor_id])[doctor_id]
+    cache_key = _agenda_cache_key(doctor_id=doctor_id, version=version, day=day)
+
+    appointments = cache.get(cache_key)
+    if appointments is not None:
+        return appointments
+
+    appointments = list(_agenda_queryset(doctor_id=doctor_id, day=day))
+    cache.set(
+        cache_key,
+        appointments,
+        timeout=settings.CARE_AGENDA_CACHE_TIMEOUT,
+    )
+
+    return appointments
+
+
+async def aappointment_list_doctor_agenda(
+    *,
+    doctor_id: int,
+    day: date | None = None,
+) -> list[Appointment]:
+    """
+    appointment_list_doctor_agenda for async views, sharing its cache entries.
+    """
+    if day is None:
+        day = timezone.localdate()
+
+    version = await cache.aget(
+        doctor_schedule_version_cache_key(doctor_id=doctor_id),
+        "0",
+    )
+    cache_key = _agenda_cache_key(doctor_id=doctor_id, version=version, day=day)
+
+    appointments = await cache.aget(cache_key)
+    if appointments is not None:
+        return appointments
+
+    appointments = [
+        appointment
+        async for appointment in _agenda_queryset(doctor_id=doctor_id, day=day)
+    ]
+    await cache.aset(
+        cache_key,
+        appointments,
+        timeout=settings.CARE_AGENDA_CACHE_TIMEOUT,
+    )
+
+    return appointments
+
+
+def _agenda_queryset(*, doctor_id: int, day: date) -> QuerySet[Appointment]:
+    start, end = local_day_bounds(day)
+
+    # Cached under the version read before it, so it must not lag behind the
+    # write that bumped the version: read the primary, not a replica.
+    return (
+        Appointment.objects.using(router.db_for_write(Appointment))
+        .select_related("patient")
+        .filter(
+            doctor_id=doctor_id,
+            scheduled_start_at__gte=start,
+            scheduled_start_at__lt=end,
+        )
+        .order_by("scheduled_start_at")
+    )
+
+
+def appointment_list_booked_intervals(
+    *,
+    doctor: User,
+    start: datetime,
+    end: datetime,
+) -> list[Interval]:
+    """
+    Get a doctor's booked [start, end) intervals overlapping [start, end).
+
+    Served by the (doctor, scheduled_range) GiST index behind the
+    double-booking exclusion constraint.
+    """
+    ranges = (
+        Appointment.objects.filter(
+            doctor=doctor,
+            status__in=Appointment.ACTIVE_STATUSES,
+            scheduled_range__overlap=DateTimeTZRange(start, end, bounds="[)"),
+        )
+        .order_by("scheduled_start_at")
+        .values_list("scheduled_range", flat=True)
+    )
+
+    return [(booked.lower, booked.upper) for booked in ranges]
+
+
+def working_hours_list_templates(*, doctor: User) -> list[WorkingHoursTemplate]:
+    """
+    Get a doctor's weekly working-hour templates.
+
+    Falls back to settings.CARE_DEFAULT_WORKING_HOURS when none are configured.
+    """
+    templates = list(
+        WorkingHours.objects.filter(doctor=doctor).values_list(
+            "weekday",
+            "start_time",
+            "end_time",
+        ),
+    )
+    if templates:
+        return templates
+
+    return _default_working_hours_templates()
+
+
+def _default_working_hours_templates() -> list[WorkingHoursTemplate]:
+    return [
+        (weekday, time.fromisoformat(start_time), time.fromisoformat(end_time))
+        for weekday, start_time, end_time in settings.CARE_DEFAULT_WORKING_HOURS
+    ]
+
+
+def doctor_list_free_slots(
+    *,
+    doctor: User,
+    start_date: date,
+    end_date: date,
+    slot_minutes: int = 30,
+    limit: int | None = None,
+) -> list[Interval]:
+    """
+    Get a doctor's open slots between start_date and end_date (inclusive).
+
+    Dates are interpreted in the current time zone and slots in the past are
+    never offered.
+    """
+    tz = timezone.get_current_timezone()
+    windows = working_windows(
+        templates=working_hours_list_templates(doctor=doctor),
+        start_date=start_date,
+        end_date=end_date,
+        tz=tz,
+    )
+    if not windows:
+        return []
+
+    # Keep everything in local time so slots align to the local grid.
+    busy = [
+        (booked_start.astimezone(tz), booked_end.astimezone(tz))
+        for booked_start, booked_end in appointment_list_booked_intervals(
+            doctor=doctor,
+            start=windows[0][0],
+            end=windows[-1][1],
+        )
+    ]
+
+    slots = []
+    for slot in split_into_slots(
+        intervals=free_intervals(windows=windows, busy=busy),
+        slot_minutes=slot_minutes,
+        not_before=timezone.now().astimezone(tz),
+    ):
+        slots.append(slot)
+        if limit is not None and len(slots) >= limit:
+            break
+
+    return slots
+
+
+def doctor_schedule_version_cache_key(*, doctor_id: int) -> str:
+    """
+    Key of the version embedded in every cached view of a doctor's schedule.
+    """
+    return f"care:schedule:version:{doctor_id}"
+
+
+def _doctor_schedule_versions(*, doctor_ids: list[int]) -> dict[int, str]:
+    version_keys = {
+        doctor_id: doctor_schedule_version_cache_key(doctor_id=doctor_id)
+        for doctor_id in doctor_ids
+    }
+    versions = cache.get_many(list(version_keys.values()))
+
+    return {
+        doctor_id: versions.get(version_key, "0")
+        for doctor_id, version_key in version_keys.items()
+    }
+
+
+def _availability_mask_cache_key(*, doctor_id: int, version: str, day: date) -> str:
+    return f"care:availability:{doctor_id}:{version}:{day.isoformat()}"
+
+
+def _doctor_compute_day_free_masks(
+    *,
+    doctor_ids: list[int],
+    day: date,
+) -> dict[int, int]:
+    """
+    Build free-slot bitsets for several doctors with two queries in total.
+
+    Both read the primary, as the bitsets are cached like the agenda.
+    """
+    tz = timezone.get_current_timezone()
+    day_start, day_end = local_day_bounds(day)
+    using = router.db_for_write(Appointment)
+
+    templates: dict[int, list[WorkingHoursTemplate]] = {}
+    for doctor_id, *template in (
+        WorkingHours.objects.using(using)
+        .filter(doctor_id__in=doctor_ids)
+        .values_list("doctor_id", "weekday", "start_time", "end_time")
+    ):
+        templates.setdefault(doctor_id, []).append(tuple(template))
+    default_templates = _default_working_hours_templates()
+
+    busy: dict[int, list[Interval]] = {}
+    for doctor_id, booked in (
+        Appointment.objects.using(using)
+        .filter(
+            doctor_id__in=doctor_ids,
+            status__in=Appointment.ACTIVE_STATUSES,
+            scheduled_range__overlap=DateTimeTZRange(day_start, day_end, bounds="[)"),
+        )
+        .values_list("doctor_id", "scheduled_range")
+    ):
+        busy.setdefault(doctor_id, []).append((booked.lower, booked.upper))
+
+    masks = {}
+    for doctor_id in doctor_ids:
+        windows = working_windows(
+            templates=templates.get(doctor_id, default_templates),
+            start_date=day,
+            end_date=day,
+            tz=tz,
+        )
+        masks[doctor_id] = covered_mask(
+            intervals=windows,
+            day_start=day_start,
+        ) & ~touched_mask(intervals=busy.get(doctor_id, []), day_start=day_start)
+
+    return masks
+
+
+def doctor_list_day_free_masks(
+    *,
+    doctor_ids: list[int],
+    day: date,
+) -> dict[int, int]:
+    """
+    Get each doctor's free-slot bitset for a local day.
+
+    Bitsets are cached per (doctor, day) under a per-doctor version that
+    care.services.doctor_schedule_cache_invalidate bumps on every appointment
+    or working-hours change, so all of a doctor's days are invalidated at once.
+    """
+    versions = _doctor_schedule_versions(doctor_ids=doctor_ids)
+    mask_keys = {
+        doctor_id: _availability_mask_cache_key(
+            doctor_id=doctor_id,
+            version=version,
+            day=day,
+        )
+        for doctor_id, version in versions.items()
+    }
+    cached = cache.get_many(list(mask_keys.values()))
+
+    masks = {
+        doctor_id: cached[key] for doctor_id, key in mask_keys.items() if key in cached
+    }
+    missing = [doctor_id for doctor_id in doctor_ids if doctor_id not in masks]
+    if missing:
+        computed = _doctor_compute_day_free_masks(doctor_ids=missing, day=day)
+        cache.set_many(
+            {mask_keys[doctor_id]: mask for doctor_id, mask in computed.items()},
+            timeout=settings.CARE_AVAILABILITY_CACHE_TIMEOUT,
+        )
+        masks.update(computed)
+
+    return masks
+
+
+def doctor_list_available(
+    *,
+    start: datetime,
+    end: datetime,
+    doctor_ids: list[int] | None = None,
+) -> list[User]:
+    """
+    Get the doctors free for the whole of [start, end) within one local day.
+
+    Without doctor_ids, every active clinician and every other user with
+    working hours configured is checked; those without working hours on
+    settings.CARE_DEFAULT_WORKING_HOURS.
+    """
+    if doctor_ids is None:
+        doctor_ids = list(
+            User.objects.filter(
+                Q(is_clinician=True)
+                | Exists(WorkingHours.objects.filter(doctor=OuterRef("pk"))),
+                is_active=True,
+            ).values_list("id", flat=True),
+        )
+
+    day = timezone.localdate(start)
+    day_start, _ = local_day_bounds(day)
+    required = touched_mask(intervals=[(start, end)], day_start=day_start)
+
+    masks = doctor_list_day_free_masks(doctor_ids=doctor_ids, day=day)
+    available_ids = [
+        doctor_id for doctor_id, mask in masks.items() if mask_contains(mask, required)
+    ]
+
+    return list(User.objects.filter(id__in=available_ids).order_by("id"))
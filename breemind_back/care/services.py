@@ -0,0 +1,91 @@
+from datetime import datetime
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.db import transaction
+
+from breemind_back.care.models import APPOINTMENT_OVERLAP_CONSTRAINT
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Patient
+from breemind_back.care.selectors import doctor_schedule_version_cache_key
+from breemind_back.common.exceptions import ApplicationError
+from breemind_back.users.models import User
+
+
+def _appointment_save(*, appointment: Appointment, **save_kwargs) -> Appointment:
+    """
+    Save an appointment, turning double-booking violations into ApplicationError.
+
+    The overlap check is left to the exclusion constraint, so it costs a single
+    GiST index probe and is safe against concurrent bookings.
+    """
+    try:
+        with transaction.atomic():
+            appointment.save(**save_kwargs)
+    except IntegrityError as exc:
+        if APPOINTMENT_OVERLAP_CONSTRAINT not in str(exc):
+            raise
+        raise ApplicationError(
+            message="Doctor already has an appointment during this time",
+            extra={"field": "scheduled_start_at"},
+        ) from exc
+
+    return appointment
+
+
+@transaction.atomic
+def appointment_create(
+    *,
+    patient: Patient,
+    doctor: User,
+    scheduled_start_at: datetime,
+    duration_minutes: int = 60,
+    notes_summary: str = "",
+) -> Appointment:
+    """
+    Book a new appointment.
+    """
+    appointment = Appointment(
+        patient=patient,
+        doctor=doctor,
+        scheduled_start_at=scheduled_start_at,
+        duration_minutes=duration_minutes,
+        notes_summary=notes_summary,
+    )
+    appointment.full_clean(validate_constraints=False)
+
+    return _appointment_save(appointment=appointment)
+
+
+@transaction.atomic
+def appointment_reschedule(
+    *,
+    appointment: Appointment,
+    scheduled_start_at: datetime,
+    duration_minutes: int | None = None,
+) -> Appointment:
+    """
+    Move an appointment to a new time slot.
+    """
+    appointment.scheduled_start_at = scheduled_start_at
+    if duration_minutes is not None:
+        appointment.duration_minutes = duration_minutes
+
+    appointment.full_clean(validate_constraints=False)
+
+    return _appointment_save(
+        appointment=appointment,
+        update_fields=["scheduled_start_at", "duration_minutes"],
+    )
+
+
+def doctor_schedule_cache_invalidate(*, doctor_id: int) -> None:
+    """
+    Drop every cached view of a doctor's schedule by bumping its version.
+    """
+    cache.set(
+        doctor_schedule_version_cache_key(doctor_id=doctor_id),
+        uuid4().hex,
+        timeout=None,
+    )
@@ -0,0 +1,41 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import WorkingHours
+from breemind_back.care.services import doctor_schedule_cache_invalidate
+from breemind_back.common.services import model_bulk_updated
+
+
+def _doctor_schedules_invalidate(*, instances) -> None:
+    # A row moved to another doctor invalidates the previous doctor's too.
+    doctor_ids = set()
+    for instance in instances:
+        doctor_ids |= {instance.doctor_id, instance._doctor_id_in_db}  # noqa: SLF001
+    for doctor_id in doctor_ids - {None}:
+        transaction.on_commit(
+            partial(doctor_schedule_cache_invalidate, doctor_id=doctor_id),
+        )
+
+
+@receiver([post_save, post_delete], sender=Appointment)
+@receiver([post_save, post_delete], sender=WorkingHours)
+def doctor_schedule_changed(sender, instance, **kwargs):
+    """
+    Invalidate the doctor's cached availability once the write is committed.
+
+    Queryset .update()/.bulk_update() bypass signals; callers using them must
+    call doctor_schedule_cache_invalidate themselves.
+    """
+    _doctor_schedules_invalidate(instances=[instance])
+
+
+@receiver(model_bulk_updated, sender=Appointment)
+@receiver(model_bulk_updated, sender=WorkingHours)
+def doctor_schedules_bulk_updated(sender, instances, **kwargs):
+    """doctor_schedule_changed, for rows written by model_bulk_update."""
+    _doctor_schedules_invalidate(instances=instances)
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from factory import Faker
+from factory import LazyFunction
+from factory import Sequence
+from factory import SubFactory
+from factory.django import DjangoModelFactory
+
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Note
+from breemind_back.care.models import Patient
+from breemind_back.care.models import PlanOfCare
+from breemind_back.users.tests.factories import UserFactory
+
+
+class PatientFactory(DjangoModelFactory[Patient]):
+    first_name = Faker("first_name")
+    last_name = Faker("last_name")
+    whatsapp_number = Sequence(lambda n: f"+9190000{n:05d}")
+    email = Faker("email")
+
+    class Meta:
+        model = Patient
+
+
+class AppointmentFactory(DjangoModelFactory[Appointment]):
+    patient = SubFactory(PatientFactory)
+    doctor = SubFactory(UserFactory)
+    scheduled_start_at = Sequence(
+        lambda n: timezone.now() + timedelta(days=1, hours=n),
+    )
+    duration_minutes = 30
+
+    class Meta:
+        model = Appointment
+
+
+class NoteFactory(DjangoModelFactory[Note]):
+    patient = SubFactory(PatientFactory)
+    author = SubFactory(UserFactory)
+    note_type = Note.NoteType.GENERAL
+    content = Faker("paragraph")
+
+    class Meta:
+        model = Note
+
+
+class PlanOfCareFactory(DjangoModelFactory[PlanOfCare]):
+    patient = SubFactory(PatientFactory)
+    created_by = SubFactory(UserFactory)
+    title = Faker("sentence", nb_words=4)
+    start_date = LazyFunction(lambda: timezone.localdate())
+
+    class Meta:
+        model = PlanOfCare
@@ -0,0 +1,73 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from breemind_back.care.models import Patient
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.care.tests.factories import NoteFactory
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.care.tests.factories import PlanOfCareFactory
+from breemind_back.common.pagination import EstimatedCountPaginator
+
+pytestmark = pytest.mark.django_db
+
+
+def _changelist_queries(client, url) -> int:
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    return len(captured)
+
+
+@pytest.mark.parametrize(
+    ("model_name", "factory"),
+    [
+        ("patient", PatientFactory),
+        ("appointment", AppointmentFactory),
+        ("note", NoteFactory),
+        ("planofcare", PlanOfCareFactory),
+    ],
+)
+def test_changelist_query_count_does_not_grow_with_rows(
+    admin_client,
+    model_name,
+    factory,
+):
+    url = reverse(f"admin:care_{model_name}_changelist")
+    factory.create_batch(2)
+    queries_for_few_rows = _changelist_queries(admin_client, url)
+
+    factory.create_batch(20)
+
+    assert _changelist_queries(admin_client, url) == queries_for_few_rows
+
+
+def test_change_form_does_not_render_every_patient(admin_client):
+    appointment = AppointmentFactory()
+    other = PatientFactory(first_name="Unrelated")
+
+    response = admin_client.get(
+        reverse("admin:care_appointment_change", args=[appointment.pk]),
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert other.full_name not in response.content.decode()
+
+
+def test_estimated_count_paginator_uses_estimate_for_large_tables(settings):
+    PatientFactory.create_batch(3)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE care_patient")
+
+    settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD = 0
+    paginator = EstimatedCountPaginator(Patient.objects.order_by("pk"), 10)
+    with CaptureQueriesContext(connection) as captured:
+        assert paginator.count == 3  # noqa: PLR2004
+    assert "COUNT(" not in captured[0]["sql"].upper()
+
+    settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD = 10_000
+    paginator = EstimatedCountPaginator(Patient.objects.order_by("pk"), 10)
+    assert paginator.count == 3  # noqa: PLR2004
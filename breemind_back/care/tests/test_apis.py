@@ -0,0 +1,176 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.care.tests.factories import NoteFactory
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.care.tests.factories import PlanOfCareFactory
+from breemind_back.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def staff(db):
+    return UserFactory(is_staff=True)
+
+
+def test_appointment_list_filters_and_paginates(staff, client):
+    client.force_login(staff)
+    appointments = AppointmentFactory.create_batch(3, doctor=staff)
+    AppointmentFactory()
+
+    response = client.get(
+        reverse("api:care-appointment-list"),
+        {"doctor_id": staff.id, "limit": 2},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [row["id"] for row in data["results"]] == [
+        appointment.id for appointment in reversed(appointments[1:])
+    ]
+
+    response = client.get(data["next"])
+    assert [row["id"] for row in response.json()["results"]] == [appointments[0].id]
+
+
+def test_note_list(staff, client):
+    client.force_login(staff)
+    note = NoteFactory(author=staff)
+
+    response = client.get(reverse("api:care-note-list"), {"author_id": staff.id})
+
+    assert response.status_code == HTTPStatus.OK
+    assert [row["id"] for row in response.json()["results"]] == [note.id]
+
+
+def test_patient_timeline(staff, client):
+    client.force_login(staff)
+    patient = PatientFactory()
+    appointment = AppointmentFactory(patient=patient)
+    note = NoteFactory(patient=patient, appointment=appointment)
+    plan = PlanOfCareFactory(patient=patient)
+    url = reverse("api:care-patient-timeline", kwargs={"patient_id": patient.id})
+
+    response = client.get(url, {"limit": 2})
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [(row["type"], row["id"]) for row in data["results"]] == [
+        ("plan_of_care", plan.id),
+        ("note", note.id),
+    ]
+    assert data["results"][1]["note"]["appointment_id"] == appointment.id
+    assert "appointment" not in data["results"][1]
+
+    data = client.get(data["next"]).json()
+    assert [(row["type"], row["id"]) for row in data["results"]] == [
+        ("appointment", appointment.id),
+    ]
+    assert data["next"] is None
+
+
+def test_patient_timeline_rejects_bad_cursor(staff, client):
+    client.force_login(staff)
+    patient = PatientFactory()
+
+    response = client.get(
+        reverse("api:care-patient-timeline", kwargs={"patient_id": patient.id}),
+        {"cursor": "not-a-cursor"},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_note_search(staff, client):
+    client.force_login(staff)
+    note = NoteFactory(author=staff, content="Patient reports a migraine.")
+    NoteFactory(content="Patient reports a migraine.")
+
+    response = client.get(
+        reverse("api:care-note-search"),
+        {"q": "migraine", "author_id": staff.id},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == [
+        {
+            "id": note.id,
+            "patient_id": note.patient_id,
+            "appointment_id": None,
+            "author_id": staff.id,
+            "note_type": note.note_type,
+            "is_locked": False,
+            "created_at": response.json()[0]["created_at"],
+            "headline": "Patient reports a <mark>migraine</mark>",
+        },
+    ]
+
+
+@pytest.fixture
+def clinician(db):
+    return UserFactory(is_clinician=True)
+
+
+@pytest.mark.parametrize(
+    ("url_name", "kwargs"),
+    [
+        ("api:care-patient-search", {}),
+        ("api:care-patient-timeline", {"patient_id": 1}),
+        ("api:care-appointment-list", {}),
+        ("api:care-note-list", {}),
+        ("api:care-note-search", {}),
+        ("api:care-agenda", {}),
+        ("api:care-doctor-availability", {"doctor_id": 1}),
+        ("api:care-clinic-availability", {}),
+    ],
+)
+def test_care_apis_are_forbidden_to_registered_users(user, client, url_name, kwargs):
+    client.force_login(user)
+
+    response = client.get(reverse(url_name, kwargs=kwargs))
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+def test_clinician_only_reads_own_patients(clinician, client):
+    client.force_login(clinician)
+    appointment = AppointmentFactory(doctor=clinician)
+    own_note = NoteFactory(patient=appointment.patient, content="Persistent cough")
+    other_note = NoteFactory(content="Persistent cough")
+
+    response = client.get(reverse("api:care-note-list"))
+    assert [row["id"] for row in response.json()["results"]] == [own_note.id]
+
+    response = client.get(reverse("api:care-note-search"), {"q": "cough"})
+    assert [row["id"] for row in response.json()] == [own_note.id]
+
+    response = client.get(reverse("api:care-appointment-list"))
+    assert [row["id"] for row in response.json()["results"]] == [appointment.id]
+
+    response = client.get(
+        reverse("api:care-patient-search"),
+        {"q": other_note.patient.whatsapp_number},
+    )
+    assert response.json() == []
+
+    response = client.get(
+        reverse(
+            "api:care-patient-timeline",
+            kwargs={"patient_id": other_note.patient_id},
+        ),
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_clinician_cannot_read_other_doctors_agenda(clinician, staff, client):
+    client.force_login(clinician)
+
+    response = client.get(reverse("api:care-agenda"), {"doctor_id": staff.id})
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+    response = client.get(reverse("api:care-agenda"))
+    assert response.status_code == HTTPStatus.OK
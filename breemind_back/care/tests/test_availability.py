@@ -0,0 +1,175 @@
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from breemind_back.care.availability import covered_mask
+from breemind_back.care.availability import free_intervals
+from breemind_back.care.availability import slot_range_mask
+from breemind_back.care.availability import split_into_slots
+from breemind_back.care.availability import touched_mask
+from breemind_back.care.availability import working_windows
+from breemind_back.care.models import WorkingHours
+from breemind_back.care.selectors import doctor_list_available
+from breemind_back.care.selectors import doctor_list_day_free_masks
+from breemind_back.care.selectors import doctor_list_free_slots
+from breemind_back.care.services import appointment_reschedule
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.users.tests.factories import UserFactory
+
+
+def _at(hour, minute=0):
+    return datetime(2030, 1, 7, hour, minute, tzinfo=UTC)
+
+
+def test_working_windows_expands_templates():
+    windows = working_windows(
+        templates=[(0, time(9), time(12)), (0, time(14), time(17))],
+        start_date=date(2030, 1, 7),  # Monday
+        end_date=date(2030, 1, 14),
+        tz=UTC,
+    )
+
+    assert windows[:2] == [(_at(9), _at(12)), (_at(14), _at(17))]
+    assert len(windows) == 4  # noqa: PLR2004
+
+
+def test_free_intervals_sweeps_busy_across_windows():
+    windows = [(_at(9), _at(12)), (_at(14), _at(17))]
+    busy = [(_at(8), _at(9, 30)), (_at(10), _at(10, 15)), (_at(11, 30), _at(15))]
+
+    assert list(free_intervals(windows=windows, busy=busy)) == [
+        (_at(9, 30), _at(10)),
+        (_at(10, 15), _at(11, 30)),
+        (_at(15), _at(17)),
+    ]
+
+
+def test_split_into_slots_aligns_to_grid():
+    slots = list(
+        split_into_slots(intervals=[(_at(10, 10), _at(11, 30))], slot_minutes=30),
+    )
+
+    assert slots == [(_at(10, 30), _at(11)), (_at(11), _at(11, 30))]
+
+
+@pytest.mark.django_db
+class TestDoctorListFreeSlots:
+    def test_skips_booked_time(self, user):
+        day = timezone.localdate() + timedelta(days=1)
+        tz = timezone.get_current_timezone()
+        WorkingHours.objects.create(
+            doctor=user,
+            weekday=day.weekday(),
+            start_time=time(9),
+            end_time=time(11),
+        )
+        AppointmentFactory(
+            doctor=user,
+            scheduled_start_at=datetime.combine(day, time(9, 30), tzinfo=tz),
+            duration_minutes=60,
+        )
+
+        slots = doctor_list_free_slots(
+            doctor=user,
+            start_date=day,
+            end_date=day,
+            slot_minutes=30,
+        )
+
+        assert [start.time() for start, _ in slots] == [time(9), time(10, 30)]
+
+    def test_api(self, user, client):
+        user.is_clinician = True
+        user.save()
+        client.force_login(user)
+
+        response = client.get(
+            reverse("api:care-doctor-availability", kwargs={"doctor_id": user.id}),
+            {"limit": 3},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()) == 3  # noqa: PLR2004
+
+
+def test_masks_cover_and_touch():
+    day_start = _at(0)
+    assert covered_mask(
+        intervals=[(_at(9, 5), _at(10))],
+        day_start=day_start,
+    ) == slot_range_mask(37, 40)
+    assert touched_mask(
+        intervals=[(_at(9, 5), _at(10))],
+        day_start=day_start,
+    ) == slot_range_mask(36, 40)
+
+
+@pytest.mark.django_db
+class TestDoctorListAvailable:
+    def _day_at(self, day, hour):
+        return datetime.combine(
+            day,
+            time(hour),
+            tzinfo=timezone.get_current_timezone(),
+        )
+
+    def test_filters_busy_doctors(
+        self,
+        django_capture_on_commit_callbacks,
+        django_assert_num_queries,
+    ):
+        day = timezone.localdate() + timedelta(days=1)
+        busy = AppointmentFactory(scheduled_start_at=self._day_at(day, 10))
+        free = AppointmentFactory(scheduled_start_at=self._day_at(day, 14))
+        doctor_ids = [busy.doctor_id, free.doctor_id]
+        for doctor_id in doctor_ids:
+            WorkingHours.objects.create(
+                doctor_id=doctor_id,
+                weekday=day.weekday(),
+                start_time=time(9),
+                end_time=time(17),
+            )
+
+        available = doctor_list_available(
+            start=self._day_at(day, 10),
+            end=self._day_at(day, 11),
+        )
+        assert available == [free.doctor]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            appointment_reschedule(
+                appointment=busy,
+                scheduled_start_at=self._day_at(day, 15),
+            )
+
+        with django_assert_num_queries(0):
+            masks = doctor_list_day_free_masks(doctor_ids=[free.doctor_id], day=day)
+        assert masks
+
+        available = doctor_list_available(
+            start=self._day_at(day, 10),
+            end=self._day_at(day, 11),
+            doctor_ids=doctor_ids,
+        )
+        assert {doctor.id for doctor in available} == set(doctor_ids)
+
+    def test_doctors_without_working_hours_use_default_hours(self):
+        today = timezone.localdate()
+        # A Monday, within CARE_DEFAULT_WORKING_HOURS.
+        day = today + timedelta(days=7 - today.weekday())
+        doctor = UserFactory(is_clinician=True)
+        UserFactory()
+
+        available = doctor_list_available(
+            start=self._day_at(day, 10),
+            end=self._day_at(day, 11),
+        )
+
+        assert available == [doctor]
@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from breemind_back.care.models import Appointment
+from breemind_back.care.selectors import appointment_list
+from breemind_back.care.selectors import appointment_list_booked_intervals
+from breemind_back.care.selectors import appointment_list_doctor_agenda
+from breemind_back.care.selectors import appointment_list_upcoming
+from breemind_back.care.selectors import note_list
+from breemind_back.care.selectors import note_search
+from breemind_back.care.selectors import patient_timeline
+from breemind_back.care.selectors import plan_of_care_list_due_for_review
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.care.tests.factories import NoteFactory
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.care.tests.factories import PlanOfCareFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _explain_selector(selector) -> str:
+    """EXPLAIN the last query a selector runs."""
+    with CaptureQueriesContext(connection) as captured:
+        selector()
+
+    with connection.cursor() as cursor:
+        # Test tables are tiny; without this the planner always seq-scans.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN {captured.captured_queries[-1]['sql']}")
+        return "\n".join(row[0] for row in cursor.fetchall())
+
+
+@pytest.fixture
+def care_data(user):
+    patient = PatientFactory()
+    for status in Appointment.Status.values:
+        AppointmentFactory(doctor=user, patient=patient, status=status)
+    NoteFactory.create_batch(3, patient=patient, author=user)
+    PlanOfCareFactory(
+        patient=patient,
+        review_date=timezone.localdate() - timedelta(days=1),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "ANALYZE care_appointment, care_note, care_planofcare, care_patient",
+        )
+    return patient
+
+
+@pytest.mark.parametrize(
+    ("selector", "index_names"),
+    [
+        (
+            lambda user, patient: appointment_list_doctor_agenda(doctor_id=user.id),
+            "appointment_doctor_start",
+        ),
+        (
+            lambda user, patient: list(appointment_list_upcoming(doctor_id=user.id)),
+            "appointment_scheduled_start",
+        ),
+        (
+            lambda user, patient: appointment_list_booked_intervals(
+                doctor=user,
+                start=timezone.now(),
+                end=timezone.now() + timedelta(days=7),
+            ),
+            # Both only hold SCHEDULED rows; the planner may pick either.
+            ("appointment_no_overlap_per_doctor", "appointment_scheduled_start"),
+        ),
+        (
+            lambda user, patient: list(
+                appointment_list(filters={"doctor_id": user.id}).order_by(
+                    "-created_at",
+                    "-id",
+                )[:10],
+            ),
+            "appointment_doctor_created",
+        ),
+        (
+            lambda user, patient: list(
+                appointment_list(filters={"patient_id": patient.id}).order_by(
+                    "-created_at",
+                    "-id",
+                )[:10],
+            ),
+            "appointment_patient_created",
+        ),
+        (
+            lambda user, patient: list(
+                note_list(filters={"patient_id": patient.id}).order_by(
+                    "-created_at",
+                    "-id",
+                )[:10],
+            ),
+            "note_patient_created",
+        ),
+        (
+            lambda user, patient: list(
+                note_list(filters={"author_id": user.id, "is_locked": False}).order_by(
+                    "-created_at",
+                    "-id",
+                )[:10],
+            ),
+            "note_unlocked_author_created",
+        ),
+        (
+            lambda user, patient: list(note_search(query="note")[:10]),
+            "note_search_vector",
+        ),
+        (
+            # The plan of care stream is the last of the timeline's queries.
+            lambda user, patient: patient_timeline(patient_id=patient.id, limit=10),
+            "planofcare_patient_created",
+        ),
+        (
+            lambda user, patient: list(plan_of_care_list_due_for_review()),
+            "planofcare_status_review",
+        ),
+    ],
+)
+def test_hot_selector_uses_index(user, care_data, selector, index_names):
+    if isinstance(index_names, str):
+        index_names = (index_names,)
+
+    plan = _explain_selector(lambda: selector(user, care_data))
+
+    assert any(index_name in plan for index_name in index_names), plan
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+from django.db import connection
+
+from breemind_back.care.models import APPOINTMENT_OVERLAP_CONSTRAINT
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Note
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.care.tests.factories import NoteFactory
+from breemind_back.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _migration(name):
+    return import_module(f"breemind_back.care.migrations.{name}")
+
+
+def test_note_search_vector_backfill_fills_missing_vectors_in_batches(monkeypatch):
+    migration = _migration("0009_note_search_vector_backfill")
+    monkeypatch.setattr(migration, "BATCH_SIZE", 2)
+    notes = NoteFactory.create_batch(5, content="Persistent cough")
+    Note.objects.update(search_vector=None)
+
+    with connection.schema_editor() as schema_editor:
+        migration.backfill_search_vector(apps, schema_editor)
+
+    assert set(
+        Note.objects.filter(search_vector="cough").values_list("id", flat=True),
+    ) == {note.id for note in notes}
+
+
+def test_appointment_overlaps_are_rescheduled_before_the_constraint():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "ALTER TABLE care_appointment "
+            f"DROP CONSTRAINT {APPOINTMENT_OVERLAP_CONSTRAINT}, "
+            "DROP CONSTRAINT appointment_scheduled_range_synced",
+        )
+    doctor = UserFactory()
+    first = AppointmentFactory(doctor=doctor, duration_minutes=60)
+    start = first.scheduled_start_at
+    overlapping = AppointmentFactory(
+        doctor=doctor,
+        scheduled_start_at=start + timedelta(minutes=30),
+    )
+    # Overlaps only the appointment that loses its slot, so it keeps its own.
+    after = AppointmentFactory(
+        doctor=doctor,
+        scheduled_start_at=start + timedelta(minutes=70),
+    )
+    other_doctor = AppointmentFactory(scheduled_start_at=start)
+    Appointment.objects.filter(id=after.id).update(scheduled_range=None)
+
+    with connection.schema_editor() as schema_editor:
+        _migration("0012_appointment_no_overlap_per_doctor").resolve_overlaps(
+            apps,
+            schema_editor,
+        )
+
+    statuses = dict(Appointment.objects.values_list("id", "status"))
+    assert statuses == {
+        first.id: Appointment.Status.SCHEDULED,
+        overlapping.id: Appointment.Status.RESCHEDULED,
+        after.id: Appointment.Status.SCHEDULED,
+        other_doctor.id: Appointment.Status.SCHEDULED,
+    }
+    after.refresh_from_db()
+    assert after.scheduled_range.lower == after.scheduled_start_at
@@ -0,0 +1,239 @@
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Note
+from breemind_back.care.selectors import appointment_list_doctor_agenda
+from breemind_back.care.selectors import local_day_bounds
+from breemind_back.care.selectors import note_search
+from breemind_back.care.selectors import patient_search
+from breemind_back.care.selectors import patient_timeline
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.care.tests.factories import NoteFactory
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.care.tests.factories import PlanOfCareFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestPatientSearch:
+    def test_name_search_is_typo_tolerant_and_ranked(self):
+        john = PatientFactory(first_name="John", last_name="Smith")
+        johnny = PatientFactory(first_name="Johnny", last_name="Smithers")
+        PatientFactory(first_name="Priya", last_name="Sharma")
+
+        results = list(patient_search(query="jonh smith"))
+
+        assert results == [john, johnny]
+
+    def test_phone_prefix(self):
+        patient = PatientFactory(whatsapp_number="+919812345678")
+        PatientFactory(whatsapp_number="+919900000000")
+
+        assert list(patient_search(query="98123")) == []
+        assert list(patient_search(query="91981")) == [patient]
+        assert list(patient_search(query="+91 9812")) == [patient]
+
+    def test_email_prefix(self):
+        patient = PatientFactory(email="Asha.Rao@example.com")
+        PatientFactory(email="other@example.com")
+
+        assert list(patient_search(query="asha.rao@")) == [patient]
+
+    def test_name_search_uses_trigram_index(self):
+        PatientFactory(first_name="John", last_name="Smith")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = patient_search(query="john").explain()
+
+        assert "patient_name_trgm" in plan
+
+    def test_name_search_leaves_the_connection_threshold_alone(self, settings):
+        settings.CARE_PATIENT_SEARCH_SIMILARITY = 0.9
+        john = PatientFactory(first_name="John", last_name="Smith")
+
+        assert list(patient_search(query="jonh smith")) == []
+        assert list(patient_search(query="john smith")) == [john]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting('pg_trgm.word_similarity_threshold')",
+            )
+            assert cursor.fetchone() == ("0.3",)
+
+
+class TestNoteSearch:
+    def test_matches_stems_and_highlights(self):
+        note = NoteFactory(content="Recurring migraines, worse in the mornings.")
+        NoteFactory(content="Lower back pain.")
+
+        results = list(note_search(query="migraine morning"))
+
+        assert results == [note]
+        assert "<mark>migraines</mark>" in results[0].headline
+
+    def test_note_type_outranks_content(self):
+        in_content = NoteFactory(
+            note_type=Note.NoteType.GENERAL,
+            content="Progress is slow.",
+        )
+        in_type = NoteFactory(note_type=Note.NoteType.PROGRESS, content="Stable.")
+
+        assert list(note_search(query="progress")) == [in_type, in_content]
+
+    def test_filters(self):
+        note = NoteFactory(
+            content="Migraine",
+            created_at=datetime(2030, 1, 5, tzinfo=UTC),
+        )
+        NoteFactory(content="Migraine", created_at=datetime(2030, 2, 5, tzinfo=UTC))
+        NoteFactory(content="Migraine", created_at=datetime(2029, 12, 5, tzinfo=UTC))
+
+        results = note_search(
+            query="migraine",
+            filters={
+                "created_from": date(2030, 1, 1),
+                "created_to": date(2030, 1, 31),
+            },
+        )
+        assert list(results) == [note]
+
+        results = note_search(
+            query="migraine",
+            filters={"patient_id": note.patient_id, "author_id": note.author_id},
+        )
+        assert list(results) == [note]
+
+    def test_vector_follows_edits_until_locked(self):
+        note = NoteFactory(content="Headache")
+
+        note.content = "Migraine"
+        note.save(update_fields=["content"])
+        assert list(note_search(query="migraine")) == [note]
+
+        note.is_locked = True
+        note.save()
+        locked = Note.objects.get(pk=note.pk)
+        locked.content = "Fracture"
+        with CaptureQueriesContext(connection) as captured:
+            locked.save()
+
+        assert "to_tsvector" not in captured[-1]["sql"]
+        assert list(note_search(query="migraine")) == [note]
+        assert list(note_search(query="fracture")) == []
+
+
+class TestPatientTimeline:
+    def test_merges_sources_newest_first_across_pages(
+        self,
+        django_assert_num_queries,
+    ):
+        patient = PatientFactory()
+        base = datetime(2030, 1, 1, tzinfo=UTC)
+        expected = []
+        for hour, factory in enumerate(
+            [
+                AppointmentFactory,
+                NoteFactory,
+                NoteFactory,
+                PlanOfCareFactory,
+                AppointmentFactory,
+                NoteFactory,
+                AppointmentFactory,
+            ],
+        ):
+            instance = factory(patient=patient, created_at=base + timedelta(hours=hour))
+            expected.append(instance)
+        NoteFactory(created_at=base)  # Another patient's note.
+        expected.reverse()
+
+        seen = []
+        positions = None
+        while True:
+            with django_assert_num_queries(3):
+                events, positions = patient_timeline(
+                    patient_id=patient.id,
+                    limit=3,
+                    positions=positions,
+                )
+            seen.extend(event.object for event in events)
+            if positions is None:
+                break
+
+        assert seen == expected
+        assert len(seen) == len(set(map(id, seen)))
+
+    def test_ties_are_not_skipped_between_pages(self):
+        patient = PatientFactory()
+        created_at = datetime(2030, 1, 1, tzinfo=UTC)
+        notes = NoteFactory.create_batch(3, patient=patient, created_at=created_at)
+
+        first, positions = patient_timeline(patient_id=patient.id, limit=2)
+        second, positions = patient_timeline(
+            patient_id=patient.id,
+            limit=2,
+            positions=positions,
+        )
+
+        assert positions is None
+        assert [event.id for event in first + second] == [
+            note.id for note in reversed(notes)
+        ]
+
+
+class TestAppointmentListDoctorAgenda:
+    def test_uses_local_day_boundaries(self, user):
+        day = date(2030, 1, 8)
+        start, end = local_day_bounds(day)
+        inside = [
+            AppointmentFactory(doctor=user, scheduled_start_at=start),
+            AppointmentFactory(
+                doctor=user,
+                scheduled_start_at=end - timedelta(hours=1),
+            ),
+        ]
+        AppointmentFactory(doctor=user, scheduled_start_at=start - timedelta(hours=1))
+        AppointmentFactory(doctor=user, scheduled_start_at=end)
+
+        assert appointment_list_doctor_agenda(doctor_id=user.id, day=day) == inside
+
+    def test_is_cached_until_schedule_changes(
+        self,
+        user,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        day = date(2030, 1, 8)
+        start, _ = local_day_bounds(day)
+        AppointmentFactory(doctor=user, scheduled_start_at=start)
+        appointment_list_doctor_agenda(doctor_id=user.id, day=day)
+
+        with django_assert_num_queries(0):
+            agenda = appointment_list_doctor_agenda(doctor_id=user.id, day=day)
+        assert len(agenda) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AppointmentFactory(
+                doctor=user,
+                scheduled_start_at=start + timedelta(hours=2),
+            )
+
+        assert len(appointment_list_doctor_agenda(doctor_id=user.id, day=day)) == 2  # noqa: PLR2004
+
+
+def test_appointment_is_today_uses_local_time():
+    # 18:00 UTC is 23:30 in Asia/Kolkata; "now" is already the next local day.
+    appointment = Appointment(scheduled_start_at=datetime(2030, 1, 7, 18, tzinfo=UTC))
+
+    with patch(
+        "django.utils.timezone.now",
+        return_value=datetime(2030, 1, 7, 20, tzinfo=UTC),
+    ):
+        assert not appointment.is_today
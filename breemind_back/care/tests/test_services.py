@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.db import transaction
+from django.utils import timezone
+
+from breemind_back.care.models import Appointment
+from breemind_back.care.selectors import doctor_schedule_version_cache_key
+from breemind_back.care.services import appointment_create
+from breemind_back.care.services import appointment_reschedule
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.common.exceptions import ApplicationError
+
+pytestmark = pytest.mark.django_db
+
+
+class TestAppointmentCreate:
+    def test_stores_scheduled_range(self, user):
+        start = timezone.now() + timedelta(days=1)
+
+        appointment = appointment_create(
+            patient=PatientFactory(),
+            doctor=user,
+            scheduled_start_at=start,
+            duration_minutes=45,
+        )
+
+        appointment.refresh_from_db()
+        assert appointment.scheduled_range.lower == start
+        assert appointment.scheduled_range.upper == start + timedelta(minutes=45)
+
+    def test_rejects_overlapping_booking(self, user):
+        existing = AppointmentFactory(doctor=user, duration_minutes=60)
+
+        with pytest.raises(ApplicationError):
+            appointment_create(
+                patient=PatientFactory(),
+                doctor=user,
+                scheduled_start_at=existing.scheduled_start_at + timedelta(minutes=30),
+            )
+
+    def test_allows_back_to_back_booking(self, user):
+        existing = AppointmentFactory(doctor=user, duration_minutes=30)
+
+        appointment = appointment_create(
+            patient=PatientFactory(),
+            doctor=user,
+            scheduled_start_at=existing.scheduled_end_at,
+            duration_minutes=30,
+        )
+
+        assert appointment.pk is not None
+
+    def test_ignores_inactive_appointments(self, user):
+        existing = AppointmentFactory(
+            doctor=user,
+            status=Appointment.Status.CANCELED,
+        )
+
+        appointment = appointment_create(
+            patient=PatientFactory(),
+            doctor=user,
+            scheduled_start_at=existing.scheduled_start_at,
+        )
+
+        assert appointment.pk is not None
+
+
+def test_appointment_reschedule_rejects_overlap(user):
+    first = AppointmentFactory(doctor=user, duration_minutes=30)
+    second = AppointmentFactory(
+        doctor=user,
+        scheduled_start_at=first.scheduled_end_at,
+        duration_minutes=30,
+    )
+
+    with pytest.raises(ApplicationError):
+        appointment_reschedule(
+            appointment=second,
+            scheduled_start_at=first.scheduled_start_at,
+        )
+
+    second.refresh_from_db()
+    assert second.scheduled_range.lower == first.scheduled_end_at
+
+
+def test_appointment_scheduled_range_is_checked_by_the_database(user):
+    appointment = AppointmentFactory(doctor=user, duration_minutes=30)
+    unsaved = AppointmentFactory.build(doctor=user, patient=appointment.patient)
+
+    # Writes that skip save() cannot leave the range NULL or stale.
+    with (
+        pytest.raises(IntegrityError, match="scheduled_range_synced"),
+        transaction.atomic(),
+    ):
+        Appointment.objects.bulk_create([unsaved])
+    with (
+        pytest.raises(IntegrityError, match="scheduled_range_synced"),
+        transaction.atomic(),
+    ):
+        Appointment.objects.filter(pk=appointment.pk).update(duration_minutes=45)
+
+
+def test_reassigning_appointment_invalidates_both_doctors(
+    user,
+    django_capture_on_commit_callbacks,
+):
+    appointment = AppointmentFactory()
+    previous_doctor_id = appointment.doctor_id
+    appointment = Appointment.objects.get(id=appointment.id)
+    keys = [
+        doctor_schedule_version_cache_key(doctor_id=doctor_id)
+        for doctor_id in (previous_doctor_id, user.id)
+    ]
+    cache.set_many(dict.fromkeys(keys, "before"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        appointment.doctor = user
+        appointment.save()
+
+    assert "before" not in cache.get_many(keys).values()
@@ -1,5 +1,7 @@
 """Common app configuration."""
 
+import contextlib
+
 from django.apps import AppConfig
 
 
@@ -8,3 +10,7 @@ class CommonConfig(AppConfig):
 
     name = "breemind_back.common"
     verbose_name = "Common"
+
+    def ready(self):
+        with contextlib.suppress(ImportError):
+            import breemind_back.common.signals  # noqa: F401, PLC0415
@@ -8,6 +8,7 @@ from rest_framework.serializers import as_serializer_error
 from rest_framework.views import exception_handler
 
 from breemind_back.common.exceptions import ApplicationError
+from breemind_back.common.exceptions import ServiceUnavailableError
 
 
 def custom_exception_handler(exc, ctx):
@@ -30,6 +31,17 @@ def custom_exception_handler(exc, ctx):
     response = exception_handler(exc, ctx)
 
     if response is None:
+        if isinstance(exc, ServiceUnavailableError):
+            data = {
+                "message": exc.message,
+                "extra": exc.extra,
+            }
+            return Response(
+                data,
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+
         if isinstance(exc, ApplicationError):
             data = {
                 "message": exc.message,
@@ -17,3 +17,11 @@ class AuthenticationError(ApplicationError):
 
 class NotFoundError(ApplicationError):
     """Not found error."""
+
+
+class ServiceUnavailableError(ApplicationError):
+    """Temporarily overloaded; the client should retry after `retry_after` seconds."""
+
+    def __init__(self, message: str, retry_after: int, extra: dict | None = None):
+        self.retry_after = retry_after
+        super().__init__(message, extra)
@@ -0,0 +1,125 @@
+import statistics
+from http import HTTPStatus
+from secrets import token_hex
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from breemind_back.care.models import Patient
+from breemind_back.common.metrics import metrics_record_query
+from breemind_back.common.metrics import metrics_record_request
+from breemind_back.common.metrics import metrics_request_start
+from breemind_back.users.models import User
+
+METRICS_MIDDLEWARE = "breemind_back.common.middleware.MetricsMiddleware"
+LOCAL_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the same patient search with and without request metrics and "
+        "compare median latency, plus the cost of recording one request. "
+        "Runs in a transaction that is rolled back, on a local cache so "
+        "nothing reaches the shared metrics."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--rounds", type=int, default=5)
+
+    def handle(self, *args, **options):
+        without_metrics = [m for m in settings.MIDDLEWARE if m != METRICS_MIDDLEWARE]
+
+        with transaction.atomic():
+            prefix = token_hex(4)
+            Patient.objects.bulk_create(
+                Patient(
+                    first_name=f"Asha {index}",
+                    last_name="Benchmark",
+                    whatsapp_number=f"+{prefix}{index:04d}",
+                )
+                for index in range(50)
+            )
+            staff = User.objects.create(username=f"benchmark-{prefix}", is_staff=True)
+            url = reverse("api:care-patient-search") + "?q=Asha"
+
+            timings = {"without metrics": [], "with metrics": []}
+            for _ in range(options["rounds"]):
+                # Alternate so drift in the machine's load hits both alike.
+                for name, middleware in [
+                    ("without metrics", without_metrics),
+                    ("with metrics", settings.MIDDLEWARE),
+                ]:
+                    with override_settings(
+                        MIDDLEWARE=middleware,
+                        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+                        CACHES=LOCAL_CACHES,
+                    ):
+                        timings[name].extend(
+                            self._serve(
+                                url=url,
+                                user=staff,
+                                requests=options["requests"],
+                                count_queries=middleware is settings.MIDDLEWARE,
+                            ),
+                        )
+
+            medians = {
+                name: statistics.median(values) * 1000
+                for name, values in timings.items()
+            }
+            for name, median in medians.items():
+                self.stdout.write(f"{name:>16}: median {median:.3f} ms")
+            overhead = medians["with metrics"] / medians["without metrics"] - 1
+            self.stdout.write(f"{'overhead':>16}: {overhead:+.1%}")
+            self.stdout.write(f"{'recording':>16}: {self._record_cost() * 1e6:.1f} us")
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _record_cost(number=10_000):
+        started = perf_counter()
+        for _ in range(number):
+            stats = metrics_request_start()
+            metrics_record_request(
+                view="benchmark",
+                method="GET",
+                status=200,
+                duration=0.01,
+                stats=stats,
+                response_bytes=1000,
+            )
+        return (perf_counter() - started) / number
+
+    @staticmethod
+    def _serve(*, url, user, requests, count_queries):
+        client = Client()
+        client.force_login(user)
+        # Warm up the middleware chain and caches.
+        response = client.get(url)
+        if response.status_code != HTTPStatus.OK:
+            msg = f"{url} answered {response.status_code}"
+            raise CommandError(msg)
+
+        wrappers = connection.execute_wrappers
+        installed = metrics_record_query in wrappers
+        if installed and not count_queries:
+            wrappers.remove(metrics_record_query)
+
+        try:
+            timings = []
+            for _ in range(requests):
+                started = perf_counter()
+                client.get(url)
+                timings.append(perf_counter() - started)
+        finally:
+            if installed and not count_queries:
+                wrappers.append(metrics_record_query)
+        return timings
@@ -0,0 +1,76 @@
+from secrets import token_hex
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db import transaction
+from django.test.utils import CaptureQueriesContext
+
+from breemind_back.care.models import Patient
+from breemind_back.common.services import model_bulk_update
+from breemind_back.common.services import model_update
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the same patients by looping model_update and with one "
+        "model_bulk_update call, and compare time and queries. Runs in a "
+        "transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        prefix = token_hex(4)
+
+        with transaction.atomic():
+            patients = Patient.objects.bulk_create(
+                Patient(
+                    first_name=f"Patient {index}",
+                    last_name="Benchmark",
+                    whatsapp_number=f"+{prefix}{index:07d}",
+                )
+                for index in range(options["rows"])
+            )
+            pks = [patient.pk for patient in patients]
+
+            for name, update in [
+                ("model_update loop", self._update_each),
+                ("model_bulk_update", self._update_in_bulk),
+            ]:
+                instances = list(Patient.objects.filter(pk__in=pks))
+                # Change every other patient's name, as an import would.
+                data = {
+                    pk: {"first_name": f"{name} {pk}", "is_active": index % 2 == 0}
+                    for index, pk in enumerate(pks)
+                }
+
+                with CaptureQueriesContext(connection) as queries:
+                    started = perf_counter()
+                    update(instances=instances, data=data)
+                    elapsed = perf_counter() - started
+
+                self.stdout.write(
+                    f"{name:>18}: {len(pks)} rows in {elapsed * 1000:8.1f} ms, "
+                    f"{len(queries)} queries",
+                )
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _update_each(*, instances, data):
+        for instance in instances:
+            model_update(
+                instance=instance,
+                fields=["first_name", "is_active"],
+                data=data[instance.pk],
+            )
+
+    @staticmethod
+    def _update_in_bulk(*, instances, data):
+        model_bulk_update(
+            instances=instances,
+            fields=["first_name", "is_active"],
+            data=data,
+        )
@@ -0,0 +1,108 @@
+import timeit
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from functools import partial
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from breemind_back.care.apis import AppointmentListApi
+from breemind_back.care.apis import NoteListApi
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Note
+from breemind_back.care.models import Patient
+from breemind_back.common.parsers import FastJSONParser
+from breemind_back.common.renderers import FastJSONRenderer
+
+
+def _payloads(rows):
+    now = timezone.now()
+    patient = Patient(id=1, first_name="Benchmark", last_name="Patient")
+    appointments = [
+        Appointment(
+            id=index,
+            patient=patient,
+            doctor_id=1,
+            scheduled_start_at=now + timedelta(hours=index),
+            status=Appointment.Status.SCHEDULED,
+            notes_summary="Follow-up",
+            created_at=now,
+        )
+        for index in range(rows)
+    ]
+    notes = [
+        Note(
+            id=index,
+            patient_id=1,
+            author_id=1,
+            note_type=Note.NoteType.PROGRESS,
+            content="Patient reports less pain on flexion. " * 20,
+            created_at=now,
+        )
+        for index in range(rows)
+    ]
+
+    def page(serializer_class, objects):
+        return {
+            "limit": rows,
+            "next": "https://api.example.com/api/care/?cursor=eyJwIjpbXX0",
+            "previous": None,
+            "results": serializer_class(objects, many=True).data,
+        }
+
+    return {
+        "appointment page": page(AppointmentListApi.OutputSerializer, appointments),
+        "note page": page(NoteListApi.OutputSerializer, notes),
+        # Values serializers usually stringify, left to the encoder.
+        "raw values": [
+            {
+                "id": uuid.uuid4(),
+                "at": now + timedelta(minutes=index),
+                "day": now.date(),
+                "fee": Decimal("1250.50"),
+                "tags": ["follow-up", index],
+            }
+            for index in range(rows)
+        ],
+    }
+
+
+def _time_per_call(func, number) -> float:
+    return min(timeit.repeat(func, number=number)) / number
+
+
+class Command(BaseCommand):
+    help = (
+        "Render and parse representative care payloads with DRF's JSON "
+        "renderer and parser and with the orjson-backed ones, and compare "
+        "the time per call."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=50)
+        parser.add_argument("--number", type=int, default=200)
+
+    def handle(self, *args, **options):
+        number = options["number"]
+
+        for name, payload in _payloads(options["rows"]).items():
+            body = JSONRenderer().render(payload)
+            self.stdout.write(f"{name} ({len(body) / 1024:.1f} KiB)")
+
+            for label, renderer, parser in [
+                ("DRF", JSONRenderer(), JSONParser()),
+                ("fast", FastJSONRenderer(), FastJSONParser()),
+            ]:
+                render = _time_per_call(partial(renderer.render, payload), number)
+                parse = _time_per_call(
+                    lambda parser=parser, body=body: parser.parse(BytesIO(body)),
+                    number,
+                )
+                self.stdout.write(
+                    f"    {label:>4}: render {render * 1e6:8.1f} us, "
+                    f"parse {parse * 1e6:8.1f} us",
+                )
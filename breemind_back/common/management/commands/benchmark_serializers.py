@@ -0,0 +1,58 @@
+from datetime import timedelta
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from breemind_back.care.apis import AppointmentListApi
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Patient
+from breemind_back.common.utils import inline_serializer_class
+
+
+class Command(BaseCommand):
+    help = (
+        "Serialize the same in-memory appointments with the appointment list "
+        "output fields, as a stock DRF Serializer and as a ReadOnlySerializer, "
+        "and compare the time taken. No database access."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        patient = Patient(id=1, first_name="Benchmark", last_name="Patient")
+        appointments = [
+            Appointment(
+                id=index,
+                patient=patient,
+                doctor_id=1,
+                scheduled_start_at=now + timedelta(hours=index),
+                status=Appointment.Status.SCHEDULED,
+                notes_summary="Follow-up",
+                created_at=now,
+            )
+            for index in range(options["rows"])
+        ]
+
+        fields = AppointmentListApi.OutputSerializer._declared_fields  # noqa: SLF001
+        results = {}
+        for name, serializer_class in [
+            ("Serializer", inline_serializer_class(fields=fields)),
+            ("ReadOnlySerializer", AppointmentListApi.OutputSerializer),
+        ]:
+            timings = []
+            for _ in range(options["runs"]):
+                started = perf_counter()
+                results[name] = serializer_class(appointments, many=True).data
+                timings.append(perf_counter() - started)
+
+            self.stdout.write(
+                f"{name:>18}: {len(appointments)} rows in "
+                f"{min(timings) * 1000:8.1f} ms (best of {options['runs']})",
+            )
+
+        if results["Serializer"] != results["ReadOnlySerializer"]:
+            self.stderr.write("Outputs differ.")
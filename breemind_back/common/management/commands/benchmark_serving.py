@@ -0,0 +1,232 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+from http.client import HTTPConnection
+from pathlib import Path
+from time import perf_counter
+from time import sleep
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from breemind_back.users.models import User
+from breemind_back.users.services import user_issue_tokens
+
+SERVERS = {
+    # The start script before config/gunicorn.conf.py: one sync worker.
+    "baseline": (["config.wsgi"], {}),
+    "wsgi": (["--config", "config/gunicorn.conf.py"], {"GUNICORN_PROFILE": "wsgi"}),
+    "asgi": (["--config", "config/gunicorn.conf.py"], {"GUNICORN_PROFILE": "asgi"}),
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _children(pid: int) -> list[int]:
+    return [
+        int(child)
+        for child in Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    ]
+
+
+def _memory_kib(pid: int) -> dict[str, int]:
+    """
+    Rss and Pss of a process (Linux only).
+
+    Pss splits pages shared with other processes between them, so it shows
+    how much of the preloaded app forked workers really share.
+    """
+    memory = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+        key, _, value = line.partition(":")
+        if key in ("Rss", "Pss"):
+            memory[key] = int(value.split()[0])
+    return memory
+
+
+def _tree_rss_kib(pid: int) -> int:
+    """Resident memory of a process and all its descendants."""
+    return _memory_kib(pid)["Rss"] + sum(
+        _tree_rss_kib(child) for child in _children(pid)
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the API with each gunicorn profile (the old single sync worker, "
+        "and config/gunicorn.conf.py's wsgi and asgi profiles), then compare "
+        "throughput, latency, memory per in-flight request and memory per "
+        "worker at increasing client concurrency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/care/agenda/")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 8, 32, 64],
+        )
+        parser.add_argument("--duration", type=float, default=5.0)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Worker count for every profile. Defaults to each profile's own.",
+        )
+        parser.add_argument(
+            "--username",
+            help="User to authenticate as. Defaults to the first active user.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True).order_by("id")
+        if options["username"]:
+            users = users.filter(username=options["username"])
+        user = users.first()
+        if user is None:
+            msg = "No active user to authenticate as."
+            raise CommandError(msg)
+
+        headers = {
+            "Authorization": f"Bearer {user_issue_tokens(user=user)['access_token']}",
+        }
+
+        for name, (target, env) in SERVERS.items():
+            port = _free_port()
+            workers = (
+                ["--workers", str(options["workers"])] if options["workers"] else []
+            )
+            server = subprocess.Popen(  # noqa: S603
+                [
+                    sys.executable,
+                    "-m",
+                    "gunicorn",
+                    *target,
+                    "--bind",
+                    f"127.0.0.1:{port}",
+                    *workers,
+                    "--log-level",
+                    "warning",
+                ],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, **env},
+            )
+            try:
+                self._wait_until_serving(port=port, path=options["path"])
+                idle_kib = _tree_rss_kib(server.pid)
+                self.stdout.write(f"{name}: idle RSS {idle_kib / 1024:.0f} MiB")
+
+                for concurrency in options["concurrency"]:
+                    self._run(
+                        name=name,
+                        server=server,
+                        port=port,
+                        headers=headers,
+                        concurrency=concurrency,
+                        idle_kib=idle_kib,
+                        path=options["path"],
+                        duration=options["duration"],
+                    )
+
+                worker_memory = [_memory_kib(pid) for pid in _children(server.pid)]
+                self.stdout.write(
+                    f"{name:>8}: {len(worker_memory)} workers, per worker "
+                    f"RSS {self._mean_mib(worker_memory, 'Rss'):.0f} MiB, "
+                    f"PSS {self._mean_mib(worker_memory, 'Pss'):.0f} MiB",
+                )
+            finally:
+                server.terminate()
+                server.wait()
+
+    @staticmethod
+    def _mean_mib(memory, key):
+        return statistics.mean(entry[key] for entry in memory) / 1024
+
+    def _wait_until_serving(self, *, port, path, timeout=30):
+        deadline = perf_counter() + timeout
+        while perf_counter() < deadline:
+            try:
+                connection = HTTPConnection("127.0.0.1", port, timeout=1)
+                connection.request("GET", path)
+                connection.getresponse().read()
+                connection.close()
+            except OSError:
+                sleep(0.1)
+            else:
+                return
+
+        msg = f"Server on port {port} did not start within {timeout}s."
+        raise CommandError(msg)
+
+    def _run(  # noqa: PLR0913
+        self,
+        *,
+        name,
+        server,
+        port,
+        headers,
+        concurrency,
+        idle_kib,
+        path,
+        duration,
+    ):
+        stop = threading.Event()
+        latencies = []
+        errors = []
+        peak_kib = idle_kib
+        lock = threading.Lock()
+
+        def client():
+            connection = HTTPConnection("127.0.0.1", port, timeout=30)
+            while not stop.is_set():
+                started = perf_counter()
+                try:
+                    connection.request("GET", path, headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                except OSError as exc:
+                    connection.close()
+                    with lock:
+                        errors.append(exc)
+                    continue
+
+                with lock:
+                    if response.status == 200:  # noqa: PLR2004
+                        latencies.append((perf_counter() - started) * 1000)
+                    else:
+                        errors.append(response.status)
+            connection.close()
+
+        threads = [threading.Thread(target=client) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+
+        deadline = perf_counter() + duration
+        while perf_counter() < deadline:
+            peak_kib = max(peak_kib, _tree_rss_kib(server.pid))
+            sleep(0.05)
+
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        if len(latencies) < 2:  # noqa: PLR2004
+            msg = f"{name}: too few successful requests ({len(errors)} errors)."
+            raise CommandError(msg)
+
+        percentiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f"{name:>8} c={concurrency:<4} {len(latencies) / duration:8.0f} req/s, "
+            f"p50 {percentiles[49]:7.2f} ms, p99 {percentiles[98]:7.2f} ms, "
+            f"peak RSS {peak_kib / 1024:6.0f} MiB, "
+            f"{(peak_kib - idle_kib) / concurrency:7.0f} KiB per in-flight request, "
+            f"{len(errors)} errors",
+        )
@@ -0,0 +1,173 @@
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from time import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+# Runs in a fresh interpreter: load the app as a web worker does, then serve
+# one request through the WSGI handler, without a server or DB round trip.
+CHILD_SCRIPT = """
+import json
+import sys
+import time
+from io import BytesIO
+
+import django
+
+django.setup()
+setup_at = time.time()
+
+from django.conf import settings
+from django.core.wsgi import get_wsgi_application
+
+application = get_wsgi_application()
+ready_at = time.time()
+
+host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+environ = {
+    "REQUEST_METHOD": "GET",
+    "PATH_INFO": sys.argv[1],
+    "SERVER_NAME": host,
+    "SERVER_PORT": "443",
+    "HTTP_HOST": host,
+    "HTTP_ACCEPT": "application/json",
+    "HTTP_X_FORWARDED_PROTO": "https",
+    "wsgi.url_scheme": "https",
+    "wsgi.input": BytesIO(),
+}
+statuses = []
+b"".join(application(environ, lambda status, headers: statuses.append(status)))
+responded_at = time.time()
+
+print(json.dumps({
+    "setup_at": setup_at,
+    "ready_at": ready_at,
+    "responded_at": responded_at,
+    "status": statuses[0],
+    "packages": sorted({name.partition(".")[0] for name in sys.modules}),
+}))
+"""
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)$")
+
+
+def measure_startup(*, settings_module: str, path: str, importtime=False) -> dict:
+    """
+    Start a fresh interpreter with settings_module and serve one request.
+
+    Returns the seconds from spawning the process to django.setup() being
+    done (what every management command pays), to the WSGI app being ready,
+    and to the first response, along with its status and the top-level
+    packages imported by then. With `importtime`, also returns the time
+    spent importing each top-level package, measured by `python -X
+    importtime`, which slows the run down.
+    """
+    command = [sys.executable, "-c", CHILD_SCRIPT, path]
+    if importtime:
+        command[1:1] = ["-X", "importtime"]
+
+    spawned_at = time()
+    result = subprocess.run(  # noqa: S603
+        command,
+        cwd=settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": settings_module},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    import_times = Counter()
+    errors = []
+    for line in result.stderr.splitlines():
+        if match := IMPORTTIME_RE.match(line):
+            import_times[match[2].partition(".")[0]] += int(match[1]) / 1_000_000
+        elif not line.startswith("import time:"):
+            errors.append(line)
+
+    if result.returncode:
+        msg = f"{settings_module} failed to start:\n" + "\n".join(errors[-20:])
+        raise CommandError(msg)
+
+    timings = json.loads(result.stdout.splitlines()[-1])
+    return {
+        "setup": timings["setup_at"] - spawned_at,
+        "ready": timings["ready_at"] - spawned_at,
+        "first_request": timings["responded_at"] - spawned_at,
+        "status": timings["status"],
+        "packages": timings["packages"],
+        "import_times": import_times,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure cold start of each settings profile: import time per package "
+        "(python -X importtime), time to django.setup() as paid by every "
+        "management command, and time to the first served request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--settings-modules",
+            nargs="+",
+            default=["config.settings.production", "config.settings.api"],
+        )
+        parser.add_argument("--path", default="/api/users/me/")
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of packages listed by import time.",
+        )
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            help="Fail if the median time to first request exceeds this.",
+        )
+
+    def handle(self, *args, **options):
+        over_budget = []
+
+        for settings_module in options["settings_modules"]:
+            profile = measure_startup(
+                settings_module=settings_module,
+                path=options["path"],
+                importtime=True,
+            )
+            # Timings come from runs without -X importtime and its overhead.
+            runs = [
+                measure_startup(settings_module=settings_module, path=options["path"])
+                for _ in range(options["runs"])
+            ]
+            setup, ready, first_request = (
+                statistics.median(run[key] for run in runs) * 1000
+                for key in ("setup", "ready", "first_request")
+            )
+
+            import_times = profile["import_times"]
+            imports = sum(import_times.values()) * 1000
+            self.stdout.write(
+                f"{settings_module}: imports {imports:.0f} ms, "
+                f"setup {setup:.0f} ms, app ready {ready:.0f} ms, "
+                f"first request {first_request:.0f} ms ({profile['status']})",
+            )
+            for package, seconds in import_times.most_common(options["top"]):
+                self.stdout.write(f"    {package:<24} {seconds * 1000:7.1f} ms")
+
+            if options["budget_ms"] and first_request > options["budget_ms"]:
+                over_budget.append(f"{settings_module} ({first_request:.0f} ms)")
+
+        if over_budget:
+            msg = (
+                f"Time to first request over {options['budget_ms']:.0f} ms: "
+                + ", ".join(over_budget)
+            )
+            raise CommandError(msg)
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from breemind_back.common.schema import api_schema_generate
+
+
+class Command(BaseCommand):
+    help = "Write the OpenAPI schema artifact served by /api/schema/."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if the artifact is missing or stale instead of writing it.",
+        )
+
+    def handle(self, *args, **options):
+        artifact = Path(settings.API_SCHEMA_ARTIFACT)
+        content = api_schema_generate()
+
+        if options["check"]:
+            if not artifact.exists() or artifact.read_bytes() != content:
+                msg = f"{artifact} is stale, run `manage.py build_api_schema`."
+                raise CommandError(msg)
+            return
+
+        artifact.write_bytes(content)
+        self.stdout.write(f"Wrote {artifact}")
@@ -0,0 +1,293 @@
+"""
+Per-view request metrics in the Prometheus text format.
+
+MetricsMiddleware records every request under its view, method and status:
+latency (as a histogram), database queries and their time, user cache hits
+and misses, and response bytes. Each thread adds to its own shard, so
+recording takes no lock; shards are only summed when metrics are flushed or
+scraped.
+
+Every METRICS_FLUSH_INTERVAL seconds a worker adds what it recorded since
+its last flush to one Redis hash, which therefore holds the totals of every
+worker, including ones gunicorn has since recycled. /metrics serves those
+totals, or this process's own when the cache is not Redis.
+"""
+
+import json
+import logging
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import monotonic
+from time import perf_counter
+
+from django.conf import settings
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions
+from rest_framework.views import APIView
+
+from breemind_back.common.throttling import redis_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "metrics:http"
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Positions of the values kept per (view, method, status). They are followed
+# by one request count per latency bucket, and one for slower requests.
+REQUESTS = 0
+DURATION = 1
+QUERIES = 2
+QUERY_SECONDS = 3
+CACHE_HITS = 4
+CACHE_MISSES = 5
+BYTES = 6
+BUCKETS_START = 7
+WIDTH = BUCKETS_START + len(DURATION_BUCKETS) + 1
+
+COUNTERS = [
+    (QUERIES, "http_request_db_queries_total", "Database queries run."),
+    (QUERY_SECONDS, "http_request_db_query_seconds_total", "Time in queries."),
+    (CACHE_HITS, "http_request_cache_hits_total", "User cache hits."),
+    (CACHE_MISSES, "http_request_cache_misses_total", "User cache misses."),
+    (BYTES, "http_response_size_bytes_total", "Response body bytes."),
+]
+
+
+class RequestStats:
+    """What the request being served has done so far."""
+
+    __slots__ = ("cache_hits", "cache_misses", "queries", "query_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "metrics_request_stats",
+    default=None,
+)
+
+_local = threading.local()
+_shards: list[dict[tuple, list[float]]] = []
+
+_flush_lock = threading.Lock()
+_flushed: dict[tuple, list[float]] = {}
+_next_flush_at = 0.0
+
+
+def _shard() -> dict[tuple, list[float]]:
+    shard = getattr(_local, "shard", None)
+    if shard is None:
+        shard = _local.shard = {}
+        _shards.append(shard)
+    return shard
+
+
+def metrics_request_start() -> RequestStats:
+    """Start counting queries and cache lookups for the current request."""
+    stats = RequestStats()
+    _request_stats.set(stats)
+    return stats
+
+
+def metrics_record_query(execute, sql, params, many, context):
+    """connection.execute_wrapper that counts queries of the current request."""
+    stats = _request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.query_seconds += perf_counter() - started
+
+
+def metrics_record_cache(*, hit: bool) -> None:
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    if hit:
+        stats.cache_hits += 1
+    else:
+        stats.cache_misses += 1
+
+
+def metrics_record_request(  # noqa: PLR0913
+    *,
+    view: str,
+    method: str,
+    status: int,
+    duration: float,
+    stats: RequestStats,
+    response_bytes: int,
+) -> None:
+    shard = _shard()
+    key = (view, method, str(status))
+    values = shard.get(key)
+    if values is None:
+        values = shard[key] = [0.0] * WIDTH
+
+    values[REQUESTS] += 1
+    values[DURATION] += duration
+    values[QUERIES] += stats.queries
+    values[QUERY_SECONDS] += stats.query_seconds
+    values[CACHE_HITS] += stats.cache_hits
+    values[CACHE_MISSES] += stats.cache_misses
+    values[BYTES] += response_bytes
+
+    values[BUCKETS_START + bisect_left(DURATION_BUCKETS, duration)] += 1
+
+
+def metrics_snapshot() -> dict[tuple, list[float]]:
+    """Totals recorded by this process."""
+    totals: dict[tuple, list[float]] = {}
+    for shard in _shards:
+        # Copying is atomic under the GIL; the owning thread may keep adding.
+        for key, values in list(shard.items()):
+            total = totals.setdefault(key, [0.0] * WIDTH)
+            for index, value in enumerate(list(values)):
+                total[index] += value
+    return totals
+
+
+def metrics_reset() -> None:
+    """Forget this process's metrics."""
+    for shard in _shards:
+        shard.clear()
+    _flushed.clear()
+
+
+def metrics_flush_due() -> bool:
+    return monotonic() >= _next_flush_at
+
+
+def metrics_flush() -> None:
+    """Add this process's metrics since its last flush to the shared totals."""
+    global _next_flush_at  # noqa: PLW0603
+
+    client = redis_client()
+    # Requests never wait on a flush already under way in another thread.
+    if client is None or not _flush_lock.acquire(blocking=False):
+        return
+
+    # Only imported once a Redis cache is in use.
+    from redis.exceptions import RedisError  # noqa: PLC0415
+
+    try:
+        _next_flush_at = monotonic() + settings.METRICS_FLUSH_INTERVAL
+        snapshot = metrics_snapshot()
+
+        pipeline = client.pipeline(transaction=False)
+        for key, values in snapshot.items():
+            flushed = _flushed.get(key, [0.0] * WIDTH)
+            field = json.dumps(key)
+            for index, value in enumerate(values):
+                if value != flushed[index]:
+                    pipeline.hincrbyfloat(
+                        REDIS_KEY,
+                        f"{field}\t{index}",
+                        value - flushed[index],
+                    )
+        pipeline.execute()
+        _flushed.update(snapshot)
+    except RedisError:
+        logger.warning("Could not flush metrics to Redis")
+    finally:
+        _flush_lock.release()
+
+
+def metrics_collect() -> dict[tuple, list[float]]:
+    """Totals of every worker, or of this process without Redis."""
+    client = redis_client()
+    if client is None:
+        return metrics_snapshot()
+
+    metrics_flush()
+    # Only imported once a Redis cache is in use.
+    from redis.exceptions import RedisError  # noqa: PLC0415
+
+    try:
+        fields = client.hgetall(REDIS_KEY)
+    except RedisError:
+        logger.warning("Could not read metrics from Redis")
+        return metrics_snapshot()
+
+    totals: dict[tuple, list[float]] = {}
+    for field, value in fields.items():
+        key, _, index = field.decode().rpartition("\t")
+        total = totals.setdefault(tuple(json.loads(key)), [0.0] * WIDTH)
+        total[int(index)] = float(value)
+    return totals
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(key: tuple, **extra: str) -> str:
+    labels = dict(zip(("view", "method", "status"), key, strict=True), **extra)
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def metrics_render(totals: dict[tuple, list[float]]) -> str:
+    """Render totals in the Prometheus text exposition format."""
+    keys = sorted(totals)
+    lines = [
+        "# HELP http_request_duration_seconds Time Django took to respond.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for key in keys:
+        values = totals[key]
+        cumulative = 0.0
+        for bucket, bound in enumerate([*DURATION_BUCKETS, "+Inf"]):
+            cumulative += values[BUCKETS_START + bucket]
+            labels = _labels(key, le=str(bound))
+            lines.append(
+                f"http_request_duration_seconds_bucket{{{labels}}} "
+                f"{_number(cumulative)}",
+            )
+        labels = _labels(key)
+        lines.append(
+            f"http_request_duration_seconds_sum{{{labels}}} "
+            f"{_number(values[DURATION])}",
+        )
+        lines.append(
+            f"http_request_duration_seconds_count{{{labels}}} "
+            f"{_number(values[REQUESTS])}",
+        )
+
+    for index, name, help_text in COUNTERS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(
+            f"{name}{{{_labels(key)}}} {_number(totals[key][index])}" for key in keys
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsApi(APIView):
+    """Prometheus metrics API."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(exclude=True)
+    def get(self, request):
+        """Serve request metrics of every worker."""
+        return HttpResponse(
+            metrics_render(metrics_collect()),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
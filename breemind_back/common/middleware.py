@@ -0,0 +1,139 @@
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction
+from asgiref.sync import markcoroutinefunction
+from asgiref.sync import sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware as _WhiteNoiseMiddleware
+
+from breemind_back.common.metrics import metrics_flush
+from breemind_back.common.metrics import metrics_flush_due
+from breemind_back.common.metrics import metrics_record_request
+from breemind_back.common.metrics import metrics_request_start
+from breemind_back.common.routers import replica_reads
+from breemind_back.common.routers import replica_view_started
+
+
+class WhiteNoiseMiddleware(_WhiteNoiseMiddleware):
+    """
+    WhiteNoise middleware that also runs natively under ASGI.
+
+    Upstream WhiteNoise is sync-only, and one sync-only middleware makes
+    Django run every request below it through async_to_sync on a thread,
+    which takes away what async views gain. Static files are looked up in an
+    in-memory table, so the lookup is safe to do on the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class MetricsMiddleware:
+    """
+    Record latency, queries, cache lookups and size of every response.
+
+    Requests are labelled with the name of the view they resolved to, so
+    label values stay bounded; unresolved paths share one label.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        stats = metrics_request_start()
+        started = perf_counter()
+        response = self.get_response(request)
+        self._record(request, response, stats, perf_counter() - started)
+
+        if metrics_flush_due():
+            metrics_flush()
+        return response
+
+    async def __acall__(self, request):
+        stats = metrics_request_start()
+        started = perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, stats, perf_counter() - started)
+
+        if metrics_flush_due():
+            await sync_to_async(metrics_flush)()
+        return response
+
+    @staticmethod
+    def _record(request, response, stats, duration):
+        match = getattr(request, "resolver_match", None)
+        if response.streaming:
+            response_bytes = int(response.get("Content-Length", 0))
+        else:
+            response_bytes = len(response.content)
+
+        metrics_record_request(
+            view=match.view_name if match else "<unresolved>",
+            method=request.method,
+            status=response.status_code,
+            duration=duration,
+            stats=stats,
+            response_bytes=response_bytes,
+        )
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Read from a replica for the length of each request, see common.routers.
+
+    Goes above SessionMiddleware, so a session saved on the way out counts as
+    a write of the request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with replica_reads(request=request):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with replica_reads(request=request):
+            return await self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        replica_view_started(view_func)
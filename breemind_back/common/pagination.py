@@ -1,45 +1,414 @@
-from collections import OrderedDict
+import binascii
+import hashlib
+import json
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
 
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import LimitOffsetPagination as _LimitOffsetPagination
+from rest_framework.pagination import _positive_int
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param
+from rest_framework.utils.urls import replace_query_param
+
+
+def encode_cursor(payload) -> str:
+    """Encode a JSON-serializable payload as an opaque, url-safe cursor."""
+    return urlsafe_b64encode(
+        json.dumps(payload, separators=(",", ":")).encode(),
+    ).decode("ascii")
+
+
+def decode_cursor(encoded: str):
+    """
+    Decode a cursor made by encode_cursor.
+
+    Raises ValueError for anything that is not a cursor we issued.
+    """
+    try:
+        return json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+    except (binascii.Error, UnicodeError) as exc:
+        raise ValueError(encoded) from exc
+
+
+def seek_filter(*, fields, values, before) -> Q:
+    """
+    Row-value comparison `(f1, f2, ...) < (v1, v2, ...)` spelled as a Q.
+
+    The leading `f1 <= v1` term is redundant but lets Postgres bound the
+    index range scan on the first column.
+    """
+    lookup = "lt" if before else "gt"
+    bound = "lte" if before else "gte"
+
+    seek = Q()
+    for index, field in enumerate(fields):
+        equal = {fields[i]: values[i] for i in range(index)}
+        seek |= Q(**equal, **{f"{field}__{lookup}": values[index]})
+
+    return Q(**{f"{fields[0]}__{bound}": values[0]}) & seek
+
+
+def queryset_estimated_count(queryset) -> int | None:
+    """
+    Planner row estimate for an unfiltered queryset, without scanning it.
+
+    Returns None when no estimate is available: on non-Postgres databases,
+    for filtered querysets, or for tables that were never analyzed.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or queryset.query.where:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],  # noqa: SLF001
+        )
+        row = cursor.fetchone()
+
+    if row is None or row[0] < 0:
+        return None
+
+    return row[0]
+
+
+def queryset_count(queryset) -> tuple[int, bool]:
+    """
+    Count of queryset, and whether it is exact.
+
+    Unfiltered querysets above settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD
+    rows get the planner's estimate from pg_class. Anything else runs
+    COUNT(*) and caches the result for settings.PAGINATION_COUNT_CACHE_TIMEOUT
+    seconds, keyed by the query, so an exact count may lag behind writes by
+    that long. Filtered estimates are not used: they can be off by orders of
+    magnitude.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        # E.g. .none(), or a filter Django knows matches nothing.
+        return 0, True
+    digest = hashlib.sha256(repr((queryset.db, sql, params)).encode()).hexdigest()
+    cache_key = f"pagination:count:{digest}"
+
+    count = cache.get(cache_key)
+    if count is not None:
+        return count, True
+
+    estimate = queryset_estimated_count(queryset)
+    if (
+        estimate is not None
+        and estimate > settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD
+    ):
+        return estimate, False
+
+    count = queryset.count()
+    cache.set(cache_key, count, timeout=settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+    return count, True
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator that skips COUNT(*) on large unfiltered querysets.
+
+    Above settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD rows the planner
+    estimate is used instead; smaller or filtered querysets are counted.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = queryset_estimated_count(self.object_list)
+        if (
+            estimate is not None
+            and estimate > settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD
+        ):
+            return estimate
+
+        return super().count
 
 
 class LimitOffsetPagination(_LimitOffsetPagination):
-    """Limit offset pagination."""
+    """
+    Limit offset pagination.
+
+    Counts go through queryset_count, so large unfiltered lists report the
+    planner's estimate and `count_exact` says which one the client got. Clients that
+    do not need a count pass `?count=false` to skip it. Either way, one row
+    past the page is fetched to tell whether there is a next page; the page
+    is always fetched, as an exact count may come from the cache and miss
+    newer rows.
+    """
 
     default_limit = 10
     max_limit = 50
+    count_query_param = "count"
+    template = None
 
-    def get_paginated_data(self, data):
-        return OrderedDict(
-            [
-                ("limit", self.limit),
-                ("offset", self.offset),
-                ("count", self.count),
-                ("next", self.get_next_link()),
-                ("previous", self.get_previous_link()),
-                ("results", data),
-            ],
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        self.count, self.count_exact = None, False
+        if self.get_count_requested(request):
+            self.count, self.count_exact = queryset_count(queryset)
+
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    def get_count_requested(self, request):
+        value = request.query_params.get(self.count_query_param, "")
+        return value.lower() not in {"false", "0", "no"}
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url,
+            self.offset_query_param,
+            self.offset + self.limit,
         )
 
+    def get_paginated_data(self, data):
+        return {
+            "limit": self.limit,
+            "offset": self.offset,
+            "count": self.count,
+            "count_exact": self.count_exact,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
     def get_paginated_response(self, data):
         """
         Return limit and offset in response.
         Used by the frontend to construct pagination itself.
         """
-        return Response(
-            OrderedDict(
-                [
-                    ("limit", self.limit),
-                    ("offset", self.offset),
-                    ("count", self.count),
-                    ("next", self.get_next_link()),
-                    ("previous", self.get_previous_link()),
-                    ("results", data),
-                ],
-            ),
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"] = {
+            "limit": {"type": "integer", "example": self.default_limit},
+            "offset": {"type": "integer", "example": 0},
+            **response_schema["properties"],
+            "count_exact": {
+                "type": "boolean",
+                "description": "False when count is the planner's estimate.",
+            },
+        }
+        response_schema["properties"]["count"]["nullable"] = True
+        response_schema["required"] = ["results"]
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Pass false to skip counting the results.",
+                "schema": {"type": "boolean", "default": True},
+            },
+        ]
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination.
+
+    Pages are fetched with `WHERE (created_at, id) < (cursor) ORDER BY ...
+    LIMIT n` instead of OFFSET, and no COUNT(*) is issued, so every page costs
+    the same index range scan regardless of depth. Cursors are opaque,
+    url-safe tokens holding the boundary row's ordering values.
+    """
+
+    ordering = ("-created_at", "-id")
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+    default_limit = 10
+    max_limit = 50
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self._seek(queryset, request)
+        return self._set_page(list(queryset[: self.limit + 1]))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset for async views, fetching with the async ORM."""
+        queryset = self._seek(queryset, request)
+        return self._set_page([obj async for obj in queryset[: self.limit + 1]])
+
+    def _seek(self, queryset, request):
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.model = queryset.model
+
+        self.position, self.reverse = self.decode_cursor(request)
+        descending = self.ordering[0].startswith("-")
+        fields = [field.lstrip("-") for field in self.ordering]
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [self._flip(field) for field in ordering]
+        queryset = queryset.order_by(*ordering)
+
+        if self.position is not None:
+            queryset = queryset.filter(
+                seek_filter(
+                    fields=fields,
+                    values=self.position,
+                    before=descending != self.reverse,
+                ),
+            )
+
+        return queryset
+
+    def _set_page(self, results):
+        has_more = len(results) > self.limit
+        results = results[: self.limit]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        self.page = results
+        return results
+
+    def get_limit(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.limit_query_param],
+                strict=True,
+                cutoff=self.max_limit,
+            )
+        except (KeyError, ValueError):
+            return self.default_limit
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_data(self, data):
+        return {
+            "limit": self.limit,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data):
+        """
+        Return limit and opaque cursor links in response.
+        """
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "limit": {"type": "integer", "example": self.default_limit},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque pagination cursor.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = decode_cursor(encoded)
+            values = [
+                self.model._meta.get_field(field.lstrip("-")).to_python(value)  # noqa: SLF001
+                for field, value in zip(self.ordering, payload["p"], strict=True)
+            ]
+            reverse = bool(payload.get("r", False))
+        except (
+            KeyError,
+            TypeError,
+            ValueError,
+            ValidationError,
+        ) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        return values, reverse
+
+    def encode_cursor(self, instance, *, reverse):
+        values = [
+            self._serialize(getattr(instance, field.lstrip("-")))
+            for field in self.ordering
+        ]
+        return encode_cursor({"p": values, "r": reverse})
+
+    def _link(self, instance, *, reverse):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.encode_cursor(instance, reverse=reverse),
         )
 
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _serialize(value):
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return value
+
 
 def get_paginated_response(
     *,
@@ -61,3 +430,25 @@ def get_paginated_response(
     serializer = serializer_class(queryset, many=True)
 
     return Response(data=serializer.data)
+
+
+async def aget_paginated_response(
+    *,
+    pagination_class,
+    serializer_class,
+    queryset,
+    request,
+    view,
+):
+    """
+    get_paginated_response for async views.
+
+    The page is fetched with the async ORM, so serializer_class must only read
+    fields loaded by the queryset (select_related what it needs).
+    """
+    paginator = pagination_class()
+
+    page = await paginator.apaginate_queryset(queryset, request, view=view)
+
+    serializer = serializer_class(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,43 @@
+"""
+JSON rendering with orjson.
+
+orjson encodes str, int, float, dict, list, datetime, date, time and UUID
+values (and their subclasses, such as ReturnDict or TextChoices) in C,
+straight to bytes. Anything else, e.g. Decimal or lazy translation strings,
+goes through DRF's JSONEncoder.default, so output matches JSONRenderer's,
+except that datetimes keep their microseconds. Without orjson installed,
+or when indentation is requested, rendering falls back to JSONRenderer.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+ORJSON_OPTIONS = 0 if orjson is None else orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson when it can."""
+
+    encoder_default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if orjson is None or self.get_indent(
+            accepted_media_type,
+            renderer_context,
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(
+            data,
+            default=self.encoder_default,
+            option=ORJSON_OPTIONS,
+        )
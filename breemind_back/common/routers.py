@@ -0,0 +1,169 @@
+"""
+Database routing between the primary and the read replicas.
+
+Requests read from one of settings.DATABASE_REPLICAS, picked per request,
+and write to the primary. Reads stay on the primary:
+
+- inside transaction.atomic blocks the view opens, beyond the request's own
+  ATOMIC_REQUESTS transaction, so services read what they are about to
+  change;
+- for the rest of a request once it has written;
+- for DATABASE_REPLICA_PIN_SECONDS after a request of the same user wrote,
+  so users read their own writes while the replicas catch up;
+- for PRIMARY_APPS, whose rows are written by one request and read by the
+  very next one before anyone is known to have written them;
+- outside requests and replica_reads() blocks, e.g. in management commands
+  and workers.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+from django.utils.functional import LazyObject
+from django.utils.functional import empty
+
+# Sessions and API tokens are read to authenticate, before the user is known.
+PRIMARY_APPS = {"authtoken", "sessions"}
+
+WRITE_STATEMENTS = ("DELETE", "INSERT", "UPDATE")
+
+
+class ReplicaState:
+    """Where the reads of the code being served may go."""
+
+    __slots__ = ("atomic_depth", "pinned", "replica", "request", "wrote")
+
+    def __init__(self, *, replica: str | None, request=None):
+        self.replica = replica
+        self.request = request
+        self.atomic_depth = len(connections[DEFAULT_DB_ALIAS].atomic_blocks)
+        self.wrote = False
+        # Looked up once the request's user is known.
+        self.pinned = None
+
+
+_state: ContextVar[ReplicaState | None] = ContextVar(
+    "replica_state",
+    default=None,
+)
+
+
+@contextmanager
+def replica_reads(*, request=None):
+    """
+    Read from a replica in this context, e.g. for the length of a request.
+
+    With a request, its user is pinned to the primary on exit if it wrote.
+    """
+    replicas = settings.DATABASE_REPLICAS
+    state = ReplicaState(
+        replica=random.choice(replicas) if replicas else None,  # noqa: S311
+        request=request,
+    )
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+        _pin_writer(state)
+
+
+def replica_view_started(view) -> None:
+    """Count the ATOMIC_REQUESTS transaction view is about to run in."""
+    state = _state.get()
+    if state is None:
+        return
+
+    connection = connections[DEFAULT_DB_ALIAS]
+    non_atomic_requests = getattr(view, "_non_atomic_requests", set())
+    if (
+        connection.settings_dict["ATOMIC_REQUESTS"]
+        and DEFAULT_DB_ALIAS not in non_atomic_requests
+    ):
+        state.atomic_depth = len(connection.atomic_blocks) + 1
+
+
+def replica_record_write(execute, sql, params, many, context):
+    """connection.execute_wrapper that notes writes of the current request."""
+    state = _state.get()
+    if (
+        state is not None
+        and not state.wrote
+        and sql.lstrip()[:6].upper() in WRITE_STATEMENTS
+    ):
+        state.wrote = True
+    return execute(sql, params, many, context)
+
+
+def replica_pin_cache_key(*, user_id: int) -> str:
+    return f"common:replica_pin:{user_id}"
+
+
+def _pin_writer(state: ReplicaState) -> None:
+    if state.replica is None or not state.wrote or state.request is None:
+        return
+
+    user_id = _request_user_id(state.request)
+    if user_id is not None:
+        cache.set(
+            replica_pin_cache_key(user_id=user_id),
+            1,
+            timeout=settings.DATABASE_REPLICA_PIN_SECONDS,
+        )
+
+
+def _request_user_id(request) -> int | None:
+    user = getattr(request, "user", None)
+    # Loading the user is itself a read; the token user knows its id already.
+    if (
+        isinstance(user, LazyObject)
+        and user._wrapped is empty  # noqa: SLF001
+        and "pk" not in user.__dict__
+    ):
+        return None
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+def _pinned(state: ReplicaState) -> bool:
+    if state.pinned is None:
+        user_id = None if state.request is None else _request_user_id(state.request)
+        if user_id is None:
+            return False
+        state.pinned = cache.get(replica_pin_cache_key(user_id=user_id)) is not None
+    return state.pinned
+
+
+class ReplicaRouter:
+    """Send reads to the replicas where they cannot miss a write, see above."""
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is None
+            or state.replica is None
+            or state.wrote
+            or model._meta.app_label in PRIMARY_APPS  # noqa: SLF001
+            or len(connections[DEFAULT_DB_ALIAS].atomic_blocks) > state.atomic_depth
+            or _pinned(state)
+        ):
+            return DEFAULT_DB_ALIAS
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if {obj1._state.db, obj2._state.db} <= databases:  # noqa: SLF001
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,110 @@
+"""
+Precomputed OpenAPI schema.
+
+Generating the schema introspects every view and serializer, which costs
+hundreds of milliseconds of CPU. `manage.py build_api_schema` writes it once
+to settings.API_SCHEMA_ARTIFACT at build time; web workers read the artifact,
+render and compress each format once, and serve those bytes from memory.
+"""
+
+import gzip
+import hashlib
+import json
+import re
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_vary_headers
+from drf_spectacular.plumbing import get_lib_doc_excludes as _get_lib_doc_excludes
+from drf_spectacular.renderers import OpenApiJsonRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS
+from drf_spectacular.views import SpectacularAPIView
+
+from breemind_back.common.serializers import ReadOnlySerializer
+
+accepts_gzip_re = re.compile(r"\bgzip\b")
+
+
+class SchemaDocument(NamedTuple):
+    content: bytes
+    gzipped: bytes
+    etag: str
+
+
+def get_lib_doc_excludes():
+    """Classes whose docstrings never describe a schema component."""
+    return [*_get_lib_doc_excludes(), ReadOnlySerializer]
+
+
+def api_schema_generate() -> bytes:
+    """Generate the schema, rendered as the JSON artifact."""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+
+    return OpenApiJsonRenderer().render(schema, renderer_context={})
+
+
+@cache
+def api_schema_load() -> dict:
+    """
+    Get the schema from the artifact, or generate it once if it is missing.
+    """
+    try:
+        content = Path(settings.API_SCHEMA_ARTIFACT).read_bytes()
+    except FileNotFoundError:
+        content = api_schema_generate()
+
+    return json.loads(content)
+
+
+@cache
+def api_schema_document(renderer_class) -> SchemaDocument:
+    """Get the schema rendered by renderer_class, gzipped and with its ETag."""
+    content = renderer_class().render(api_schema_load(), renderer_context={})
+
+    return SchemaDocument(
+        content=content,
+        gzipped=gzip.compress(content, mtime=0),
+        etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+    )
+
+
+class SchemaApi(SpectacularAPIView):
+    """
+    OpenAPI schema, served from the precomputed artifact.
+
+    Responses carry an ETag and are gzipped for clients that accept it.
+    Requests for another language or API version are generated as before.
+    """
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        if request.query_params.get("lang") or request.query_params.get("version"):
+            return super().get(request, *args, **kwargs)
+
+        renderer = request.accepted_renderer
+        document = api_schema_document(type(renderer))
+
+        response = get_conditional_response(request, etag=document.etag)
+        if response is None:
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+
+            response = HttpResponse(document.content, content_type=content_type)
+            if accepts_gzip_re.search(request.headers.get("Accept-Encoding", "")):
+                response.content = document.gzipped
+                response["Content-Encoding"] = "gzip"
+            response["Content-Disposition"] = (
+                f'inline; filename="{self._get_filename(request, None)}"'
+            )
+
+        response["ETag"] = document.etag
+        patch_vary_headers(response, ["Accept", "Accept-Encoding"])
+        return response
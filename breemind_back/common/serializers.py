@@ -0,0 +1,145 @@
+from collections.abc import Mapping
+from datetime import datetime
+from operator import attrgetter
+from typing import ClassVar
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils import timezone
+from django.utils.functional import cached_property
+from rest_framework import ISO_8601
+from rest_framework import serializers
+from rest_framework.fields import Field
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.settings import api_settings
+
+# Fields whose to_representation returns values of this type unchanged.
+NATIVE_TYPES = {
+    serializers.BooleanField: bool,
+    serializers.CharField: str,
+    serializers.FloatField: float,
+    serializers.IntegerField: int,
+}
+
+
+def _native_type(field) -> type | None:
+    """
+    Type of the values field outputs unchanged, or datetime for fields that
+    output aware datetimes in ISO 8601, in the current timezone.
+    """
+    field_class = serializers.DateTimeField
+    if (
+        isinstance(field, field_class)
+        and type(field).to_representation is field_class.to_representation
+        and type(field).enforce_timezone is field_class.enforce_timezone
+        and not hasattr(field, "timezone")
+        and getattr(field, "format", api_settings.DATETIME_FORMAT) == ISO_8601
+    ):
+        return datetime
+
+    for field_class, native_type in NATIVE_TYPES.items():
+        if (
+            isinstance(field, field_class)
+            and type(field).to_representation is field_class.to_representation
+        ):
+            return native_type
+    return None
+
+
+def _attribute_getter(field):
+    """Read field's source from an object in one call, or None to defer to DRF."""
+    if type(field).get_attribute is not Field.get_attribute:
+        return None
+    if not field.source_attrs:
+        return lambda instance: instance
+    return attrgetter(".".join(field.source_attrs))
+
+
+# Returned by _get when the field has to read the attribute itself.
+_UNREAD = object()
+
+
+def _get(getter, instance):
+    try:
+        value = getter(instance)
+    except (AttributeError, ObjectDoesNotExist):
+        return _UNREAD
+    # DRF calls methods named by source; leave those to the field.
+    return _UNREAD if callable(value) else value
+
+
+def _format_datetime(value: datetime, tz) -> str:
+    # DateTimeField.to_representation for aware values, with tz resolved once.
+    value = value.astimezone(tz).isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+def _represent(value, native_type, field, tz):
+    if value is None or (isinstance(value, PKOnlyObject) and value.pk is None):
+        return None
+    if native_type is datetime and type(value) is datetime:
+        if tz is not None and value.utcoffset() is not None:
+            return _format_datetime(value, tz)
+    elif type(value) is native_type:
+        return value
+    return field.to_representation(value)
+
+
+class ReadOnlySerializer(serializers.Serializer):
+    """
+    Serializer for output only, with a faster to_representation.
+
+    The source path and output type of every readable field are worked out
+    once per class; each object is then read with plain attribute lookups
+    into a dict, native values (str, int, bool, float) skip the field's
+    to_representation, and aware datetimes are formatted in the timezone
+    that was current when the serializer first ran. Anything the fast path
+    cannot read the same way DRF would - mappings, callables, missing
+    attributes, fields with their own get_attribute - goes through the field
+    as usual, so output matches Serializer's. Works with many=True; nested
+    ReadOnlySerializers are fast too.
+    """
+
+    _plans: ClassVar[dict[type, list]] = {}
+
+    def _plan(self):
+        plan = ReadOnlySerializer._plans.get(type(self))
+        if plan is None:
+            plan = [
+                (field.field_name, _attribute_getter(field), _native_type(field))
+                for field in self._readable_fields
+            ]
+            ReadOnlySerializer._plans[type(self)] = plan
+        return plan
+
+    @cached_property
+    def _timezone(self):
+        return timezone.get_current_timezone() if settings.USE_TZ else None
+
+    @cached_property
+    def _compiled_fields(self):
+        fields = self.fields
+        return [
+            (name, getter, native_type, fields[name])
+            for name, getter, native_type in self._plan()
+        ]
+
+    def to_representation(self, instance):
+        ret = {}
+        is_mapping = isinstance(instance, Mapping)
+        tz = self._timezone
+
+        for name, getter, native_type, field in self._compiled_fields:
+            value = _UNREAD
+            if getter is not None and not is_mapping:
+                value = _get(getter, instance)
+            if value is _UNREAD:
+                try:
+                    value = field.get_attribute(instance)
+                except SkipField:
+                    continue
+
+            ret[name] = _represent(value, native_type, field, tz)
+
+        return ret
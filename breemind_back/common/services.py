@@ -1,10 +1,21 @@
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 from typing import TypeVar
 
+from django.core.exceptions import ValidationError
+from django.db import connections
 from django.db import models
+from django.db import router
+from django.db import transaction
+from django.dispatch import Signal
 
 Model = TypeVar("Model", bound=models.Model)
 
+# Sent by model_bulk_update with the model as sender and the changed
+# `instances`, in place of the post_save signals it skips.
+model_bulk_updated = Signal()
+
 
 def model_update(
     *,
@@ -35,3 +46,293 @@ def model_update(
         instance.save(update_fields=updated_fields)
 
     return instance, has_updated
+
+
+def _model_diff(
+    *,
+    instance: models.Model,
+    fields: list[str],
+    data: dict[str, Any],
+) -> set[str]:
+    """Set the fields of instance that differ from data; return their names."""
+    changed_fields = set()
+
+    for field in fields:
+        if field not in data:
+            continue
+
+        if getattr(instance, field) != data[field]:
+            setattr(instance, field, data[field])
+            changed_fields.add(field)
+
+    return changed_fields
+
+
+def _model_clean(*, instance: models.Model) -> set[str]:
+    """
+    full_clean() without the queries it runs per instance.
+
+    Uniqueness and constraints are not checked, nor are foreign keys checked
+    to exist. Returns the names of fields that clean() changed, e.g. a
+    stored range derived from its bounds.
+    """
+    concrete_fields = [
+        field
+        for field in instance._meta.concrete_fields  # noqa: SLF001
+        if not field.primary_key
+    ]
+    loaded = {field: instance.__dict__.get(field.attname) for field in concrete_fields}
+
+    errors = {}
+    try:
+        instance.full_clean(
+            exclude={field.name for field in concrete_fields if field.is_relation},
+            validate_unique=False,
+            validate_constraints=False,
+        )
+    except ValidationError as exc:
+        errors = exc.message_dict
+
+    for field in concrete_fields:
+        if not field.is_relation:
+            continue
+        try:
+            # Null, blank and choices checks of Field, without the lookup.
+            models.Field.validate(field, getattr(instance, field.attname), instance)
+        except ValidationError as exc:
+            errors[field.name] = exc.messages
+
+    if errors:
+        raise ValidationError(errors)
+
+    return {
+        field.name
+        for field in concrete_fields
+        if instance.__dict__.get(field.attname) != loaded[field]
+    }
+
+
+def _foreign_keys_validate(
+    *,
+    model: type[models.Model],
+    changes: dict[models.Model, set[str]],
+) -> dict[str, list[str]]:
+    """
+    Check that changed foreign keys point at existing rows, one query per field.
+
+    ForeignKey.validate() runs the same check with one query per instance.
+    """
+    errors = {}
+
+    for field in model._meta.concrete_fields:  # noqa: SLF001
+        if not field.is_relation:
+            continue
+
+        instances = [
+            instance
+            for instance, changed_fields in changes.items()
+            if {field.name, field.attname} & changed_fields
+            and getattr(instance, field.attname) is not None
+        ]
+        if not instances:
+            continue
+
+        target_field = field.remote_field.field_name
+        existing = set(
+            field.remote_field.model._base_manager.using(  # noqa: SLF001
+                router.db_for_read(field.remote_field.model),
+            )
+            .filter(
+                **{
+                    f"{target_field}__in": {
+                        getattr(instance, field.attname) for instance in instances
+                    },
+                },
+            )
+            .complex_filter(field.get_limit_choices_to())
+            .values_list(target_field, flat=True),
+        )
+
+        for instance in instances:
+            value = getattr(instance, field.attname)
+            if value not in existing:
+                error = ValidationError(
+                    field.error_messages["invalid"],
+                    code="invalid",
+                    params={
+                        "model": field.remote_field.model._meta.verbose_name,  # noqa: SLF001
+                        "pk": value,
+                        "field": target_field,
+                        "value": value,
+                    },
+                )
+                errors[f"{instance.pk}.{field.name}"] = error.messages
+
+    return errors
+
+
+def _model_values_update(
+    *,
+    model: type[models.Model],
+    instances: list[models.Model],
+    field_names: list[str],
+    batch_size: int,
+) -> None:
+    """
+    Write field_names of instances as UPDATE ... FROM (VALUES ...).
+
+    On Postgres this is one join against the listed rows per `batch_size`
+    instances, where bulk_update builds a CASE WHEN per field and row that
+    grows slower to compile and plan with every row. Other databases fall
+    back to bulk_update.
+    """
+    connection = connections[router.db_for_write(model)]
+    if connection.vendor != "postgresql":
+        model._base_manager.bulk_update(  # noqa: SLF001
+            instances,
+            fields=field_names,
+            batch_size=batch_size,
+        )
+        return
+
+    opts = model._meta  # noqa: SLF001
+    columns = [opts.pk, *(opts.get_field(name) for name in field_names)]
+    quote = connection.ops.quote_name
+    table = quote(opts.db_table)
+    pk_column = quote(opts.pk.column)
+    assignments = ", ".join(
+        f"{quote(field.column)} = v.{quote(field.column)}" for field in columns[1:]
+    )
+    column_list = ", ".join(quote(field.column) for field in columns)
+    row = "({})".format(
+        ", ".join(f"%s::{field.db_type(connection)}" for field in columns),
+    )
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(instances), batch_size):
+            batch = instances[start : start + batch_size]
+            rows = ", ".join([row] * len(batch))
+            cursor.execute(
+                f"UPDATE {table} AS t SET {assignments} "  # noqa: S608
+                f"FROM (VALUES {rows}) AS v ({column_list}) "
+                f"WHERE t.{pk_column} = v.{pk_column}",
+                [
+                    field.get_db_prep_save(
+                        getattr(instance, field.attname),
+                        connection=connection,
+                    )
+                    for instance in batch
+                    for field in columns
+                ],
+            )
+
+
+def _model_derived_update(
+    *,
+    model: type[models.Model],
+    instances: list[models.Model],
+    field_names: set[str],
+) -> None:
+    """Write the fields save() would derive from field_names, if any."""
+    derive = getattr(model, "bulk_update_derived", None)
+    derived = derive(field_names) if derive else {}
+    if not derived:
+        return
+
+    model._base_manager.using(router.db_for_write(model)).filter(  # noqa: SLF001
+        pk__in=[instance.pk for instance in instances],
+    ).update(**derived)
+
+
+def _model_bulk_updated(
+    *,
+    model: type[models.Model],
+    instances: list[models.Model],
+) -> None:
+    """Stand in for post_save, then refresh the state save() would track."""
+    # Receivers compare against the state the instances were read with.
+    model_bulk_updated.send(sender=model, instances=instances)
+
+    for instance in instances:
+        if hasattr(instance, "track_db_state"):
+            instance.track_db_state()
+
+
+def model_bulk_update(  # noqa: UP047
+    *,
+    instances: Iterable[Model],
+    fields: list[str],
+    data: dict[Any, dict[str, Any]],
+    batch_size: int = 1000,
+) -> list[Model]:
+    """
+    Bulk update service for many instances of one model.
+
+    `data` maps instance pks to their incoming values, which are diffed like
+    model_update. All changed instances are validated before anything is
+    written: full_clean() without its per-instance queries, and one query
+    per changed foreign key. Errors of every instance are raised together,
+    keyed "<pk>.<field>". Uniqueness and constraints are left to the
+    database: a violation raises IntegrityError and writes nothing.
+
+    Changed instances are grouped by the set of fields that changed,
+    including fields that clean() derives from them, and each group is
+    written with one UPDATE per `batch_size` rows. As with
+    QuerySet.bulk_update, save() and post_save are skipped; model_bulk_updated
+    is sent instead, so receivers can invalidate what post_save would.
+    Models whose save() derives fields declare them with a
+    `bulk_update_derived(fields)` classmethod returning expressions, which
+    are written with one more UPDATE per group.
+    Models that remember their stored state in save() do so through a
+    `track_db_state()` method, called once the signal is sent.
+
+    Returns the instances that changed.
+    """
+    changes: dict[Model, set[str]] = {}
+    for instance in instances:
+        changed_fields = _model_diff(
+            instance=instance,
+            fields=fields,
+            data=data.get(instance.pk, {}),
+        )
+        if changed_fields:
+            changes[instance] = changed_fields
+
+    if not changes:
+        return []
+
+    model = type(next(iter(changes)))
+    errors = {}
+    for instance, changed_fields in changes.items():
+        try:
+            changed_fields.update(_model_clean(instance=instance))
+        except ValidationError as exc:
+            for field, messages in exc.message_dict.items():
+                errors[f"{instance.pk}.{field}"] = messages
+
+    errors.update(_foreign_keys_validate(model=model, changes=changes))
+    if errors:
+        raise ValidationError(errors)
+
+    groups = defaultdict(list)
+    for instance, changed_fields in changes.items():
+        groups[frozenset(changed_fields)].append(instance)
+
+    with transaction.atomic():
+        for changed_fields, group in groups.items():
+            _model_values_update(
+                model=model,
+                instances=group,
+                field_names=sorted(changed_fields),
+                batch_size=batch_size,
+            )
+            _model_derived_update(
+                model=model,
+                instances=group,
+                field_names=set(changed_fields),
+            )
+
+    updated = list(changes)
+    _model_bulk_updated(model=model, instances=updated)
+
+    return updated
@@ -0,0 +1,23 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from breemind_back.common.metrics import metrics_record_query
+from breemind_back.common.routers import replica_record_write
+
+
+@receiver(connection_created)
+def connection_count_queries(sender, connection, **kwargs):
+    """Count the queries of each request for the metrics, on every connection."""
+    if metrics_record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(metrics_record_query)
+
+
+@receiver(connection_created)
+def connection_track_writes(sender, connection, **kwargs):
+    """Note which requests wrote to the primary, for the replica router."""
+    if (
+        connection.alias == DEFAULT_DB_ALIAS
+        and replica_record_write not in connection.execute_wrappers
+    ):
+        connection.execute_wrappers.append(replica_record_write)
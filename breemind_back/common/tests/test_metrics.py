@@ -0,0 +1,114 @@
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+import redis
+from django.urls import reverse
+
+from breemind_back.common import metrics
+from breemind_back.common.metrics import RequestStats
+from breemind_back.common.metrics import metrics_collect
+from breemind_back.common.metrics import metrics_flush
+from breemind_back.common.metrics import metrics_record_request
+from breemind_back.common.metrics import metrics_render
+from breemind_back.common.metrics import metrics_reset
+from breemind_back.users.services import user_issue_tokens
+from breemind_back.users.tests.factories import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics_reset()
+    yield
+    metrics_reset()
+
+
+def _samples(text):
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if line[0] != "#")
+
+
+def _record(*, view="api:care-agenda", duration=0.02, queries=2):
+    stats = RequestStats()
+    stats.queries = queries
+    metrics_record_request(
+        view=view,
+        method="GET",
+        status=200,
+        duration=duration,
+        stats=stats,
+        response_bytes=100,
+    )
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_reports_requests_per_view(client):
+    doctor = UserFactory()
+    access_token = user_issue_tokens(user=doctor)["access_token"]
+    client.get(
+        reverse("api:user-me"),
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+    client.force_login(UserFactory(is_staff=True))
+    response = client.get(reverse("metrics"))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(response.content.decode())
+    labels = 'view="api:user-me",method="GET",status="200"'
+    assert samples[f"http_request_duration_seconds_count{{{labels}}}"] == "1"
+    assert int(samples[f"http_request_db_queries_total{{{labels}}}"]) > 0
+    assert int(samples[f"http_request_cache_misses_total{{{labels}}}"]) > 0
+    assert int(samples[f"http_response_size_bytes_total{{{labels}}}"]) > 0
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_is_for_staff_only(client):
+    client.force_login(UserFactory(is_staff=False))
+
+    assert client.get(reverse("metrics")).status_code == HTTPStatus.FORBIDDEN
+
+
+def test_render_cumulative_histogram_with_escaped_labels():
+    _record(view='odd "view"\\', duration=0.02)
+    _record(view='odd "view"\\', duration=0.3)
+
+    samples = _samples(metrics_render(metrics_collect()))
+
+    labels = r'view="odd \"view\"\\",method="GET",status="200"'
+    assert samples[f'http_request_duration_seconds_bucket{{{labels},le="0.01"}}'] == "0"
+    assert (
+        samples[f'http_request_duration_seconds_bucket{{{labels},le="0.025"}}'] == "1"
+    )
+    assert samples[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == "2"
+    assert samples[f"http_request_db_queries_total{{{labels}}}"] == "4"
+
+
+def test_workers_merge_through_redis(settings, monkeypatch):
+    try:
+        redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=0.1).ping()
+    except redis.RedisError:
+        pytest.skip("Redis is not reachable at REDIS_URL")
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": settings.REDIS_URL,
+        },
+    }
+    monkeypatch.setattr(metrics, "REDIS_KEY", f"test:metrics:{uuid4().hex}")
+
+    _record()
+    metrics_flush()
+    _record()
+    metrics_flush()  # Only the second request is new.
+    metrics_reset()  # Another worker, with its own counts.
+    _record()
+
+    try:
+        samples = _samples(metrics_render(metrics_collect()))
+    finally:
+        redis.Redis.from_url(settings.REDIS_URL).delete(metrics.REDIS_KEY)
+
+    labels = 'view="api:care-agenda",method="GET",status="200"'
+    assert samples[f"http_request_duration_seconds_count{{{labels}}}"] == "3"
+    assert samples[f"http_request_db_queries_total{{{labels}}}"] == "6"
@@ -0,0 +1,170 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from breemind_back.care.models import Patient
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.common.pagination import KeysetPagination
+from breemind_back.common.pagination import LimitOffsetPagination
+
+pytestmark = pytest.mark.django_db
+
+
+def _paginate(url):
+    paginator = KeysetPagination()
+    request = Request(APIRequestFactory().get(url))
+    page = paginator.paginate_queryset(Patient.objects.all(), request)
+    return paginator, page
+
+
+@pytest.fixture
+def patients():
+    now = timezone.now()
+    # Two patients share a created_at to exercise the id tie-breaker.
+    return [
+        PatientFactory(created_at=now - timedelta(minutes=minute))
+        for minute in [0, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    ]
+
+
+def test_walks_forward_and_back_without_gaps(patients):
+    expected = sorted(patients, key=lambda p: (p.created_at, p.id), reverse=True)
+
+    seen = []
+    url = "/patients/?limit=5"
+    pages = []
+    while url:
+        paginator, page = _paginate(url)
+        pages.append(page)
+        seen.extend(page)
+        url = paginator.get_next_link()
+
+    assert seen == expected
+    assert [len(page) for page in pages] == [5, 5, 2]
+
+
+def test_previous_link_returns_preceding_page(patients):
+    first_paginator, first_page = _paginate("/patients/?limit=4")
+    second_paginator, _ = _paginate(first_paginator.get_next_link())
+
+    back_paginator, back_page = _paginate(second_paginator.get_previous_link())
+
+    assert back_page == first_page
+    assert back_paginator.get_previous_link() is None
+    assert back_paginator.get_next_link() is not None
+
+
+def test_page_query_has_no_count_or_offset(patients, django_assert_num_queries):
+    first_paginator, _ = _paginate("/patients/?limit=4")
+
+    with django_assert_num_queries(1) as captured:
+        _paginate(first_paginator.get_next_link())
+
+    sql = captured.captured_queries[0]["sql"].upper()
+    assert "COUNT(" not in sql
+    assert "OFFSET" not in sql
+
+
+def test_invalid_cursor():
+    with pytest.raises(NotFound):
+        _paginate("/patients/?cursor=not-a-cursor")
+
+
+def _paginate_limit_offset(url, queryset=None):
+    paginator = LimitOffsetPagination()
+    request = Request(APIRequestFactory().get(url))
+    queryset = Patient.objects.order_by("id") if queryset is None else queryset
+    page = paginator.paginate_queryset(queryset, request)
+    return paginator.get_paginated_data(page)
+
+
+@pytest.fixture
+def _empty_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.usefixtures("_empty_cache")
+def test_limit_offset_caches_exact_count(patients, django_assert_num_queries):
+    data = _paginate_limit_offset("/patients/?limit=5")
+
+    assert data["count"] == len(patients)
+    assert data["count_exact"] is True
+    assert data["next"] is not None
+
+    with django_assert_num_queries(1) as captured:
+        _paginate_limit_offset("/patients/?limit=5&offset=5")
+    assert "COUNT(" not in captured.captured_queries[0]["sql"].upper()
+
+
+@pytest.mark.usefixtures("_empty_cache")
+def test_limit_offset_fetches_rows_past_a_cached_count(patients):
+    _paginate_limit_offset("/patients/?limit=5&offset=10")
+    added = PatientFactory()
+
+    data = _paginate_limit_offset("/patients/?limit=5&offset=12")
+
+    assert data["count"] == len(patients)
+    assert data["results"] == [added]
+
+
+@pytest.mark.usefixtures("_empty_cache")
+def test_limit_offset_skips_count_on_request(patients, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        data = _paginate_limit_offset("/patients/?limit=5&offset=10&count=false")
+
+    assert data["count"] is None
+    assert data["count_exact"] is False
+    assert len(data["results"]) == len(patients) - 10
+    assert data["next"] is None
+
+
+@pytest.mark.usefixtures("_empty_cache")
+def test_limit_offset_estimates_large_counts(patients, settings):
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE care_patient")
+    settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD = 0
+
+    data = _paginate_limit_offset("/patients/?limit=5")
+    assert data["count"] == len(patients)
+    assert data["count_exact"] is False
+    assert data["next"] is not None
+
+
+@pytest.mark.usefixtures("_empty_cache")
+def test_limit_offset_counts_filtered_querysets_exactly(
+    patients,
+    settings,
+    django_assert_num_queries,
+):
+    settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD = 0
+    filtered = Patient.objects.filter(
+        id__in=[patient.id for patient in patients[:7]],
+    ).order_by("id")
+
+    # COUNT(*) and the page, without asking the planner first.
+    with django_assert_num_queries(2):
+        data = _paginate_limit_offset("/patients/?limit=5", queryset=filtered)
+
+    assert data["count"] == 7  # noqa: PLR2004
+    assert data["count_exact"] is True
+
+
+@pytest.mark.usefixtures("_empty_cache")
+def test_limit_offset_counts_empty_querysets(django_assert_num_queries):
+    with django_assert_num_queries(0):
+        data = _paginate_limit_offset(
+            "/patients/?limit=5",
+            queryset=Patient.objects.none(),
+        )
+
+    assert data["count"] == 0
+    assert data["count_exact"] is True
+    assert data["results"] == []
@@ -0,0 +1,60 @@
+import json
+import uuid
+from datetime import UTC
+from datetime import datetime
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from breemind_back.common import parsers
+from breemind_back.common import renderers
+from breemind_back.common.parsers import FastJSONParser
+from breemind_back.common.renderers import FastJSONRenderer
+
+PAYLOAD = {
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "at": datetime(2026, 10, 17, 9, 30, tzinfo=UTC),
+    "fee": Decimal("1250.50"),
+    "label": gettext_lazy("Follow-up"),
+    "slots": {1: "morning"},
+    "results": [{"name": "Asha", "active": True, "score": None}],
+}
+
+
+def test_renders_same_json_as_drf():
+    rendered = FastJSONRenderer().render(PAYLOAD)
+
+    assert json.loads(rendered) == json.loads(JSONRenderer().render(PAYLOAD))
+    assert b'"2026-10-17T09:30:00Z"' in rendered
+
+
+def test_renders_indented_json_with_drf():
+    rendered = FastJSONRenderer().render(PAYLOAD, "application/json; indent=2")
+
+    assert rendered == JSONRenderer().render(PAYLOAD, "application/json; indent=2")
+
+
+def test_falls_back_to_drf_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+    monkeypatch.setattr(parsers, "orjson", None)
+
+    rendered = FastJSONRenderer().render(PAYLOAD)
+
+    assert rendered == JSONRenderer().render(PAYLOAD)
+    assert FastJSONParser().parse(BytesIO(rendered))["fee"] == float(PAYLOAD["fee"])
+
+
+def test_parses_json():
+    parser = FastJSONParser()
+
+    assert parser.parse(BytesIO(b'{"email": "asha@example.com"}')) == {
+        "email": "asha@example.com",
+    }
+    with pytest.raises(ParseError):
+        parser.parse(BytesIO(b'{"email": '))
+    with pytest.raises(ParseError):
+        parser.parse(BytesIO(b'{"score": NaN}'))
@@ -0,0 +1,96 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import connections
+from django.db import transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from breemind_back.care.models import Patient
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.common.routers import replica_reads
+from breemind_back.common.routers import replica_view_started
+from breemind_back.users.services import user_issue_tokens
+from breemind_back.users.tests.factories import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def _replica(settings):
+    # The "replica" alias of the test settings mirrors the test database.
+    settings.DATABASE_REPLICAS = ["replica"]
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_reads_go_to_replica_until_a_write():
+    assert Patient.objects.all().db == "default"
+
+    with replica_reads():
+        assert Patient.objects.all().db == "replica"
+        assert Session.objects.all().db == "default"
+
+        patient = PatientFactory()
+
+        assert patient._state.db == "default"  # noqa: SLF001
+        assert Patient.objects.all().db == "default"
+
+
+@pytest.mark.django_db
+def test_reads_in_atomic_blocks_of_view_go_to_primary():
+    def view(request):
+        pass
+
+    with replica_reads():
+        replica_view_started(view)
+
+        # The request's own ATOMIC_REQUESTS transaction.
+        with transaction.atomic():
+            assert Patient.objects.all().db == "replica"
+
+            with transaction.atomic():
+                assert Patient.objects.all().db == "default"
+
+
+@pytest.mark.django_db
+def test_reads_of_non_atomic_view_in_atomic_blocks_go_to_primary():
+    @transaction.non_atomic_requests
+    def view(request):
+        pass
+
+    with replica_reads():
+        replica_view_started(view)
+
+        with transaction.atomic():
+            assert Patient.objects.all().db == "default"
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+def test_user_is_pinned_to_primary_after_writing(client):
+    user, other_user = UserFactory.create_batch(2, is_staff=True)
+    PatientFactory(first_name="Ada")
+    url = reverse("api:care-patient-search")
+
+    def search_replica_queries(user):
+        access_token = user_issue_tokens(user=user)["access_token"]
+        with CaptureQueriesContext(connections["replica"]) as queries:
+            response = client.get(
+                url,
+                {"q": "Ada"},
+                HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()) == 1
+        return len(queries)
+
+    assert search_replica_queries(user) > 0
+
+    request = RequestFactory().post("/")
+    request.user = user
+    with replica_reads(request=request):
+        PatientFactory()
+
+    assert search_replica_queries(user) == 0
+    assert search_replica_queries(other_user) > 0
@@ -0,0 +1,72 @@
+import gzip
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+from breemind_back.common.schema import api_schema_document
+from breemind_back.common.schema import api_schema_generate
+from breemind_back.common.schema import api_schema_load
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_schema_cache():
+    api_schema_load.cache_clear()
+    api_schema_document.cache_clear()
+    yield
+    api_schema_load.cache_clear()
+    api_schema_document.cache_clear()
+
+
+def test_artifact_is_up_to_date():
+    artifact = Path(settings.API_SCHEMA_ARTIFACT)
+
+    assert artifact.read_bytes() == api_schema_generate(), (
+        "The OpenAPI schema artifact is stale, run `manage.py build_api_schema`."
+    )
+
+
+def test_build_api_schema_check_fails_when_stale(settings, tmp_path):
+    settings.API_SCHEMA_ARTIFACT = tmp_path / "openapi.json"
+
+    with pytest.raises(CommandError):
+        call_command("build_api_schema", "--check")
+
+    call_command("build_api_schema")
+    call_command("build_api_schema", "--check")
+
+
+def test_schema_is_served_gzipped_with_etag(admin_client):
+    response = admin_client.get(reverse("api-schema"), HTTP_ACCEPT_ENCODING="gzip")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["Content-Encoding"] == "gzip"
+    assert b"openapi" in gzip.decompress(response.content)
+
+    etag = response["ETag"]
+    response = admin_client.get(reverse("api-schema"), HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_schema_json_is_the_artifact(admin_client):
+    response = admin_client.get(reverse("api-schema"), {"format": "json"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert "Content-Encoding" not in response
+    assert response.content == Path(settings.API_SCHEMA_ARTIFACT).read_bytes()
+
+
+def test_schema_is_generated_when_artifact_is_missing(admin_client, settings, tmp_path):
+    settings.API_SCHEMA_ARTIFACT = tmp_path / "missing.json"
+
+    response = admin_client.get(reverse("api-schema"), {"format": "json"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.content == api_schema_generate()
@@ -0,0 +1,83 @@
+import pytest
+from django.utils import timezone
+from rest_framework import serializers
+
+from breemind_back.care.apis import AppointmentListApi
+from breemind_back.care.models import Appointment
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.common.serializers import ReadOnlySerializer
+from breemind_back.common.utils import inline_serializer
+from breemind_back.common.utils import inline_serializer_class
+
+
+class ItemSerializer(ReadOnlySerializer):
+    id = serializers.IntegerField()
+    label = serializers.CharField(source="get_label")
+    price = serializers.DecimalField(max_digits=5, decimal_places=2)
+    owner = serializers.CharField(source="owner.name", required=False)
+    tags = serializers.ListField(child=serializers.CharField())
+    summary = serializers.SerializerMethodField()
+
+    def get_summary(self, obj):
+        return f"#{obj['id'] if isinstance(obj, dict) else obj.id}"
+
+
+class Item:
+    id = 7
+    price = "1.5"
+    tags = ("a", 1)
+
+    def get_label(self):
+        return 42
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("tz", ["UTC", "Asia/Kolkata"])
+def test_read_only_serializer_matches_serializer(tz):
+    AppointmentFactory.create_batch(3)
+    appointments = list(Appointment.objects.select_related("patient"))
+    fields = AppointmentListApi.OutputSerializer._declared_fields  # noqa: SLF001
+
+    with timezone.override(tz):
+        expected = inline_serializer(fields=fields, instance=appointments, many=True)
+        output = AppointmentListApi.OutputSerializer(appointments, many=True)
+
+        assert output.data == expected.data
+
+
+def test_read_only_serializer_falls_back_to_fields():
+    item = Item()
+    mapping = {"id": 7, "get_label": 42, "price": 1.5, "tags": ["a", 1]}
+    expected = {
+        "id": 7,
+        "label": "42",
+        "price": "1.50",
+        "tags": ["a", "1"],
+        "summary": "#7",
+    }
+
+    assert ItemSerializer(item).data == expected
+    assert ItemSerializer(mapping).data == expected
+    assert ItemSerializer([item, mapping], many=True).data == [expected, expected]
+
+
+def test_inline_serializer_class_is_built_once_per_field_spec():
+    def spec():
+        return {"id": serializers.IntegerField(), "name": serializers.CharField()}
+
+    serializer_class = inline_serializer_class(fields=spec(), read_only=True)
+
+    assert inline_serializer_class(fields=spec(), read_only=True) is serializer_class
+    assert inline_serializer_class(fields=spec()) is not serializer_class
+    assert serializer_class({"id": 1, "name": "Asha"}).data == {
+        "id": 1,
+        "name": "Asha",
+    }
+
+
+def test_inline_serializer_accepts_positional_many_and_fields():
+    serializer = inline_serializer(True, {"id": serializers.IntegerField()})  # noqa: FBT003
+
+    assert isinstance(serializer, serializers.ListSerializer)
+    assert list(serializer.child.fields) == ["id"]
+    assert inline_serializer().data == {}
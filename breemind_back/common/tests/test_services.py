@@ -0,0 +1,145 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+from breemind_back.care.models import Appointment
+from breemind_back.care.models import Note
+from breemind_back.care.models import Patient
+from breemind_back.care.selectors import doctor_schedule_version_cache_key
+from breemind_back.care.selectors import note_search
+from breemind_back.care.tests.factories import AppointmentFactory
+from breemind_back.care.tests.factories import NoteFactory
+from breemind_back.care.tests.factories import PatientFactory
+from breemind_back.common.services import model_bulk_update
+from breemind_back.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_model_bulk_update_writes_one_update_per_field_set(
+    django_assert_num_queries,
+):
+    first, second, third, unchanged = PatientFactory.create_batch(4)
+    patients = list(Patient.objects.order_by("id"))
+
+    # Savepoint, one UPDATE per set of changed fields, release.
+    with django_assert_num_queries(4):
+        updated = model_bulk_update(
+            instances=patients,
+            fields=["first_name", "last_name"],
+            data={
+                first.pk: {"first_name": "Asha"},
+                second.pk: {"first_name": "Ravi", "last_name": second.last_name},
+                third.pk: {"first_name": "Mira", "last_name": "Rao"},
+                unchanged.pk: {"first_name": unchanged.first_name},
+            },
+        )
+
+    assert [patient.pk for patient in updated] == [first.pk, second.pk, third.pk]
+    assert list(
+        Patient.objects.order_by("id").values_list("first_name", "last_name"),
+    ) == [
+        ("Asha", first.last_name),
+        ("Ravi", second.last_name),
+        ("Mira", "Rao"),
+        (unchanged.first_name, unchanged.last_name),
+    ]
+
+
+def test_model_bulk_update_writes_fields_derived_in_clean():
+    appointment = AppointmentFactory()
+    new_start = appointment.scheduled_start_at + timedelta(days=1)
+
+    model_bulk_update(
+        instances=[Appointment.objects.get(pk=appointment.pk)],
+        fields=["scheduled_start_at"],
+        data={appointment.pk: {"scheduled_start_at": new_start}},
+    )
+
+    appointment.refresh_from_db()
+    assert appointment.scheduled_start_at == new_start
+    assert appointment.scheduled_range.lower == new_start
+
+
+def test_model_bulk_update_writes_fields_derived_in_save():
+    note = NoteFactory(content="Recurring migraines.")
+
+    model_bulk_update(
+        instances=[Note.objects.get(pk=note.pk)],
+        fields=["content"],
+        data={note.pk: {"content": "Lower back pain."}},
+    )
+
+    assert list(note_search(query="back pain")) == [note]
+    assert list(note_search(query="migraines")) == []
+
+
+def test_model_bulk_update_validates_every_instance_before_writing():
+    valid, invalid = AppointmentFactory.create_batch(2)
+
+    with pytest.raises(ValidationError) as exc_info:
+        model_bulk_update(
+            instances=list(Appointment.objects.order_by("id")),
+            fields=["status", "doctor_id"],
+            data={
+                valid.pk: {"status": Appointment.Status.COMPLETED},
+                invalid.pk: {"status": "UNKNOWN", "doctor_id": 0},
+            },
+        )
+
+    assert set(exc_info.value.message_dict) == {
+        f"{invalid.pk}.status",
+        f"{invalid.pk}.doctor",
+    }
+    assert list(Appointment.objects.values_list("status", flat=True)) == [
+        Appointment.Status.SCHEDULED,
+        Appointment.Status.SCHEDULED,
+    ]
+
+
+def test_model_bulk_update_invalidates_doctor_schedules(
+    user,
+    django_capture_on_commit_callbacks,
+):
+    moved, updated = AppointmentFactory.create_batch(2)
+    doctor_ids = {moved.doctor_id, updated.doctor_id, user.id}
+    keys = [
+        doctor_schedule_version_cache_key(doctor_id=doctor_id)
+        for doctor_id in doctor_ids
+    ]
+    cache.set_many(dict.fromkeys(keys, "before"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        model_bulk_update(
+            instances=list(Appointment.objects.order_by("id")),
+            fields=["doctor_id", "status"],
+            data={
+                moved.pk: {"doctor_id": user.id},
+                updated.pk: {"status": Appointment.Status.COMPLETED},
+            },
+        )
+
+    assert "before" not in cache.get_many(keys).values()
+
+
+def test_model_bulk_update_tracks_the_written_doctor(
+    user,
+    django_capture_on_commit_callbacks,
+):
+    appointment = Appointment.objects.get(pk=AppointmentFactory().pk)
+    second_doctor = UserFactory()
+
+    for doctor in (second_doctor, user):
+        key = doctor_schedule_version_cache_key(doctor_id=appointment.doctor_id)
+        cache.set(key, "before")
+        with django_capture_on_commit_callbacks(execute=True):
+            model_bulk_update(
+                instances=[appointment],
+                fields=["doctor_id"],
+                data={appointment.pk: {"doctor_id": doctor.id}},
+            )
+        # The doctor it moved away from, not the one it was first read with.
+        assert cache.get(key) != "before"
+        assert appointment._doctor_id_in_db == doctor.id  # noqa: SLF001
@@ -0,0 +1,47 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from breemind_back.common.management.commands.benchmark_startup import measure_startup
+
+# Cold start of an API-only worker, up to its first response. It takes about
+# 0.9s on a developer laptop. Checked with `pytest -m benchmark` only, as
+# shared runners are too noisy for a wall-clock budget.
+STARTUP_BUDGET_MS = 2500
+
+
+@pytest.fixture
+def production_env(monkeypatch):
+    monkeypatch.setenv("DJANGO_SECRET_KEY", "startup-benchmark")
+    monkeypatch.setenv("DJANGO_ADMIN_URL", "admin/")
+
+
+def test_api_profile_skips_server_rendered_apps(production_env):
+    profile = measure_startup(
+        settings_module="config.settings.api",
+        path="/api/users/me/",
+    )
+
+    assert profile["status"] == "403 Forbidden"
+    assert not {"allauth", "anymail", "crispy_forms", "fido2"} & set(
+        profile["packages"],
+    )
+
+
+@pytest.mark.benchmark
+def test_api_profile_starts_within_budget(production_env):
+    stdout = StringIO()
+
+    call_command(
+        "benchmark_startup",
+        "--settings-modules",
+        "config.settings.api",
+        "--runs",
+        "1",
+        "--budget-ms",
+        str(STARTUP_BUDGET_MS),
+        stdout=stdout,
+    )
+
+    assert "config.settings.api: imports" in stdout.getvalue()
@@ -0,0 +1,124 @@
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+import redis
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from breemind_back.common.throttling import TokenBucketLimiter
+from breemind_back.common.throttling import fallback_limiter
+from breemind_back.common.throttling import rate_limit_hit
+
+
+@pytest.fixture(autouse=True)
+def _clear_fallback_limiter():
+    fallback_limiter.clear()
+
+
+def _redis_cache(location):
+    return {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": location,
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "IGNORE_EXCEPTIONS": True,
+                "SOCKET_CONNECT_TIMEOUT": 0.1,
+            },
+        },
+    }
+
+
+def test_token_bucket_limits_per_key():
+    limiter = TokenBucketLimiter()
+
+    assert limiter.hit(key="a", limit=2, window=60) is None
+    assert limiter.hit(key="a", limit=2, window=60) is None
+    assert 0 < limiter.hit(key="a", limit=2, window=60) <= 30  # noqa: PLR2004
+    assert limiter.hit(key="b", limit=2, window=60) is None
+
+
+def test_token_bucket_evicts_least_recently_used():
+    limiter = TokenBucketLimiter(max_keys=1)
+    limiter.hit(key="a", limit=1, window=60)
+    limiter.hit(key="b", limit=1, window=60)
+
+    assert limiter.hit(key="a", limit=1, window=60) is None
+
+
+def test_falls_back_to_buckets_when_redis_is_down(settings):
+    settings.CACHES = _redis_cache("redis://127.0.0.1:1/0")
+
+    assert rate_limit_hit(key="down", limit=1, window=60) is None
+    assert rate_limit_hit(key="down", limit=1, window=60) is not None
+
+
+def test_sliding_window_in_redis(settings):
+    try:
+        redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=0.1).ping()
+    except redis.RedisError:
+        pytest.skip("Redis is not reachable at REDIS_URL")
+    settings.CACHES = _redis_cache(settings.REDIS_URL)
+    key = f"test:{uuid4().hex}"
+
+    assert rate_limit_hit(key=key, limit=2, window=60) is None
+    assert rate_limit_hit(key=key, limit=2, window=60) is None
+    assert 59 < rate_limit_hit(key=key, limit=2, window=60) <= 60  # noqa: PLR2004
+    # Nothing went through the fallback.
+    assert fallback_limiter.hit(key=key, limit=1, window=60) is None
+
+
+@pytest.mark.django_db
+def test_login_is_throttled_by_email_before_any_query(client, settings):
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": {"auth_login_email": "1/min"},
+    }
+    data = {"email": "Someone@Example.com", "password": "wrong"}
+    client.post(reverse("api:auth-login"), data)
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.post(
+            reverse("api:auth-login"),
+            {**data, "email": "someone@example.com"},
+        )
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert int(response["Retry-After"]) > 0
+    # Only the ATOMIC_REQUESTS savepoint around the view.
+    assert all("SAVEPOINT" in query["sql"] for query in captured)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("num_proxies", "remote_addrs", "forwarded_for"),
+    [
+        (0, ["10.0.0.1", "10.0.0.1"], ["1.1.1.1", "2.2.2.2"]),
+        (1, ["10.0.0.1", "10.0.0.2"], ["1.1.1.1, 9.9.9.9", "2.2.2.2, 9.9.9.9"]),
+    ],
+)
+def test_spoofed_forwarded_for_shares_the_clients_bucket(
+    client,
+    settings,
+    num_proxies,
+    remote_addrs,
+    forwarded_for,
+):
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "NUM_PROXIES": num_proxies,
+        "DEFAULT_THROTTLE_RATES": {"auth_login_ip": "1/min"},
+    }
+    statuses = [
+        client.post(
+            reverse("api:auth-login"),
+            {"email": f"{uuid4().hex}@example.com", "password": "wrong"},
+            REMOTE_ADDR=remote_addr,
+            HTTP_X_FORWARDED_FOR=header,
+        ).status_code
+        for remote_addr, header in zip(remote_addrs, forwarded_for, strict=True)
+    ]
+
+    assert statuses[-1] == HTTPStatus.TOO_MANY_REQUESTS
@@ -0,0 +1,184 @@
+"""
+Sliding-window rate limiting.
+
+Hits are counted in a Redis sorted set per key by one atomic Lua script, so
+limits hold across every web worker. When the cache is not Redis, or Redis is
+unreachable (django_redis IGNORE_EXCEPTIONS would otherwise let every request
+through), an in-process token bucket enforces the same rate per process.
+"""
+
+import hashlib
+import logging
+import secrets
+import threading
+from time import monotonic
+
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: window key. ARGV: limit, window in ms, unique member.
+# Returns {1, 0} when allowed, {0, ms until a slot frees up} otherwise.
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local time = redis.call("TIME")
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - window)
+if redis.call("ZCARD", KEYS[1]) >= limit then
+    local oldest = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+    return {0, tonumber(oldest[2]) + window - now}
+end
+
+redis.call("ZADD", KEYS[1], now, ARGV[3])
+redis.call("PEXPIRE", KEYS[1], window)
+return {1, 0}
+"""
+
+RATE_PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24}
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Parse a DRF style "<hits>/<period>" rate into (hits, seconds)."""
+    hits, period = rate.split("/")
+    return int(hits), RATE_PERIODS[period[0]]
+
+
+class TokenBucketLimiter:
+    """
+    In-process token buckets, least recently used ones evicted past max_keys.
+
+    Each bucket holds up to `limit` tokens and refills at limit / window per
+    second, which allows the same long-run rate as the sliding window.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def hit(self, *, key: str, limit: int, window: int) -> float | None:
+        now = monotonic()
+        refill_rate = limit / window
+
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (limit, now))
+            tokens = min(limit, tokens + (now - updated_at) * refill_rate)
+
+            wait = None
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / refill_rate
+
+            # Re-inserting keeps the dict ordered by last use.
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                del self._buckets[next(iter(self._buckets))]
+
+        return wait
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+fallback_limiter = TokenBucketLimiter()
+
+
+def redis_client():
+    # Only django_redis caches expose the raw client.
+    get_client = getattr(getattr(cache, "client", None), "get_client", None)
+    return get_client(write=True) if get_client else None
+
+
+def rate_limit_hit(*, key: str, limit: int, window: int) -> float | None:
+    """
+    Count a hit against `key`, allowing `limit` hits per `window` seconds.
+
+    Returns None if the hit is allowed, or the seconds to wait otherwise.
+    """
+    client = redis_client()
+    if client is not None:
+        # Only imported once a Redis cache is in use.
+        from redis.exceptions import RedisError  # noqa: PLC0415
+
+        try:
+            allowed, wait_ms = client.register_script(SLIDING_WINDOW_SCRIPT)(
+                keys=[f"ratelimit:{key}"],
+                args=[limit, window * 1000, secrets.token_hex(8)],
+            )
+        except RedisError:
+            logger.warning("Rate limiting falls back to in-process buckets")
+        else:
+            return None if allowed else wait_ms / 1000
+
+    return fallback_limiter.hit(key=key, limit=limit, window=window)
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    Base for scoped sliding-window throttles.
+
+    Views opt in with `throttle_scope`; the rate of each throttle comes from
+    REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]["<scope>_<kind>"], and a missing
+    rate disables that throttle for the view. Throttles run in
+    APIView.initial(), before the handler validates input or touches the DB.
+    """
+
+    kind: str
+
+    def get_ident_value(self, request) -> str | None:
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        self._wait = None
+
+        scope = getattr(view, "throttle_scope", None)
+        if scope is None:
+            return True
+
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(f"{scope}_{self.kind}")
+        if rate is None:
+            return True
+
+        ident = self.get_ident_value(request)
+        if not ident:
+            return True
+
+        limit, window = parse_rate(rate)
+        self._wait = rate_limit_hit(
+            key=f"{scope}:{self.kind}:{ident}",
+            limit=limit,
+            window=window,
+        )
+        return self._wait is None
+
+    def wait(self):
+        return self._wait
+
+
+class IPSlidingWindowThrottle(SlidingWindowThrottle):
+    """Throttle by client IP address."""
+
+    kind = "ip"
+
+    def get_ident_value(self, request):
+        return self.get_ident(request)
+
+
+class EmailSlidingWindowThrottle(SlidingWindowThrottle):
+    """Throttle by the `email` in the request body, whoever sends it."""
+
+    kind = "email"
+
+    def get_ident_value(self, request):
+        data = request.data
+        email = data.get("email") if hasattr(data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        # Keep addresses out of cache keys.
+        return hashlib.sha256(email.strip().lower().encode()).hexdigest()
@@ -1,6 +1,15 @@
+from __future__ import annotations
+
+import typing
+
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 
+if typing.TYPE_CHECKING:
+    from rest_framework import serializers
+
+_inline_serializers: dict[tuple, type[serializers.Serializer]] = {}
+
 
 def get_object(model_or_queryset, **kwargs):
     try:
@@ -9,17 +18,47 @@ def get_object(model_or_queryset, **kwargs):
         return None
 
 
-def inline_serializer(many=False, fields=None):
-    """inline serializer."""
-    from rest_framework import serializers
+def inline_serializer_class(
+    *,
+    fields: dict[str, serializers.Field],
+    name: str = "InlineSerializer",
+    read_only: bool = False,
+) -> type[serializers.Serializer]:
+    """
+    Serializer class with the given fields, built once per field spec.
+
+    Fields are compared by class and arguments, so calls with equal specs
+    share one class, and with read_only, one ReadOnlySerializer plan.
+    """
+    from rest_framework import serializers  # noqa: PLC0415
 
-    if fields is None:
-        fields = {}
+    from breemind_back.common.serializers import ReadOnlySerializer  # noqa: PLC0415
 
-    class InlineSerializer(serializers.Serializer):
-        pass
+    key = (
+        name,
+        read_only,
+        tuple((field_name, repr(field)) for field_name, field in fields.items()),
+    )
+    serializer_class = _inline_serializers.get(key)
+    if serializer_class is None:
+        base = ReadOnlySerializer if read_only else serializers.Serializer
+        serializer_class = type(name, (base,), dict(fields))
+        _inline_serializers[key] = serializer_class
+    return serializer_class
 
-    for field_name, field_type in fields.items():
-        setattr(InlineSerializer, field_name, field_type)
 
-    return InlineSerializer(many=many)
+def inline_serializer(
+    many=False,  # noqa: FBT002
+    fields=None,
+    *,
+    name: str = "InlineSerializer",
+    read_only: bool = False,
+    **kwargs,
+) -> serializers.Serializer:
+    """inline serializer, built through inline_serializer_class(...)."""
+    serializer_class = inline_serializer_class(
+        fields=fields or {},
+        name=name,
+        read_only=read_only,
+    )
+    return serializer_class(many=many, **kwargs)
@@ -0,0 +1,50 @@
+from inspect import iscoroutinefunction
+
+from adrf.views import APIView as _AsyncAPIView
+from adrf.viewsets import GenericViewSet as _AsyncGenericViewSet
+from django.db import connections
+from django.db import transaction
+
+
+class AsyncAPIView(_AsyncAPIView):
+    """
+    APIView whose handlers may be coroutines.
+
+    Authentication, permissions and throttling still run in a thread; async
+    handlers then run on the event loop and must only use the async ORM or
+    wrap sync calls in `sync_to_async`. ATOMIC_REQUESTS cannot wrap async
+    views, so these opt out of it: writes go through services, which open
+    their own transactions.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
+
+
+class AsyncGenericViewSet(_AsyncGenericViewSet):
+    """
+    GenericViewSet counterpart of AsyncAPIView, for viewsets with async actions.
+
+    One async action makes every route of the viewset async and opts it out
+    of ATOMIC_REQUESTS, so sync actions, e.g. the update mixins, are wrapped
+    in the transactions ATOMIC_REQUESTS would have given them instead.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        return transaction.non_atomic_requests(
+            super().as_view(actions, **initkwargs),
+        )
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        method = request.method.lower()
+        handler = getattr(self, method, None)
+        if handler is None or iscoroutinefunction(handler):
+            return
+        for connection in connections.all(initialized_only=False):
+            if connection.settings_dict["ATOMIC_REQUESTS"]:
+                handler = transaction.atomic(using=connection.alias)(handler)
+        setattr(self, method, handler)
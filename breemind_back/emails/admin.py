@@ -0,0 +1,23 @@
+from django.contrib import admin
+
+from .models import Email
+
+
+@admin.register(Email)
+class EmailAdmin(admin.ModelAdmin):
+    list_display = ("id", "to", "subject", "status", "attempts", "sent_at")
+    list_filter = ("status",)
+    search_fields = ("to", "subject")
+    readonly_fields = (
+        "sensitive",
+        "attempts",
+        "claimed_at",
+        "sent_at",
+        "last_error",
+    )
+
+    def get_exclude(self, request, obj=None):
+        # Bodies of sensitive emails carry secrets until they are blanked.
+        if obj is not None and obj.sensitive:
+            return ("plain_text", "html")
+        return super().get_exclude(request, obj)
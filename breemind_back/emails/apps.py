@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class EmailsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "breemind_back.emails"
+    verbose_name = "Emails"
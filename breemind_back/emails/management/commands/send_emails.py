@@ -0,0 +1,41 @@
+from time import sleep
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from breemind_back.emails.services import email_send_batch
+
+
+class Command(BaseCommand):
+    help = "Deliver queued emails in batches, one mail connection per batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAILS_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when nothing is due.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once nothing is due instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            claimed = email_send_batch(batch_size=options["batch_size"])
+            if claimed:
+                self.stdout.write(f"Processed {claimed} emails")
+                continue
+
+            if options["once"]:
+                return
+            sleep(options["poll_interval"])
@@ -0,0 +1,55 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+from breemind_back.users.models import BaseModel
+
+
+class Email(BaseModel):
+    """
+    Outbox row for one outgoing email.
+
+    Rows are written in the transaction of whatever triggered them and are
+    delivered later by `manage.py send_emails`.
+    """
+
+    class Status(models.TextChoices):
+        READY = "READY", "Ready"
+        SENDING = "SENDING", "Sending"
+        SENT = "SENT", "Sent"
+        FAILED = "FAILED", "Failed"
+
+    to = models.EmailField()
+    subject = models.CharField(max_length=255)
+    plain_text = models.TextField()
+    html = models.TextField(blank=True)
+    # Bodies carrying secrets, e.g. tokens, are blanked once delivered.
+    sensitive = models.BooleanField(default=False)
+
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.READY,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at", "id"],
+                condition=Q(status="READY"),
+                name="email_ready_due",
+            ),
+            models.Index(
+                fields=["claimed_at"],
+                condition=Q(status="SENDING"),
+                name="email_sending_claimed",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.subject} to {self.to}"
@@ -0,0 +1,148 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail import get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from breemind_back.emails.models import Email
+
+
+def email_queue(
+    *,
+    to: str,
+    subject: str,
+    plain_text: str,
+    html: str = "",
+    sensitive: bool = False,
+) -> Email:
+    """
+    Queue an email for delivery.
+
+    The outbox row joins the caller's transaction, so the email goes out only
+    if the caller commits, and no request ever waits on the mail server.
+    The body of a sensitive email is blanked once it is sent or fails.
+    """
+    email = Email(
+        to=to,
+        subject=subject,
+        plain_text=plain_text,
+        html=html,
+        sensitive=sensitive,
+    )
+    email.full_clean()
+    email.save()
+
+    return email
+
+
+@transaction.atomic
+def email_claim_batch(*, batch_size: int) -> list[Email]:
+    """
+    Claim up to batch_size due emails for sending.
+
+    Rows locked by another worker are skipped, and emails stuck in SENDING
+    past settings.EMAILS_CLAIM_TIMEOUT are claimed again.
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.EMAILS_CLAIM_TIMEOUT)
+
+    emails = list(
+        Email.objects.select_for_update(skip_locked=True)
+        .filter(
+            Q(status=Email.Status.READY, next_attempt_at__lte=now)
+            | Q(status=Email.Status.SENDING, claimed_at__lt=stale),
+        )
+        .order_by("next_attempt_at", "id")[:batch_size],
+    )
+    Email.objects.filter(id__in=[email.id for email in emails]).update(
+        status=Email.Status.SENDING,
+        claimed_at=now,
+    )
+
+    for email in emails:
+        email.status = Email.Status.SENDING
+        email.claimed_at = now
+
+    return emails
+
+
+def _email_schedule_retry(*, email: Email, error: Exception, now) -> None:
+    email.attempts += 1
+    email.last_error = f"{type(error).__name__}: {error}"
+
+    if email.attempts >= settings.EMAILS_MAX_ATTEMPTS:
+        email.status = Email.Status.FAILED
+        return
+
+    backoff = min(
+        settings.EMAILS_RETRY_BACKOFF * 2 ** (email.attempts - 1),
+        settings.EMAILS_RETRY_BACKOFF_MAX,
+    )
+    email.status = Email.Status.READY
+    email.next_attempt_at = now + timedelta(seconds=backoff)
+
+
+def email_send_batch(*, batch_size: int | None = None) -> int:
+    """
+    Claim and send one batch of due emails over a single mail connection.
+
+    Failed emails are retried with exponential backoff. Delivery is at least
+    once: a worker dying mid-batch gets its emails re-sent after the claim
+    times out. Returns the number of emails claimed.
+    """
+    emails = email_claim_batch(batch_size=batch_size or settings.EMAILS_BATCH_SIZE)
+    if not emails:
+        return 0
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:  # noqa: BLE001
+        # The whole batch waits for the mail server to come back.
+        now = timezone.now()
+        for email in emails:
+            _email_schedule_retry(email=email, error=exc, now=now)
+    else:
+        try:
+            for email in emails:
+                message = EmailMultiAlternatives(
+                    subject=email.subject,
+                    body=email.plain_text,
+                    to=[email.to],
+                    connection=connection,
+                )
+                if email.html:
+                    message.attach_alternative(email.html, "text/html")
+
+                try:
+                    message.send()
+                except Exception as exc:  # noqa: BLE001
+                    _email_schedule_retry(email=email, error=exc, now=timezone.now())
+                else:
+                    email.status = Email.Status.SENT
+                    email.sent_at = timezone.now()
+        finally:
+            connection.close()
+
+    Email.objects.bulk_update(
+        emails,
+        fields=[
+            "status",
+            "attempts",
+            "next_attempt_at",
+            "sent_at",
+            "last_error",
+        ],
+    )
+    Email.objects.filter(
+        id__in=[
+            email.id
+            for email in emails
+            if email.sensitive and email.status != Email.Status.READY
+        ],
+    ).update(plain_text="", html="")
+
+    return len(emails)
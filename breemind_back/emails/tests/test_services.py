@@ -0,0 +1,140 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from breemind_back.emails import services as email_services
+from breemind_back.emails.models import Email
+from breemind_back.emails.services import email_claim_batch
+from breemind_back.emails.services import email_queue
+from breemind_back.emails.services import email_send_batch
+
+pytestmark = pytest.mark.django_db
+
+
+def _queue(**kwargs):
+    return email_queue(
+        to=kwargs.pop("to", "patient@example.com"),
+        subject="Hello",
+        plain_text="Hello there",
+        **kwargs,
+    )
+
+
+def test_send_batch_delivers_due_emails():
+    sent = _queue(html="<p>Hello there</p>")
+    not_due = _queue()
+    Email.objects.filter(id=not_due.id).update(
+        next_attempt_at=timezone.now() + timedelta(minutes=5),
+    )
+
+    assert email_send_batch() == 1
+
+    assert [message.to for message in mail.outbox] == [[sent.to]]
+    assert mail.outbox[0].alternatives[0].content == "<p>Hello there</p>"
+    sent.refresh_from_db()
+    assert sent.status == Email.Status.SENT
+    assert sent.sent_at is not None
+    not_due.refresh_from_db()
+    assert not_due.status == Email.Status.READY
+
+
+def test_send_batch_reuses_one_connection(monkeypatch):
+    for _ in range(3):
+        _queue()
+    connections = []
+    original_get_connection = email_services.get_connection
+
+    def get_connection():
+        connections.append(original_get_connection())
+        return connections[-1]
+
+    monkeypatch.setattr(email_services, "get_connection", get_connection)
+
+    assert email_send_batch() == 3  # noqa: PLR2004
+
+    assert len(connections) == 1
+    assert len(mail.outbox) == 3  # noqa: PLR2004
+
+
+def test_sensitive_bodies_are_blanked_once_sent():
+    sensitive = _queue(html="<p>Hello there</p>", sensitive=True)
+    kept = _queue()
+
+    email_send_batch()
+
+    assert mail.outbox[0].body == "Hello there"
+    sensitive.refresh_from_db()
+    assert (sensitive.plain_text, sensitive.html) == ("", "")
+    kept.refresh_from_db()
+    assert kept.plain_text == "Hello there"
+
+
+def test_admin_hides_sensitive_bodies(admin_client):
+    email = _queue(sensitive=True)
+
+    response = admin_client.get(
+        reverse("admin:emails_email_change", args=[email.id]),
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert "Hello there" not in response.content.decode()
+
+
+def test_unreachable_server_backs_off_then_fails(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+    settings.EMAIL_HOST = "127.0.0.1"
+    settings.EMAIL_PORT = 1
+    settings.EMAIL_TIMEOUT = 1
+    settings.EMAILS_MAX_ATTEMPTS = 2
+    email = _queue(sensitive=True)
+
+    email_send_batch()
+
+    email.refresh_from_db()
+    assert email.plain_text
+    assert email.status == Email.Status.READY
+    assert email.attempts == 1
+    assert email.next_attempt_at > timezone.now()
+    assert email.last_error
+    assert email_claim_batch(batch_size=10) == []
+
+    Email.objects.filter(id=email.id).update(next_attempt_at=timezone.now())
+    email_send_batch()
+
+    email.refresh_from_db()
+    assert email.status == Email.Status.FAILED
+    assert email.attempts == 2  # noqa: PLR2004
+    assert email.plain_text == ""
+
+
+def test_stale_claims_are_retried(settings):
+    email = _queue()
+    email_claim_batch(batch_size=10)
+    assert email_claim_batch(batch_size=10) == []
+
+    Email.objects.filter(id=email.id).update(
+        claimed_at=timezone.now()
+        - timedelta(seconds=settings.EMAILS_CLAIM_TIMEOUT + 1),
+    )
+
+    assert [claimed.id for claimed in email_claim_batch(batch_size=10)] == [email.id]
+
+
+# The worker closes connections between batches, which needs real transactions.
+@pytest.mark.django_db(transaction=True)
+def test_forgot_password_queues_reset_email(user, client):
+    response = client.post(reverse("api:auth-forgot-password"), {"email": user.email})
+
+    assert response.status_code == HTTPStatus.OK
+    assert "reset_token" not in response.json()
+    assert mail.outbox == []
+
+    call_command("send_emails", "--once")
+
+    assert [message.to for message in mail.outbox] == [[user.email]]
+    assert Email.objects.get().status == Email.Status.SENT
@@ -26,6 +26,7 @@ class UserAdmin(auth_admin.UserAdmin):
                 "fields": (
                     "is_active",
                     "is_staff",
+                    "is_clinician",
                     "is_superuser",
                     "groups",
                     "user_permissions",
@@ -34,5 +35,5 @@ class UserAdmin(auth_admin.UserAdmin):
         ),
         (_("Important dates"), {"fields": ("last_login", "date_joined")}),
     )
-    list_display = ["username", "name", "is_superuser"]
+    list_display = ["username", "name", "is_clinician", "is_superuser"]
     search_fields = ["name"]
@@ -4,14 +4,20 @@ from rest_framework.mixins import ListModelMixin
 from rest_framework.mixins import RetrieveModelMixin
 from rest_framework.mixins import UpdateModelMixin
 from rest_framework.response import Response
-from rest_framework.viewsets import GenericViewSet
 
+from breemind_back.common.views import AsyncGenericViewSet
+from breemind_back.users.authentication import TokenUser
 from breemind_back.users.models import User
 
 from .serializers import UserSerializer
 
 
-class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericViewSet):
+class UserViewSet(
+    RetrieveModelMixin,
+    ListModelMixin,
+    UpdateModelMixin,
+    AsyncGenericViewSet,
+):
     serializer_class = UserSerializer
     queryset = User.objects.all()
     lookup_field = "username"
@@ -21,6 +27,9 @@ class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericV
         return self.queryset.filter(id=self.request.user.id)
 
     @action(detail=False)
-    def me(self, request):
-        serializer = UserSerializer(request.user, context={"request": request})
+    async def me(self, request):
+        user = request.user
+        if isinstance(user, TokenUser):
+            user = await user.aload()
+        serializer = UserSerializer(user, context={"request": request})
         return Response(status=status.HTTP_200_OK, data=serializer.data)
@@ -1,26 +1,34 @@
+from asgiref.sync import sync_to_async
 from drf_spectacular.utils import extend_schema
 from rest_framework import permissions
 from rest_framework import serializers
 from rest_framework import status
-from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
-from breemind_back.users.selectors import user_get_by_email
-from breemind_back.users.services import user_authenticate
-from breemind_back.users.services import user_create
-from breemind_back.users.services import user_generate_email_verification_token
-from breemind_back.users.services import user_generate_password_reset_token
+from breemind_back.common.serializers import ReadOnlySerializer
+from breemind_back.common.throttling import EmailSlidingWindowThrottle
+from breemind_back.common.throttling import IPSlidingWindowThrottle
+from breemind_back.common.views import AsyncAPIView
+from breemind_back.users.selectors import user_aget_by_email
+from breemind_back.users.services import user_aauthenticate
+from breemind_back.users.services import user_aget_api_token
+from breemind_back.users.services import user_issue_tokens
+from breemind_back.users.services import user_logout
+from breemind_back.users.services import user_refresh_tokens
+from breemind_back.users.services import user_register
 from breemind_back.users.services import user_reset_password
+from breemind_back.users.services import user_send_password_reset_email
 from breemind_back.users.services import user_verify_email
 from breemind_back.users.services import user_verify_email_token
 from breemind_back.users.services import user_verify_password_reset_token
 
 
-class RegisterApi(APIView):
+class RegisterApi(AsyncAPIView):
     """Register API."""
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [IPSlidingWindowThrottle, EmailSlidingWindowThrottle]
+    throttle_scope = "auth_register"
 
     class InputSerializer(serializers.Serializer):
         email = serializers.EmailField()
@@ -28,7 +36,7 @@ class RegisterApi(APIView):
         username = serializers.CharField(min_length=3)
         name = serializers.CharField(required=False, allow_blank=True)
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(ReadOnlySerializer):
         id = serializers.IntegerField()
         email = serializers.EmailField()
         username = serializers.CharField()
@@ -38,63 +46,64 @@ class RegisterApi(APIView):
         request=InputSerializer,
         responses={201: OutputSerializer},
     )
-    def post(self, request):
+    async def post(self, request):
         """Register a new user."""
         serializer = self.InputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = user_create(**serializer.validated_data)
-
-        verification_token = user_generate_email_verification_token(user=user)
+        user = await sync_to_async(user_register)(**serializer.validated_data)
 
         output_serializer = self.OutputSerializer(user)
 
         return Response(
-            data={
-                "user": output_serializer.data,
-                "verification_token": verification_token,
-            },
+            data={"user": output_serializer.data},
             status=status.HTTP_201_CREATED,
         )
 
 
-class LoginApi(APIView):
+class LoginApi(AsyncAPIView):
     """Login API."""
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [IPSlidingWindowThrottle, EmailSlidingWindowThrottle]
+    throttle_scope = "auth_login"
 
     class InputSerializer(serializers.Serializer):
         email = serializers.EmailField()
         password = serializers.CharField(write_only=True)
 
-    class OutputSerializer(serializers.Serializer):
-        user = serializers.SerializerMethodField()
-        token = serializers.CharField()
-
-        def get_user(self, obj):
-            return {
-                "id": obj["user"].id,
-                "email": obj["user"].email,
-                "username": obj["user"].username,
-                "name": obj["user"].name,
-            }
+    class OutputSerializer(ReadOnlySerializer):
+        class UserSerializer(ReadOnlySerializer):
+            id = serializers.IntegerField()
+            email = serializers.EmailField()
+            username = serializers.CharField()
+            name = serializers.CharField()
+
+        user = UserSerializer()
+        token = serializers.CharField(
+            help_text=(
+                "Deprecated: DRF token for `Authorization: Token` headers. "
+                "Use access_token instead."
+            ),
+        )
+        access_token = serializers.CharField()
+        refresh_token = serializers.CharField()
 
     @extend_schema(
         request=InputSerializer,
         responses={200: OutputSerializer},
     )
-    def post(self, request):
+    async def post(self, request):
         """Authenticate a user."""
         serializer = self.InputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = user_authenticate(**serializer.validated_data)
-
-        token, created = Token.objects.get_or_create(user=user)
+        user = await user_aauthenticate(**serializer.validated_data)
 
         output_data = {
             "user": user,
-            "token": token.key,
+            "token": await user_aget_api_token(user=user),
+            **user_issue_tokens(user=user),
         }
 
         output_serializer = self.OutputSerializer(output_data)
@@ -102,7 +111,69 @@ class LoginApi(APIView):
         return Response(data=output_serializer.data, status=status.HTTP_200_OK)
 
 
-class VerifyEmailApi(APIView):
+class RefreshTokenApi(AsyncAPIView):
+    """Refresh token API."""
+
+    permission_classes = [permissions.AllowAny]
+
+    class InputSerializer(serializers.Serializer):
+        refresh_token = serializers.CharField()
+
+    class OutputSerializer(ReadOnlySerializer):
+        access_token = serializers.CharField()
+        refresh_token = serializers.CharField()
+
+    @extend_schema(
+        request=InputSerializer,
+        responses={200: OutputSerializer},
+    )
+    async def post(self, request):
+        """Exchange a refresh token for a new token pair."""
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        tokens = await sync_to_async(user_refresh_tokens)(
+            token=serializer.validated_data["refresh_token"],
+        )
+
+        output_serializer = self.OutputSerializer(tokens)
+
+        return Response(data=output_serializer.data, status=status.HTTP_200_OK)
+
+
+class LogoutApi(AsyncAPIView):
+    """Logout API."""
+
+    permission_classes = [permissions.AllowAny]
+
+    class InputSerializer(serializers.Serializer):
+        refresh_token = serializers.CharField()
+        everywhere = serializers.BooleanField(default=False)
+
+    class OutputSerializer(ReadOnlySerializer):
+        message = serializers.CharField()
+
+    @extend_schema(
+        request=InputSerializer,
+        responses={200: OutputSerializer},
+    )
+    async def post(self, request):
+        """Revoke a refresh token, or every token of its user."""
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        await sync_to_async(user_logout)(
+            token=serializer.validated_data["refresh_token"],
+            everywhere=serializer.validated_data["everywhere"],
+        )
+
+        return Response(
+            data={"message": "Logged out successfully"},
+            status=status.HTTP_200_OK,
+        )
+
+
+class VerifyEmailApi(AsyncAPIView):
     """Verify email API."""
 
     permission_classes = [permissions.AllowAny]
@@ -110,20 +181,22 @@ class VerifyEmailApi(APIView):
     class InputSerializer(serializers.Serializer):
         token = serializers.CharField()
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(ReadOnlySerializer):
         message = serializers.CharField()
 
     @extend_schema(
         request=InputSerializer,
         responses={200: OutputSerializer},
     )
-    def post(self, request):
+    async def post(self, request):
         """Verify user email."""
         serializer = self.InputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = user_verify_email_token(token=serializer.validated_data["token"])
-        user_verify_email(user=user)
+        user = await sync_to_async(user_verify_email_token)(
+            token=serializer.validated_data["token"],
+        )
+        await sync_to_async(user_verify_email)(user=user)
 
         return Response(
             data={"message": "Email verified successfully"},
@@ -131,35 +204,34 @@ class VerifyEmailApi(APIView):
         )
 
 
-class ForgotPasswordApi(APIView):
+class ForgotPasswordApi(AsyncAPIView):
     """Forgot password API."""
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [IPSlidingWindowThrottle, EmailSlidingWindowThrottle]
+    throttle_scope = "auth_forgot_password"
 
     class InputSerializer(serializers.Serializer):
         email = serializers.EmailField()
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(ReadOnlySerializer):
         message = serializers.CharField()
 
     @extend_schema(
         request=InputSerializer,
         responses={200: OutputSerializer},
     )
-    def post(self, request):
+    async def post(self, request):
         """Generate password reset token."""
         serializer = self.InputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = user_get_by_email(email=serializer.validated_data["email"])
+        user = await user_aget_by_email(email=serializer.validated_data["email"])
 
         if user:
-            reset_token = user_generate_password_reset_token(user=user)
+            await sync_to_async(user_send_password_reset_email)(user=user)
             return Response(
-                data={
-                    "message": "Password reset link sent to your email",
-                    "reset_token": reset_token,
-                },
+                data={"message": "Password reset link sent to your email"},
                 status=status.HTTP_200_OK,
             )
 
@@ -169,31 +241,33 @@ class ForgotPasswordApi(APIView):
         )
 
 
-class ResetPasswordApi(APIView):
+class ResetPasswordApi(AsyncAPIView):
     """Reset password API."""
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [IPSlidingWindowThrottle]
+    throttle_scope = "auth_reset_password"
 
     class InputSerializer(serializers.Serializer):
         token = serializers.CharField()
         new_password = serializers.CharField(write_only=True, min_length=8)
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(ReadOnlySerializer):
         message = serializers.CharField()
 
     @extend_schema(
         request=InputSerializer,
         responses={200: OutputSerializer},
     )
-    def post(self, request):
+    async def post(self, request):
         """Reset user password."""
         serializer = self.InputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = user_verify_password_reset_token(
+        user = await sync_to_async(user_verify_password_reset_token)(
             token=serializer.validated_data["token"],
         )
-        user_reset_password(
+        await sync_to_async(user_reset_password)(
             user=user,
             new_password=serializer.validated_data["new_password"],
         )
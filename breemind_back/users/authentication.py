@@ -0,0 +1,84 @@
+from functools import partial
+
+from django.utils.functional import SimpleLazyObject
+from django.utils.functional import empty
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.authentication import get_authorization_header
+
+from breemind_back.common.exceptions import AuthenticationError
+from breemind_back.users.selectors import user_aget_by_id
+from breemind_back.users.selectors import user_get_by_id
+from breemind_back.users.services import user_verify_access_token
+
+
+def _token_user_check(user):
+    if not user or not user.is_active:
+        msg = "User inactive or deleted."
+        raise exceptions.AuthenticationFailed(msg)
+    return user
+
+
+def _token_user_load(*, user_id):
+    return _token_user_check(user_get_by_id(id=user_id))
+
+
+class TokenUser(SimpleLazyObject):
+    """
+    User authenticated by a signed token.
+
+    `id`, `pk` and `is_authenticated` come from the token; the user row is
+    only fetched when anything else is read.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, user_id):
+        super().__init__(partial(_token_user_load, user_id=user_id))
+        self.__dict__["id"] = self.__dict__["pk"] = user_id
+
+    def __bool__(self):
+        # Permission checks start with `request.user and ...`.
+        return True
+
+    async def aload(self):
+        """Fetch the user row with the async ORM, for use in async views."""
+        if self._wrapped is empty:
+            user = await user_aget_by_id(id=self.__dict__["id"])
+            self._wrapped = _token_user_check(user)
+        return self._wrapped
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Authenticate `Authorization: Bearer <access token>` headers.
+
+    Access tokens are issued by users.services.user_issue_tokens and verified
+    without a database round-trip.
+    """
+
+    keyword = "Bearer"
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(auth) != 2:  # noqa: PLR2004
+            msg = "Invalid token header."
+            raise exceptions.AuthenticationFailed(msg)
+
+        try:
+            token = auth[1].decode()
+            user_id = user_verify_access_token(token=token)
+        except UnicodeError as exc:
+            msg = "Invalid token header."
+            raise exceptions.AuthenticationFailed(msg) from exc
+        except AuthenticationError as exc:
+            raise exceptions.AuthenticationFailed(exc.message) from exc
+
+        return TokenUser(user_id), token
+
+    def authenticate_header(self, request):
+        return self.keyword
@@ -0,0 +1,299 @@
+"""
+Read-through cache for user lookups by id, email and username.
+
+Lookups go through a per-request memo, then the shared cache, then the
+database. Entries by id are tagged with the user's version, which every
+save or delete of the user bumps, so an entry cached by a reader that raced
+a write is never served. Entries by email or username only map to an id and
+are checked against the user they resolve to. Misses are cached too, for
+USERS_CACHE_NEGATIVE_TIMEOUT seconds.
+
+Inside a transaction that changed a user, lookups skip the shared cache
+until it commits, so uncommitted rows never reach other processes.
+
+Rows are read from the primary: a replica lagging behind a write could
+otherwise cache a user under a version the row predates.
+
+Password hashes are left out of cached users and loaded on access, so the
+cache never holds credentials.
+
+Keys include a digest of the cached User columns, so a deploy that changes
+them starts from an empty cache instead of unpickling old instances.
+"""
+
+import functools
+import hashlib
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections
+from django.db import router
+from django.db import transaction
+from django.dispatch import Signal
+
+User = get_user_model()
+
+# Cached in place of an id for emails and usernames without a user.
+MISSING = "-"
+
+# Deferred on cached users; reading them costs a query.
+UNCACHED_FIELDS = ("password",)
+
+OUTCOMES = ("memo_hit", "hit", "negative_hit", "miss", "bypass")
+
+# Sent on every lookup with `field` and `outcome`, one of OUTCOMES.
+user_cache_accessed = Signal()
+
+_memo: ContextVar[dict | None] = ContextVar("users_cache_memo", default=None)
+_stats = Counter()
+
+
+@contextmanager
+def user_cache_memo():
+    """Memoize lookups in this context, e.g. for the length of a request."""
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def user_cache_stats() -> dict[str, Any]:
+    """Lookups of this process so far, by outcome, and their hit rate."""
+    stats = {outcome: _stats[outcome] for outcome in OUTCOMES}
+    lookups = sum(stats.values())
+    hits = stats["memo_hit"] + stats["hit"] + stats["negative_hit"]
+
+    return {**stats, "hit_rate": hits / lookups if lookups else None}
+
+
+def user_cache_stats_reset() -> None:
+    _stats.clear()
+
+
+def _record(*, field: str, outcome: str) -> None:
+    _stats[outcome] += 1
+    user_cache_accessed.send(sender=User, field=field, outcome=outcome)
+
+
+@functools.cache
+def _schema_version() -> str:
+    columns = ",".join(
+        field.column
+        for field in User._meta.concrete_fields  # noqa: SLF001
+        if field.name not in UNCACHED_FIELDS
+    )
+    return hashlib.sha256(columns.encode()).hexdigest()[:8]
+
+
+def _entry_key(*, field: str, value: Any) -> str:
+    if field != "id":
+        # Keep arbitrary strings out of cache keys.
+        value = hashlib.sha256(str(value).encode()).hexdigest()[:32]
+    return f"users:user:{_schema_version()}:{field}:{value}"
+
+
+def _version_key(*, user_id: int) -> str:
+    return f"users:user_version:{user_id}"
+
+
+def _bump(*, user_id: int, aliases: dict[str, str]) -> None:
+    version_key = _version_key(user_id=user_id)
+    if not cache.add(version_key, 1, timeout=None):
+        cache.incr(version_key)
+    cache.delete_many(
+        [_entry_key(field=field, value=value) for field, value in aliases.items()],
+    )
+
+
+def _transaction_changed_users() -> bool:
+    connection = connections[router.db_for_write(User)]
+    return any(
+        getattr(callback, "func", None) is _bump
+        for _, callback, _ in connection.run_on_commit
+    )
+
+
+def user_cache_invalidate(*, user: User) -> None:
+    """
+    Drop the cached lookups of user, now and once the transaction commits.
+
+    Called on every User save and delete, and by model_bulk_update; code
+    that changes users with QuerySet.update() or bulk_update() must call it
+    itself.
+    """
+    memo = _memo.get()
+    if memo is not None:
+        memo.clear()
+
+    aliases = {"email": user.email, "username": user.username}
+    _bump(user_id=user.pk, aliases=aliases)
+    transaction.on_commit(
+        functools.partial(_bump, user_id=user.pk, aliases=aliases),
+        using=router.db_for_write(User),
+    )
+
+
+def _users():
+    return User.objects.using(router.db_for_write(User)).defer(*UNCACHED_FIELDS)
+
+
+def _timeout(user: User | None) -> int:
+    if user is None:
+        return settings.USERS_CACHE_NEGATIVE_TIMEOUT
+    return settings.USERS_CACHE_TIMEOUT
+
+
+def _from_entry(
+    *,
+    field: str,
+    value: Any,
+    entry: tuple[int, User | None] | None,
+    version: int | None,
+) -> tuple[bool, User | None]:
+    """Whether an id entry is current, and its user if it matches the lookup."""
+    if entry is None or entry[0] != (version or 0):
+        return False, None
+
+    user = entry[1]
+    if field != "id" and getattr(user, field, None) != value:
+        # The email or username changed since it was cached.
+        return False, None
+    return True, user
+
+
+def _memo_get(*, field: str, value: Any) -> tuple[bool, User | None]:
+    memo = _memo.get()
+    if memo is None or (field, value) not in memo:
+        return False, None
+
+    _record(field=field, outcome="memo_hit")
+    return True, memo[(field, value)]
+
+
+def _memoize(*, field: str, value: Any, user: User | None) -> User | None:
+    memo = _memo.get()
+    if memo is not None:
+        memo[(field, value)] = user
+    return user
+
+
+def user_cache_get(*, field: str, value: Any) -> User | None:
+    """Get the user whose `field` is `value`, or None."""
+    found, user = _memo_get(field=field, value=value)
+    if found:
+        return user
+
+    if _transaction_changed_users():
+        _record(field=field, outcome="bypass")
+        return User.objects.filter(**{field: value}).first()
+
+    return _memoize(field=field, value=value, user=_read(field=field, value=value))
+
+
+def _read(*, field: str, value: Any) -> User | None:
+    user_id = value
+    if field != "id":
+        user_id = cache.get(_entry_key(field=field, value=value))
+        if user_id == MISSING:
+            _record(field=field, outcome="negative_hit")
+            return None
+
+    if user_id is None:
+        # Without the id, the version cannot be read before the row.
+        user = _users().filter(**{field: value}).first()
+        cache.set(
+            _entry_key(field=field, value=value),
+            MISSING if user is None else user.pk,
+            timeout=_timeout(user),
+        )
+        _record(field=field, outcome="miss")
+        return user
+
+    entry_key = _entry_key(field="id", value=user_id)
+    version_key = _version_key(user_id=user_id)
+    cached = cache.get_many([entry_key, version_key])
+    version = cached.get(version_key)
+
+    found, user = _from_entry(
+        field=field,
+        value=value,
+        entry=cached.get(entry_key),
+        version=version,
+    )
+    if found:
+        _record(field=field, outcome="hit" if user else "negative_hit")
+        return user
+
+    user = _users().filter(id=user_id).first()
+    cache.set(entry_key, (version or 0, user), timeout=_timeout(user))
+    if field != "id" and getattr(user, field, None) != value:
+        # The email or username moved away from this user: look it up anew.
+        cache.delete(_entry_key(field=field, value=value))
+        return _read(field=field, value=value)
+
+    _record(field=field, outcome="miss")
+    return user
+
+
+async def user_cache_aget(*, field: str, value: Any) -> User | None:
+    """
+    user_cache_get, with the async cache and ORM.
+
+    Async views opt out of ATOMIC_REQUESTS, so no transaction can hold
+    uncommitted user changes here.
+    """
+    found, user = _memo_get(field=field, value=value)
+    if found:
+        return user
+
+    user = await _aread(field=field, value=value)
+    return _memoize(field=field, value=value, user=user)
+
+
+async def _aread(*, field: str, value: Any) -> User | None:
+    user_id = value
+    if field != "id":
+        user_id = await cache.aget(_entry_key(field=field, value=value))
+        if user_id == MISSING:
+            _record(field=field, outcome="negative_hit")
+            return None
+
+    if user_id is None:
+        user = await _users().filter(**{field: value}).afirst()
+        await cache.aset(
+            _entry_key(field=field, value=value),
+            MISSING if user is None else user.pk,
+            timeout=_timeout(user),
+        )
+        _record(field=field, outcome="miss")
+        return user
+
+    entry_key = _entry_key(field="id", value=user_id)
+    version_key = _version_key(user_id=user_id)
+    cached = await cache.aget_many([entry_key, version_key])
+    version = cached.get(version_key)
+
+    found, user = _from_entry(
+        field=field,
+        value=value,
+        entry=cached.get(entry_key),
+        version=version,
+    )
+    if found:
+        _record(field=field, outcome="hit" if user else "negative_hit")
+        return user
+
+    user = await _users().filter(id=user_id).afirst()
+    await cache.aset(entry_key, (version or 0, user), timeout=_timeout(user))
+    if field != "id" and getattr(user, field, None) != value:
+        await cache.adelete(_entry_key(field=field, value=value))
+        return await _aread(field=field, value=value)
+
+    _record(field=field, outcome="miss")
+    return user
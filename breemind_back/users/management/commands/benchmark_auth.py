@@ -0,0 +1,85 @@
+import uuid
+from time import perf_counter
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from breemind_back.users.authentication import SignedTokenAuthentication
+from breemind_back.users.models import User
+from breemind_back.users.selectors import user_token_version_cache_key
+from breemind_back.users.services import user_issue_tokens
+
+
+class _WhoAmIApi(APIView):
+    def get(self, request):
+        return Response({"id": request.user.id})
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare authenticated requests/sec and queries/request of signed "
+        "tokens against DRF token authentication, in process."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        # A throwaway user, so no real user is left with a DRF token.
+        user = User(username=f"benchmark-auth-{uuid.uuid4().hex}", is_active=True)
+        user.set_unusable_password()
+        user.save()
+        user_id = user.id
+        try:
+            self._run(user=user, **options)
+        finally:
+            user.delete()
+            cache.delete(user_token_version_cache_key(user_id=user_id))
+
+    def _run(self, *, user, **options):
+        schemes = [
+            (
+                "token",
+                TokenAuthentication,
+                f"Token {Token.objects.create(user=user).key}",
+            ),
+            (
+                "signed",
+                SignedTokenAuthentication,
+                f"Bearer {user_issue_tokens(user=user)['access_token']}",
+            ),
+        ]
+
+        factory = APIRequestFactory()
+        for name, authentication_class, header in schemes:
+            view = _WhoAmIApi.as_view(authentication_classes=[authentication_class])
+
+            def request(view=view, header=header):
+                response = view(factory.get("/", HTTP_AUTHORIZATION=header))
+                if response.status_code != 200:  # noqa: PLR2004
+                    msg = f"Authentication failed: {response.data}"
+                    raise CommandError(msg)
+
+            # Warm up caches (token version, connection) before measuring.
+            request()
+
+            with CaptureQueriesContext(connection) as captured:
+                request()
+
+            started = perf_counter()
+            for _ in range(options["requests"]):
+                request()
+            elapsed = perf_counter() - started
+
+            self.stdout.write(
+                f"{name:>8}: {options['requests'] / elapsed:10.0f} req/s, "
+                f"{len(captured)} queries/request",
+            )
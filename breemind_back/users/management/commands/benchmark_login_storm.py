@@ -0,0 +1,97 @@
+import statistics
+import threading
+from time import perf_counter
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from breemind_back.common.exceptions import ServiceUnavailableError
+from breemind_back.users.password_hashing import password_hashing_pool
+from breemind_back.users.password_hashing import password_make
+
+
+class _PingApi(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response({"ok": True})
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure p50/p99 latency of a non-auth endpoint while threads hash "
+        "passwords as fast as they can, hashing inline versus on the pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--storm-threads", type=int, default=16)
+        parser.add_argument("--duration", type=float, default=5.0)
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"hasher: {get_hasher().algorithm}")
+
+        for name, overrides in [
+            # Today's behavior: every login hashes on its own request thread.
+            (
+                "inline",
+                {
+                    "USERS_PASSWORD_HASHING_WORKERS": 0,
+                    "USERS_PASSWORD_HASHING_MAX_QUEUE": options["storm_threads"],
+                },
+            ),
+            ("pool", {}),
+        ]:
+            with override_settings(**overrides):
+                try:
+                    self._run(name=name, **options)
+                finally:
+                    password_hashing_pool.shutdown()
+
+    def _run(self, *, name, storm_threads, duration, **options):
+        # Start the pool outside the measured window.
+        password_make(password="warm-up")  # noqa: S106
+
+        view = _PingApi.as_view()
+        factory = APIRequestFactory()
+        stop = threading.Event()
+        counts = {"hashed": 0, "rejected": 0}
+        counts_lock = threading.Lock()
+
+        def storm():
+            while not stop.is_set():
+                try:
+                    password_make(password="storm")  # noqa: S106
+                    outcome = "hashed"
+                except ServiceUnavailableError:
+                    outcome = "rejected"
+                    stop.wait(0.01)
+                with counts_lock:
+                    counts[outcome] += 1
+
+        threads = [threading.Thread(target=storm) for _ in range(storm_threads)]
+        for thread in threads:
+            thread.start()
+
+        latencies = []
+        deadline = perf_counter() + duration
+        while perf_counter() < deadline:
+            started = perf_counter()
+            view(factory.get("/"))
+            latencies.append((perf_counter() - started) * 1000)
+
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        percentiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f"{name:>7}: ping p50 {percentiles[49]:7.2f} ms, "
+            f"p99 {percentiles[98]:7.2f} ms over {len(latencies)} requests; "
+            f"{counts['hashed']} hashed, {counts['rejected']} rejected (503)",
+        )
@@ -0,0 +1,33 @@
+from asgiref.sync import iscoroutinefunction
+from asgiref.sync import markcoroutinefunction
+
+from breemind_back.users.cache import user_cache_memo
+
+
+class UserCacheMemoMiddleware:
+    """
+    Memoize user lookups for the length of each request.
+
+    Token authentication, permissions and services then share one lookup of
+    the same user instead of each reading the cache.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with user_cache_memo():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with user_cache_memo():
+            return await self.get_response(request)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 08:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_token_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='is_clinician',
+            field=models.BooleanField(default=False, help_text='Designates whether the user treats patients.', verbose_name='clinician status'),
+        ),
+    ]
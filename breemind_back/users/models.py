@@ -24,10 +24,36 @@ class User(AbstractUser, BaseModel):
 
     email_verified = models.BooleanField(default=False)
     email_verified_at = models.DateTimeField(blank=True, null=True)
+    # Clinicians read the records of their own patients; staff read all.
+    is_clinician = models.BooleanField(
+        _("clinician status"),
+        default=False,
+        help_text=_("Designates whether the user treats patients."),
+    )
+    # Bumped to revoke every signed token issued to the user so far.
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+
+    # Activity as last read from or written to the database.
+    _is_active_in_db = None
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.track_db_state()
 
     def get_absolute_url(self) -> str:
         return reverse("users:detail", kwargs={"username": self.username})
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "is_active" in field_names:
+            instance._is_active_in_db = instance.is_active  # noqa: SLF001
+        return instance
+
+    def track_db_state(self):
+        """Remember is_active as now stored in the database."""
+        self._is_active_in_db = self.is_active
+
     def mark_email_as_verified(self):
         """Mark email as verified."""
         self.email_verified = True
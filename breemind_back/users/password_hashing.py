@@ -0,0 +1,171 @@
+"""
+Password hashing off the request thread.
+
+Argon2 spends tens of milliseconds of CPU per hash. Hashes run on a small
+process pool owned by each web worker, at most workers + max queue of them
+are admitted at once, and callers past that bound fail fast with a
+ServiceUnavailableError (503 + Retry-After) instead of piling up.
+
+Nothing here may touch the ORM: pool processes only have settings.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import BrokenExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from django.contrib.auth.hashers import make_password
+
+from breemind_back.common.exceptions import ServiceUnavailableError
+
+
+def _make(password: str) -> str:
+    return make_password(password)
+
+
+def _check(password: str, encoded: str) -> tuple[bool, str | None]:
+    # Django upgrades outdated hashes through `setter`; hand the new hash back.
+    upgraded = []
+    is_correct = check_password(
+        password,
+        encoded,
+        setter=lambda raw_password: upgraded.append(make_password(raw_password)),
+    )
+    return is_correct, upgraded[0] if upgraded else None
+
+
+class PasswordHashingPool:
+    """
+    Bounded, lazily started process pool for password hashing.
+
+    The pool is created on first use, so each forked web worker gets its own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._config = None
+        self._executor = None
+        self._slots = None
+
+    def run(self, fn, *args):
+        slots, executor = self._acquire()
+
+        if executor is None:
+            try:
+                return fn(*args)
+            finally:
+                slots.release()
+
+        future = self._submit(slots, executor, fn, *args)
+        try:
+            return future.result(timeout=settings.USERS_PASSWORD_HASHING_TIMEOUT)
+        except FutureTimeoutError as exc:
+            raise self._overloaded() from exc
+
+    async def arun(self, fn, *args):
+        """run() for async callers: the event loop awaits the hash."""
+        slots, executor = self._acquire()
+
+        if executor is None:
+            try:
+                return await sync_to_async(fn, thread_sensitive=False)(*args)
+            finally:
+                slots.release()
+
+        future = self._submit(slots, executor, fn, *args)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=settings.USERS_PASSWORD_HASHING_TIMEOUT,
+            )
+        except TimeoutError as exc:
+            raise self._overloaded() from exc
+
+    def _acquire(self):
+        slots, executor = self._get()
+
+        if not slots.acquire(blocking=False):
+            raise ServiceUnavailableError(
+                message="Too many password operations in progress, retry shortly",
+                retry_after=settings.USERS_PASSWORD_HASHING_RETRY_AFTER,
+            )
+
+        return slots, executor
+
+    def _submit(self, slots, executor, fn, *args):
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenExecutor as exc:
+            slots.release()
+            self.shutdown()
+            raise ServiceUnavailableError(
+                message="Password hashing is restarting, retry shortly",
+                retry_after=settings.USERS_PASSWORD_HASHING_RETRY_AFTER,
+            ) from exc
+        future.add_done_callback(lambda _: slots.release())
+
+        return future
+
+    @staticmethod
+    def _overloaded():
+        return ServiceUnavailableError(
+            message="Password hashing is overloaded, retry shortly",
+            retry_after=settings.USERS_PASSWORD_HASHING_RETRY_AFTER,
+        )
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._config = self._executor = self._slots = None
+
+    def _get(self):
+        workers = settings.USERS_PASSWORD_HASHING_WORKERS
+        max_queue = settings.USERS_PASSWORD_HASHING_MAX_QUEUE
+
+        with self._lock:
+            if self._config != (workers, max_queue):
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+
+                self._config = (workers, max_queue)
+                self._slots = threading.BoundedSemaphore(max(workers, 1) + max_queue)
+                self._executor = None
+                if workers:
+                    # Deferred: processes that never hash should not import these.
+                    import multiprocessing  # noqa: PLC0415
+                    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+                    # Fresh interpreters: never inherit the parent's DB sockets.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("forkserver"),
+                    )
+
+            return self._slots, self._executor
+
+
+password_hashing_pool = PasswordHashingPool()
+
+
+def password_make(*, password: str) -> str:
+    """Hash a raw password for storage."""
+    return password_hashing_pool.run(_make, password)
+
+
+def password_check(*, password: str, encoded: str) -> tuple[bool, str | None]:
+    """
+    Check a raw password against a stored hash.
+
+    Returns whether it matches and, if the stored hash is outdated, its
+    replacement.
+    """
+    return password_hashing_pool.run(_check, password, encoded)
+
+
+async def apassword_check(*, password: str, encoded: str) -> tuple[bool, str | None]:
+    """password_check for async callers."""
+    return await password_hashing_pool.arun(_check, password, encoded)
@@ -1,27 +1,69 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+
+from breemind_back.users.cache import user_cache_aget
+from breemind_back.users.cache import user_cache_get
 
 User = get_user_model()
 
 
 def user_get_by_email(*, email: str) -> User | None:
-    """Get user by email."""
-    try:
-        return User.objects.get(email=email)
-    except User.DoesNotExist:
-        return None
+    """Get user by email, read through the user cache."""
+    return user_cache_get(field="email", value=email)
 
 
 def user_get_by_username(*, username: str) -> User | None:
-    """Get user by username."""
-    try:
-        return User.objects.get(username=username)
-    except User.DoesNotExist:
-        return None
-
-
-def user_get_by_id(*, id: int) -> User | None:
-    """Get user by id."""
-    try:
-        return User.objects.get(id=id)
-    except User.DoesNotExist:
-        return None
+    """Get user by username, read through the user cache."""
+    return user_cache_get(field="username", value=username)
+
+
+def user_get_by_id(*, id: int) -> User | None:  # noqa: A002
+    """Get user by id, read through the user cache."""
+    return user_cache_get(field="id", value=id)
+
+
+async def user_aget_by_id(*, id: int) -> User | None:  # noqa: A002
+    """Get user by id, read through the user cache with the async ORM."""
+    return await user_cache_aget(field="id", value=id)
+
+
+async def user_aget_by_email(*, email: str) -> User | None:
+    """Get user by email, read through the user cache with the async ORM."""
+    return await user_cache_aget(field="email", value=email)
+
+
+def user_token_version_cache_key(*, user_id: int) -> str:
+    return f"users:token_version:{user_id}"
+
+
+def user_get_token_version(*, user_id: int) -> int | None:
+    """
+    Get a user's current token version, or None if the user does not exist.
+
+    Read through the cache, so verifying a token normally costs one cache hit
+    and no query.
+    """
+    cache_key = user_token_version_cache_key(user_id=user_id)
+
+    version = cache.get(cache_key)
+    if version is not None:
+        return version
+
+    # From the primary, so a replica never caches a revoked version.
+    version = (
+        User.objects.using(router.db_for_write(User))
+        .filter(id=user_id)
+        .values_list("token_version", flat=True)
+        .first()
+    )
+    if version is not None:
+        # add, not set: a revocation committed since the read must win.
+        cache.add(
+            cache_key,
+            version,
+            timeout=settings.USERS_TOKEN_VERSION_CACHE_TIMEOUT,
+        )
+
+    return version
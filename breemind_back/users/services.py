@@ -1,15 +1,31 @@
+import hashlib
+import uuid
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core import signing
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
+from rest_framework.authtoken.models import Token
 
 from breemind_back.common.exceptions import AuthenticationError
 from breemind_back.common.exceptions import NotFoundError
+from breemind_back.emails.models import Email
+from breemind_back.emails.services import email_queue
+from breemind_back.users.cache import user_cache_invalidate
+from breemind_back.users.password_hashing import apassword_check
+from breemind_back.users.password_hashing import password_check
+from breemind_back.users.password_hashing import password_make
+from breemind_back.users.selectors import user_aget_by_email
 from breemind_back.users.selectors import user_get_by_email
 from breemind_back.users.selectors import user_get_by_id
 from breemind_back.users.selectors import user_get_by_username
+from breemind_back.users.selectors import user_get_token_version
+from breemind_back.users.selectors import user_token_version_cache_key
 
 User = get_user_model()
 
@@ -51,7 +67,7 @@ def user_create(
         name=name or "",
         is_active=False,
     )
-    user.set_password(password)
+    user.password = password_make(password=password)
     user.full_clean()
     user.save()
 
@@ -76,12 +92,20 @@ def user_authenticate(
             extra={"field": "email"},
         )
 
-    if not user.check_password(password):
+    is_correct, upgraded_password = password_check(
+        password=password,
+        encoded=user.password,
+    )
+    if not is_correct:
         raise AuthenticationError(
             message="Invalid credentials",
             extra={"field": "password"},
         )
 
+    if upgraded_password:
+        user.password = upgraded_password
+        user.save(update_fields=["password"])
+
     if not user.is_active:
         raise AuthenticationError(
             message="Account is not active. Please verify your email.",
@@ -91,6 +115,69 @@ def user_authenticate(
     return user
 
 
+async def user_aauthenticate(
+    *,
+    email: str,
+    password: str,
+) -> User:
+    """
+    Authenticate a user from an async view.
+
+    Same checks as user_authenticate; the hash is checked on the hashing pool
+    while the event loop serves other requests.
+    """
+    user = await user_aget_by_email(email=email)
+
+    if not user:
+        raise AuthenticationError(
+            message="Invalid credentials",
+            extra={"field": "email"},
+        )
+
+    if "password" in user.get_deferred_fields():
+        # Cached users leave it out, and the async ORM cannot load it lazily.
+        await user.arefresh_from_db(fields=["password"])
+
+    is_correct, upgraded_password = await apassword_check(
+        password=password,
+        encoded=user.password,
+    )
+    if not is_correct:
+        raise AuthenticationError(
+            message="Invalid credentials",
+            extra={"field": "password"},
+        )
+
+    if upgraded_password:
+        user.password = upgraded_password
+        await user.asave(update_fields=["password"])
+
+    if not user.is_active:
+        raise AuthenticationError(
+            message="Account is not active. Please verify your email.",
+            extra={"field": "email"},
+        )
+
+    return user
+
+
+@transaction.atomic
+def user_register(
+    *,
+    email: str,
+    password: str,
+    username: str,
+    name: str | None = None,
+) -> User:
+    """
+    Create a new user and queue their verification email, atomically.
+    """
+    user = user_create(email=email, password=password, username=username, name=name)
+    user_send_verification_email(user=user)
+
+    return user
+
+
 def user_generate_email_verification_token(*, user: User) -> str:
     """
     Generate email verification token for user.
@@ -99,6 +186,24 @@ def user_generate_email_verification_token(*, user: User) -> str:
     return signing.dumps({"user_id": user.id}, salt="email-verification")
 
 
+def user_send_verification_email(*, user: User) -> Email:
+    """
+    Queue an email with the user's email verification token.
+    """
+    token = user_generate_email_verification_token(user=user)
+
+    return email_queue(
+        to=user.email,
+        subject="Verify your email address",
+        plain_text=(
+            f"Hi {user.name or user.username},\n\n"
+            f"Use this token to verify your email address:\n\n{token}\n\n"
+            "It expires in 24 hours.\n"
+        ),
+        sensitive=True,
+    )
+
+
 def user_verify_email_token(*, token: str) -> User:
     """
     Verify email verification token.
@@ -150,6 +255,24 @@ def user_generate_password_reset_token(*, user: User) -> str:
     return signing.dumps({"user_id": user.id}, salt="password-reset")
 
 
+def user_send_password_reset_email(*, user: User) -> Email:
+    """
+    Queue an email with a password reset token for user.
+    """
+    token = user_generate_password_reset_token(user=user)
+
+    return email_queue(
+        to=user.email,
+        subject="Reset your password",
+        plain_text=(
+            f"Hi {user.name or user.username},\n\n"
+            f"Use this token to reset your password:\n\n{token}\n\n"
+            "It expires in 1 hour. If you did not ask for it, ignore this email.\n"
+        ),
+        sensitive=True,
+    )
+
+
 def user_verify_password_reset_token(*, token: str) -> User:
     """
     Verify password reset token.
@@ -193,7 +316,158 @@ def user_reset_password(
             extra={"errors": e.messages},
         )
 
-    user.set_password(new_password)
+    user.password = password_make(password=new_password)
     user.save(update_fields=["password"])
+    user_revoke_tokens(user=user)
+
+    return user
+
+
+def user_issue_tokens(*, user: User) -> dict[str, str]:
+    """
+    Issue a signed access token and refresh token pair for user.
+
+    Tokens carry the user's id and token version and are verified by
+    signature alone, so nothing is stored when they are issued. Refresh tokens
+    also carry a random id, so no two are alike.
+    """
+    payload = {"user_id": user.id, "version": user.token_version}
+
+    return {
+        "access_token": signing.dumps(payload, salt="access-token"),
+        "refresh_token": signing.dumps(
+            {**payload, "jti": uuid.uuid4().hex},
+            salt="refresh-token",
+        ),
+    }
+
+
+async def user_aget_api_token(*, user: User) -> str:
+    """
+    Get user's DRF API token, creating it on first use.
+
+    Deprecated: the login API still returns it for clients sending
+    `Authorization: Token` headers until they move to signed tokens.
+    """
+    token, _ = await Token.objects.aget_or_create(user=user)
+    return token.key
+
+
+def _user_load_token(*, token: str, salt: str, max_age: int) -> int:
+    try:
+        data = signing.loads(token, salt=salt, max_age=max_age)
+        user_id = data["user_id"]
+        version = data["version"]
+    except (signing.BadSignature, KeyError, TypeError) as exc:
+        raise AuthenticationError(
+            message="Invalid or expired token",
+            extra={"field": "token"},
+        ) from exc
+
+    if user_get_token_version(user_id=user_id) != version:
+        raise AuthenticationError(
+            message="Token has been revoked",
+            extra={"field": "token"},
+        )
+
+    return user_id
+
+
+def user_verify_access_token(*, token: str) -> int:
+    """
+    Verify an access token and return its user id.
+
+    Needs no query: the signature proves the payload and the token version
+    comes from the cache.
+    """
+    return _user_load_token(
+        token=token,
+        salt="access-token",
+        max_age=settings.USERS_ACCESS_TOKEN_LIFETIME,
+    )
+
+
+def user_refresh_token_spent_cache_key(*, token: str) -> str:
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    return f"users:refresh_token_spent:{digest}"
+
+
+def user_spend_refresh_token(*, token: str) -> User:
+    """
+    Verify a refresh token, mark it spent and return its active user.
+
+    Each refresh token can be spent once. Spending one a second time means a
+    copy of it leaked, so every token of the user is revoked.
+    """
+    user_id = _user_load_token(
+        token=token,
+        salt="refresh-token",
+        max_age=settings.USERS_REFRESH_TOKEN_LIFETIME,
+    )
+
+    user = user_get_by_id(id=user_id)
+    if not user or not user.is_active:
+        raise AuthenticationError(
+            message="Invalid or expired token",
+            extra={"field": "token"},
+        )
+
+    # Kept as long as the token could verify, so it never becomes spendable.
+    spent = not cache.add(
+        user_refresh_token_spent_cache_key(token=token),
+        1,
+        timeout=settings.USERS_REFRESH_TOKEN_LIFETIME,
+    )
+    if spent:
+        user_revoke_tokens(user=user)
+        raise AuthenticationError(
+            message="Token has been revoked",
+            extra={"field": "token"},
+        )
+
+    return user
+
+
+def user_refresh_tokens(*, token: str) -> dict[str, str]:
+    """
+    Exchange a refresh token for a new access and refresh token pair.
+    """
+    user = user_spend_refresh_token(token=token)
+
+    return user_issue_tokens(user=user)
+
+
+def user_logout(*, token: str, everywhere: bool = False) -> User:
+    """
+    Spend a refresh token so it cannot be exchanged anymore.
+
+    With everywhere, also revoke every other token issued to its user.
+    Access tokens issued with it stay valid until they expire otherwise.
+    """
+    user = user_spend_refresh_token(token=token)
+
+    if everywhere:
+        user_revoke_tokens(user=user)
+
+    return user
+
+
+def user_revoke_tokens(*, user: User) -> User:
+    """
+    Revoke every access and refresh token issued to user so far.
+    """
+    User.objects.filter(id=user.id).update(token_version=F("token_version") + 1)
+    user.refresh_from_db(fields=["token_version"])
+
+    version = user.token_version
+    transaction.on_commit(
+        lambda: cache.set(
+            user_token_version_cache_key(user_id=user.id),
+            version,
+            timeout=settings.USERS_TOKEN_VERSION_CACHE_TIMEOUT,
+        ),
+    )
+    # .update() skips post_save, which would drop the cached user.
+    user_cache_invalidate(user=user)
 
     return user
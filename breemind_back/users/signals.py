@@ -0,0 +1,37 @@
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from breemind_back.common.metrics import metrics_record_cache
+from breemind_back.common.services import model_bulk_updated
+from breemind_back.users.cache import user_cache_accessed
+from breemind_back.users.cache import user_cache_invalidate
+from breemind_back.users.models import User
+from breemind_back.users.services import user_revoke_tokens
+
+
+@receiver([post_save, post_delete], sender=User)
+def user_changed(sender, instance, **kwargs):
+    """Drop the user's cached lookups, now and once the write is committed."""
+    user_cache_invalidate(user=instance)
+
+
+@receiver(post_save, sender=User)
+def user_deactivated(sender, instance, **kwargs):
+    """Revoke the tokens of a user who was just deactivated."""
+    if instance._is_active_in_db and not instance.is_active:  # noqa: SLF001
+        user_revoke_tokens(user=instance)
+
+
+@receiver(model_bulk_updated, sender=User)
+def users_bulk_updated(sender, instances, **kwargs):
+    """user_changed and user_deactivated, for rows written by model_bulk_update."""
+    for instance in instances:
+        user_changed(sender=sender, instance=instance)
+        user_deactivated(sender=sender, instance=instance)
+
+
+@receiver(user_cache_accessed)
+def user_cache_counted(sender, field, outcome, **kwargs):
+    """Count the lookup as a hit or miss of the current request."""
+    metrics_record_cache(hit=outcome in {"memo_hit", "hit", "negative_hit"})
@@ -1,4 +1,9 @@
+from http import HTTPStatus
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.urls import reverse
 from rest_framework.test import APIRequestFactory
 
 from breemind_back.users.api.views import UserViewSet
@@ -26,10 +31,31 @@ class TestUserViewSet:
 
         view.request = request
 
-        response = view.me(request)  # type: ignore[call-arg, arg-type, misc]
+        response = async_to_sync(view.me)(request)  # type: ignore[call-arg, arg-type, misc]
 
         assert response.data == {
             "username": user.username,
             "url": f"http://testserver/api/users/{user.username}/",
             "name": user.name,
         }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_runs_in_a_transaction(user: User, client, monkeypatch):
+    in_transaction = []
+
+    def perform_update(self, serializer):
+        in_transaction.append(connection.in_atomic_block)
+        serializer.save()
+
+    monkeypatch.setattr(UserViewSet, "perform_update", perform_update)
+    client.force_login(user)
+
+    response = client.patch(
+        reverse("api:user-detail", kwargs={"username": user.username}),
+        {"name": "Renamed"},
+        content_type="application/json",
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert in_transaction == [True]
@@ -0,0 +1,59 @@
+from http import HTTPStatus
+from inspect import iscoroutinefunction
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import resolve
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+PASSWORD = "correct horse battery staple"  # noqa: S105
+
+
+@pytest.mark.parametrize(
+    "url_name",
+    [
+        "api:auth-register",
+        "api:auth-login",
+        "api:auth-refresh",
+        "api:auth-verify-email",
+        "api:auth-forgot-password",
+        "api:auth-reset-password",
+        "api:user-me",
+        "api:care-appointment-list",
+        "api:care-note-list",
+        "api:care-agenda",
+    ],
+)
+def test_hot_paths_are_async_views(url_name):
+    assert iscoroutinefunction(resolve(reverse(url_name)).func)
+
+
+def test_login_then_read_through_asgi(user):
+    user.set_password(PASSWORD)
+    user.is_active = True
+    user.is_clinician = True
+    user.save()
+    client = AsyncClient()
+
+    @async_to_sync
+    async def run():
+        response = await client.post(
+            reverse("api:auth-login"),
+            {"email": user.email, "password": PASSWORD},
+            content_type="application/json",
+        )
+        assert response.status_code == HTTPStatus.OK
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        response = await client.get(reverse("api:user-me"), headers=headers)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["username"] == user.username
+
+        for url_name in ("api:care-agenda", "api:care-appointment-list"):
+            response = await client.get(reverse(url_name), headers=headers)
+            assert response.status_code == HTTPStatus.OK
+
+    run()
@@ -0,0 +1,214 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory
+
+from breemind_back.users.authentication import SignedTokenAuthentication
+from breemind_back.users.selectors import user_get_token_version
+from breemind_back.users.selectors import user_token_version_cache_key
+from breemind_back.users.services import user_issue_tokens
+from breemind_back.users.services import user_reset_password
+
+pytestmark = pytest.mark.django_db
+
+PASSWORD = "correct horse battery staple"  # noqa: S105
+
+
+@pytest.fixture
+def active_user(user):
+    user.set_password(PASSWORD)
+    user.is_active = True
+    user.save()
+    return user
+
+
+def _authenticate(access_token):
+    request = APIRequestFactory().get(
+        "/",
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+    return SignedTokenAuthentication().authenticate(request)
+
+
+def test_access_token_is_verified_without_queries(
+    active_user,
+    django_assert_num_queries,
+):
+    access_token = user_issue_tokens(user=active_user)["access_token"]
+    _authenticate(access_token)  # Caches the token version.
+
+    with django_assert_num_queries(0):
+        user, _ = _authenticate(access_token)
+        assert user
+        assert user.is_authenticated
+        assert user.id == active_user.id
+
+    with django_assert_num_queries(1):
+        assert user.username == active_user.username
+
+
+def test_login_refresh_and_access(active_user, client):
+    response = client.post(
+        reverse("api:auth-login"),
+        {"email": active_user.email, "password": PASSWORD},
+    )
+    assert response.status_code == HTTPStatus.OK
+    tokens = response.json()
+
+    response = client.post(
+        reverse("api:auth-refresh"),
+        {"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.get(
+        reverse("api:user-me"),
+        HTTP_AUTHORIZATION=f"Bearer {response.json()['access_token']}",
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_login_still_returns_api_token(active_user, client):
+    response = client.post(
+        reverse("api:auth-login"),
+        {"email": active_user.email, "password": PASSWORD},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.get(
+        reverse("api:user-me"),
+        HTTP_AUTHORIZATION=f"Token {response.json()['token']}",
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["username"] == active_user.username
+
+
+def test_password_reset_revokes_tokens(
+    active_user,
+    client,
+    django_capture_on_commit_callbacks,
+):
+    tokens = user_issue_tokens(user=active_user)
+    _authenticate(tokens["access_token"])  # Caches the token version.
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user_reset_password(
+            user=active_user,
+            new_password="another long password",  # noqa: S106
+        )
+
+    response = client.get(
+        reverse("api:care-agenda"),
+        HTTP_AUTHORIZATION=f"Bearer {tokens['access_token']}",
+    )
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json()["message"] == "Token has been revoked"
+
+    response = client.post(
+        reverse("api:auth-refresh"),
+        {"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_refresh_tokens_are_rotated(active_user, client):
+    tokens = user_issue_tokens(user=active_user)
+    url = reverse("api:auth-refresh")
+
+    response = client.post(url, {"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == HTTPStatus.OK
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    response = client.post(url, {"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_replayed_refresh_token_revokes_all_tokens(
+    active_user,
+    client,
+    django_capture_on_commit_callbacks,
+):
+    tokens = user_issue_tokens(user=active_user)
+    url = reverse("api:auth-refresh")
+    rotated = client.post(url, {"refresh_token": tokens["refresh_token"]}).json()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(url, {"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()["message"] == "Token has been revoked"
+
+    response = client.post(url, {"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize("everywhere", [False, True])
+def test_logout_revokes_refresh_token(
+    active_user,
+    client,
+    django_capture_on_commit_callbacks,
+    everywhere,
+):
+    tokens = user_issue_tokens(user=active_user)
+    other_tokens = user_issue_tokens(user=active_user)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            reverse("api:auth-logout"),
+            {"refresh_token": tokens["refresh_token"], "everywhere": everywhere},
+        )
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.post(
+        reverse("api:auth-refresh"),
+        {"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    response = client.get(
+        reverse("api:user-me"),
+        HTTP_AUTHORIZATION=f"Bearer {other_tokens['access_token']}",
+    )
+    expected = HTTPStatus.FORBIDDEN if everywhere else HTTPStatus.OK
+    assert response.status_code == expected
+
+
+def test_deactivation_revokes_tokens(
+    active_user,
+    client,
+    django_capture_on_commit_callbacks,
+):
+    tokens = user_issue_tokens(user=active_user)
+    _authenticate(tokens["access_token"])  # Caches the token version.
+
+    with django_capture_on_commit_callbacks(execute=True):
+        active_user.is_active = False
+        active_user.save()
+        active_user.is_active = True
+        active_user.save()
+
+    response = client.get(
+        reverse("api:user-me"),
+        HTTP_AUTHORIZATION=f"Bearer {tokens['access_token']}",
+    )
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json()["message"] == "Token has been revoked"
+
+
+def test_token_version_read_never_overwrites_a_revocation(active_user, monkeypatch):
+    cache_key = user_token_version_cache_key(user_id=active_user.id)
+    cache.delete(cache_key)
+    get = cache.get
+
+    def get_then_revoke(key, *args, **kwargs):
+        # A revocation commits between the cache miss and the fill.
+        cache.set(cache_key, active_user.token_version + 1)
+        return get(key, *args, **kwargs) if key != cache_key else None
+
+    monkeypatch.setattr(cache, "get", get_then_revoke)
+    user_get_token_version(user_id=active_user.id)
+    monkeypatch.undo()
+
+    assert cache.get(cache_key) == active_user.token_version + 1
@@ -0,0 +1,137 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import transaction
+
+from breemind_back.common.routers import replica_reads
+from breemind_back.common.services import model_bulk_update
+from breemind_back.users.cache import user_cache_memo
+from breemind_back.users.cache import user_cache_stats
+from breemind_back.users.cache import user_cache_stats_reset
+from breemind_back.users.selectors import user_aget_by_id
+from breemind_back.users.selectors import user_get_by_email
+from breemind_back.users.selectors import user_get_by_id
+from breemind_back.users.tests.factories import UserFactory
+
+# Invalidation runs on commit, so tests need real transactions.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    cache.clear()
+    user_cache_stats_reset()
+
+
+def test_user_get_by_id_is_served_from_cache(django_assert_num_queries):
+    user = UserFactory()
+    user_get_by_id(id=user.pk)
+
+    with django_assert_num_queries(0):
+        assert user_get_by_id(id=user.pk) == user
+
+    assert user_cache_stats()["hit"] == 1
+
+
+def test_password_hashes_are_not_cached():
+    user = UserFactory()
+    user_get_by_id(id=user.pk)
+
+    cached = user_get_by_id(id=user.pk)
+
+    assert "password" in cached.get_deferred_fields()
+    assert cached.password == user.password
+
+
+def test_user_get_by_email_is_served_from_cache(django_assert_num_queries):
+    user = UserFactory()
+    # The first lookup caches the id, the second the user under its version.
+    user_get_by_email(email=user.email)
+    user_get_by_email(email=user.email)
+
+    with django_assert_num_queries(0):
+        assert user_get_by_email(email=user.email) == user
+
+
+def test_missing_user_is_cached_until_created(django_assert_num_queries):
+    assert user_get_by_email(email="nobody@example.com") is None
+
+    with django_assert_num_queries(0):
+        assert user_get_by_email(email="nobody@example.com") is None
+
+    user = UserFactory(email="nobody@example.com")
+
+    assert user_get_by_email(email="nobody@example.com") == user
+
+
+def test_bulk_updating_users_invalidates_cached_lookups():
+    user = UserFactory()
+    user_get_by_id(id=user.pk)
+
+    model_bulk_update(
+        instances=[user],
+        fields=["name"],
+        data={user.pk: {"name": "Renamed"}},
+    )
+
+    assert user_get_by_id(id=user.pk).name == "Renamed"
+
+
+def test_saving_user_invalidates_cached_lookups():
+    user = UserFactory()
+    old_email = user.email
+    user_get_by_id(id=user.pk)
+    user_get_by_email(email=old_email)
+
+    user.name = "Renamed"
+    user.email = "renamed@example.com"
+    user.save()
+
+    assert user_get_by_id(id=user.pk).name == "Renamed"
+    assert user_get_by_email(email=old_email) is None
+    assert user_get_by_email(email="renamed@example.com") == user
+
+
+def test_lookups_skip_cache_in_transaction_that_changed_user():
+    user = UserFactory()
+    user_get_by_id(id=user.pk)
+
+    with transaction.atomic():
+        user.name = "Uncommitted"
+        user.save()
+        assert user_get_by_id(id=user.pk).name == "Uncommitted"
+        transaction.set_rollback(True)
+
+    assert user_get_by_id(id=user.pk).name != "Uncommitted"
+    assert user_cache_stats()["bypass"] == 1
+
+
+def test_memo_serves_repeated_lookups_without_cache(django_assert_num_queries):
+    user = UserFactory()
+
+    with user_cache_memo():
+        user_get_by_id(id=user.pk)
+        cache.clear()
+
+        with django_assert_num_queries(0):
+            assert user_get_by_id(id=user.pk) == user
+
+    stats = user_cache_stats()
+    assert stats["memo_hit"] == 1
+    assert stats["hit_rate"] == 0.5  # noqa: PLR2004
+
+
+def test_user_aget_by_id_shares_cache_with_sync_lookups(django_assert_num_queries):
+    user = UserFactory()
+    user_get_by_id(id=user.pk)
+
+    with django_assert_num_queries(0):
+        assert async_to_sync(user_aget_by_id)(id=user.pk) == user
+
+
+def test_lookups_fill_cache_from_primary(settings):
+    settings.DATABASE_REPLICAS = ["replica"]
+    user = UserFactory()
+
+    with replica_reads():
+        assert user_get_by_email(email=user.email)._state.db == "default"  # noqa: SLF001
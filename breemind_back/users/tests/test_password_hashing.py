@@ -0,0 +1,58 @@
+import threading
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.urls import reverse
+
+from breemind_back.common.exceptions import ServiceUnavailableError
+from breemind_back.users.password_hashing import password_check
+from breemind_back.users.password_hashing import password_hashing_pool
+from breemind_back.users.password_hashing import password_make
+
+PASSWORD = "s3cret-password"  # noqa: S105
+
+
+@pytest.fixture
+def pool_settings(settings):
+    yield settings
+    password_hashing_pool.shutdown()
+
+
+def test_hashes_on_worker_processes(pool_settings):
+    pool_settings.USERS_PASSWORD_HASHING_WORKERS = 1
+
+    encoded = password_make(password=PASSWORD)
+
+    assert check_password(PASSWORD, encoded)
+    assert password_check(password=PASSWORD, encoded=encoded) == (True, None)
+    assert password_check(password=PASSWORD[1:], encoded=encoded) == (False, None)
+
+
+def test_fails_fast_when_saturated(pool_settings):
+    pool_settings.USERS_PASSWORD_HASHING_MAX_QUEUE = 0
+
+    with pytest.raises(ServiceUnavailableError):
+        # The outer call holds the only slot.
+        password_hashing_pool.run(lambda: password_make(password=PASSWORD))
+
+
+@pytest.mark.django_db
+def test_login_returns_503_with_retry_after(pool_settings, client, user):
+    pool_settings.USERS_PASSWORD_HASHING_MAX_QUEUE = 0
+    pool_settings.USERS_PASSWORD_HASHING_RETRY_AFTER = 2
+    release = threading.Event()
+    busy = threading.Thread(target=password_hashing_pool.run, args=(release.wait,))
+    busy.start()
+
+    try:
+        response = client.post(
+            reverse("api:auth-login"),
+            {"email": user.email, "password": PASSWORD},
+        )
+    finally:
+        release.set()
+        busy.join()
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response["Retry-After"] == "2"
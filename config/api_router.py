@@ -3,9 +3,19 @@ from django.urls import path
 from rest_framework.routers import DefaultRouter
 from rest_framework.routers import SimpleRouter
 
+from breemind_back.care.apis import AppointmentListApi
+from breemind_back.care.apis import ClinicAvailabilityApi
+from breemind_back.care.apis import DoctorAgendaApi
+from breemind_back.care.apis import DoctorAvailabilityApi
+from breemind_back.care.apis import NoteListApi
+from breemind_back.care.apis import NoteSearchApi
+from breemind_back.care.apis import PatientSearchApi
+from breemind_back.care.apis import PatientTimelineApi
 from breemind_back.users.api.views import UserViewSet
 from breemind_back.users.auth_apis import ForgotPasswordApi
 from breemind_back.users.auth_apis import LoginApi
+from breemind_back.users.auth_apis import LogoutApi
+from breemind_back.users.auth_apis import RefreshTokenApi
 from breemind_back.users.auth_apis import RegisterApi
 from breemind_back.users.auth_apis import ResetPasswordApi
 from breemind_back.users.auth_apis import VerifyEmailApi
@@ -18,6 +28,8 @@ app_name = "api"
 urlpatterns = [
     path("auth/register/", RegisterApi.as_view(), name="auth-register"),
     path("auth/login/", LoginApi.as_view(), name="auth-login"),
+    path("auth/refresh/", RefreshTokenApi.as_view(), name="auth-refresh"),
+    path("auth/logout/", LogoutApi.as_view(), name="auth-logout"),
     path("auth/verify-email/", VerifyEmailApi.as_view(), name="auth-verify-email"),
     path(
         "auth/forgot-password/",
@@ -29,5 +41,33 @@ urlpatterns = [
         ResetPasswordApi.as_view(),
         name="auth-reset-password",
     ),
+    path(
+        "care/patients/search/",
+        PatientSearchApi.as_view(),
+        name="care-patient-search",
+    ),
+    path(
+        "care/patients/<int:patient_id>/timeline/",
+        PatientTimelineApi.as_view(),
+        name="care-patient-timeline",
+    ),
+    path(
+        "care/appointments/",
+        AppointmentListApi.as_view(),
+        name="care-appointment-list",
+    ),
+    path("care/notes/", NoteListApi.as_view(), name="care-note-list"),
+    path("care/notes/search/", NoteSearchApi.as_view(), name="care-note-search"),
+    path("care/agenda/", DoctorAgendaApi.as_view(), name="care-agenda"),
+    path(
+        "care/availability/",
+        ClinicAvailabilityApi.as_view(),
+        name="care-clinic-availability",
+    ),
+    path(
+        "care/doctors/<int:doctor_id>/availability/",
+        DoctorAvailabilityApi.as_view(),
+        name="care-doctor-availability",
+    ),
     *router.urls,
 ]
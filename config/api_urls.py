@@ -0,0 +1,21 @@
+"""
+URLs served by API-only processes (config.settings.api).
+
+config.urls serves these too, alongside the pages, admin, allauth and the
+API schema and docs.
+"""
+
+from django.urls import include
+from django.urls import path
+from rest_framework.authtoken.views import obtain_auth_token
+
+from breemind_back.common.metrics import MetricsApi
+
+urlpatterns = [
+    # API base url
+    path("api/", include("config.api_router")),
+    # DRF auth token
+    path("api/auth-token/", obtain_auth_token, name="obtain_auth_token"),
+    # Prometheus scrape target, for staff tokens
+    path("metrics", MetricsApi.as_view(), name="metrics"),
+]
@@ -0,0 +1,26 @@
+"""
+ASGI config for breemind_back project.
+
+This module contains the ASGI application used by the production server
+(gunicorn with uvicorn workers, see compose/production/django/start). It
+should expose a module-level variable named ``application``.
+
+Sync views still work under ASGI: Django runs them in a thread per request.
+Views written as coroutines run on the event loop and only hold a thread
+while they call into sync code.
+
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# breemind_back directory.
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / "breemind_back"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+application = get_asgi_application()
@@ -0,0 +1,98 @@
+"""
+Gunicorn runtime profile, used by compose/production/django/start.
+
+GUNICORN_PROFILE picks how requests are served:
+
+- ``asgi`` (default): config.asgi on uvicorn workers, one event loop each.
+- ``wsgi``: config.wsgi on threaded (gthread) workers.
+
+Workers and threads are sized from the CPUs this container may use and can
+be overridden with WEB_CONCURRENCY and GUNICORN_THREADS. The app is loaded
+once in the master and forked, so workers share its memory copy-on-write,
+and workers are recycled after a jittered number of requests.
+"""
+
+# ruff: noqa: N999
+import gc
+import os
+from pathlib import Path
+
+from django.core.cache import cache
+from django.db import connections
+
+PROFILES = {
+    "asgi": {
+        "wsgi_app": "config.asgi:application",
+        "worker_class": "uvicorn_worker.UvicornWorker",
+    },
+    "wsgi": {
+        "wsgi_app": "config.wsgi:application",
+        "worker_class": "gthread",
+    },
+}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _cpu_count() -> int:
+    """CPUs available to this process, honouring cgroup (container) CPU quotas."""
+    cpus = len(os.sched_getaffinity(0))
+
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+    except (OSError, ValueError):
+        return cpus
+
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, round(int(quota) / int(period))))
+
+
+profile = os.environ.get("GUNICORN_PROFILE", "asgi")
+wsgi_app = PROFILES[profile]["wsgi_app"]
+worker_class = PROFILES[profile]["worker_class"]
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+if profile == "asgi":
+    # An event loop keeps a CPU busy on its own; more workers only add memory.
+    workers = _env_int("WEB_CONCURRENCY", _cpu_count() + 1)
+    threads = 1
+else:
+    # Threads cover DB and cache waits; workers cover the CPU work.
+    workers = _env_int("WEB_CONCURRENCY", _cpu_count() * 2 + 1)
+    threads = _env_int("GUNICORN_THREADS", 4)
+
+preload_app = True
+
+# Recycle workers to bound slow leaks, jittered so they do not restart together.
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 2000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+# Heartbeat files on tmpfs: a disk-backed /tmp can stall workers in Docker.
+worker_tmp_dir = "/dev/shm"  # noqa: S108
+
+
+def when_ready(server):
+    # Forked workers must not share the master's sockets or pool threads.
+    for connection in connections.all():
+        connection.close()
+        if hasattr(connection, "close_pool"):
+            connection.close_pool()
+    # Keep the collector from writing to preloaded objects' headers, which
+    # would copy their pages into every worker.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Open the DB connection (or pool) and the cache connection before the
+    # first request, so it does not pay for the handshakes.
+    for connection in connections.all():
+        connection.ensure_connection()
+        connection.close()
+    cache.get("gunicorn:warm-up")
@@ -0,0 +1,74 @@
+"""
+API-only processes: production settings without the server-rendered parts.
+
+Web workers that only serve /api/ skip the admin, allauth (with MFA), crispy
+forms, templates, messages, static files and anymail, so each worker and
+management command starts faster and holds less memory. Mail is sent by the
+`send_emails` worker, which keeps the production settings. Run the pages,
+admin, allauth and the API schema and docs with config.settings.production.
+"""
+
+from .production import *  # noqa: F403
+from .production import AUTHENTICATION_BACKENDS
+from .production import INSTALLED_APPS
+from .production import MIDDLEWARE
+from .production import REST_FRAMEWORK
+
+# URLS
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#root-urlconf
+ROOT_URLCONF = "config.api_urls"
+
+# APPS
+# ------------------------------------------------------------------------------
+API_EXCLUDED_APPS = [
+    "django.contrib.messages",
+    "django.contrib.admin",
+    "django.forms",
+    "crispy_forms",
+    "crispy_bootstrap5",
+    "allauth",
+    "allauth.account",
+    "allauth.mfa",
+    "allauth.socialaccount",
+    "drf_spectacular",
+    "anymail",
+]
+# https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_EXCLUDED_APPS]
+
+# AUTHENTICATION
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#authentication-backends
+AUTHENTICATION_BACKENDS = [
+    backend for backend in AUTHENTICATION_BACKENDS if not backend.startswith("allauth.")
+]
+
+# MIDDLEWARE
+# ------------------------------------------------------------------------------
+API_EXCLUDED_MIDDLEWARE = [
+    "breemind_back.common.middleware.WhiteNoiseMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "allauth.account.middleware.AccountMiddleware",
+]
+# https://docs.djangoproject.com/en/dev/ref/settings/#middleware
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE if middleware not in API_EXCLUDED_MIDDLEWARE
+]
+
+# TEMPLATES
+# ------------------------------------------------------------------------------
+# Error pages fall back to Django's built-in plain responses.
+# https://docs.djangoproject.com/en/dev/ref/settings/#templates
+TEMPLATES = []
+
+# django-rest-framework
+# -------------------------------------------------------------------------------
+# The browsable API renders templates; API-only processes answer in JSON.
+# They never generate the schema, so extend_schema need not load
+# drf-spectacular's generator and its dependencies either.
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_RENDERER_CLASSES": ("breemind_back.common.renderers.FastJSONRenderer",),
+    "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.openapi.AutoSchema",
+}
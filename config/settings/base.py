@@ -47,6 +47,17 @@ LOCALE_PATHS = [str(BASE_DIR / "locale")]
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db("DATABASE_URL")}
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Read replicas of the default database, as comma-separated database URLs.
+# Reads are routed to them by breemind_back.common.routers.
+DATABASE_REPLICAS = []
+for index, url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[]), 1):
+    DATABASES[f"replica_{index}"] = {
+        **env.db_url_config(url),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{index}")
+# https://docs.djangoproject.com/en/dev/ref/settings/#database-routers
+DATABASE_ROUTERS = ["breemind_back.common.routers.ReplicaRouter"]
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -56,6 +67,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ROOT_URLCONF = "config.urls"
 # https://docs.djangoproject.com/en/dev/ref/settings/#wsgi-application
 WSGI_APPLICATION = "config.wsgi.application"
+# https://docs.djangoproject.com/en/dev/ref/settings/#asgi-application
+ASGI_APPLICATION = "config.asgi.application"
 
 # APPS
 # ------------------------------------------------------------------------------
@@ -68,6 +81,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -87,6 +101,7 @@ LOCAL_APPS = [
     "breemind_back.common",
     "breemind_back.users",
     "breemind_back.care",
+    "breemind_back.emails",
     # Your stuff: custom apps go here
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
@@ -135,14 +150,17 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "breemind_back.common.middleware.MetricsMiddleware",
+    "breemind_back.common.middleware.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "breemind_back.common.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "breemind_back.users.middleware.UserCacheMemoMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -291,9 +309,33 @@ SOCIALACCOUNT_FORMS = {"signup": "breemind_back.users.forms.UserSocialSignupForm
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.SessionAuthentication",
+        "breemind_back.users.authentication.SignedTokenAuthentication",
         "rest_framework.authentication.TokenAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "breemind_back.common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "breemind_back.common.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # "<throttle_scope>_<kind>" rates for breemind_back.common.throttling.
+    "DEFAULT_THROTTLE_RATES": {
+        "auth_register_ip": "20/hour",
+        "auth_register_email": "5/hour",
+        "auth_login_ip": "30/min",
+        "auth_login_email": "10/min",
+        "auth_forgot_password_ip": "10/hour",
+        "auth_forgot_password_email": "3/hour",
+        "auth_reset_password_ip": "10/hour",
+    },
+    # Proxies in front of the app appending to X-Forwarded-For. Throttles take
+    # the client IP this many entries from its right, as clients can put
+    # anything before them; 0 ignores the header for REMOTE_ADDR.
+    "NUM_PROXIES": env.int("DJANGO_NUM_PROXIES", default=0),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "breemind_back.common.exception_handlers.custom_exception_handler",
 }
@@ -309,6 +351,82 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "1.0.0",
     "SERVE_PERMISSIONS": ["rest_framework.permissions.IsAdminUser"],
     "SCHEMA_PATH_PREFIX": "/api/",
+    "GET_LIB_DOC_EXCLUDES": "breemind_back.common.schema.get_lib_doc_excludes",
 }
 # Your stuff...
 # ------------------------------------------------------------------------------
+# breemind_back.common
+# Row count above which unfiltered listings use the planner's estimate
+# instead of an exact COUNT(*).
+PAGINATION_ESTIMATED_COUNT_THRESHOLD = 10_000
+# Seconds an exact COUNT(*) below that threshold is reused for the same query.
+PAGINATION_COUNT_CACHE_TIMEOUT = 30
+# Seconds between a worker's flushes of its request metrics to Redis.
+METRICS_FLUSH_INTERVAL = 10
+# Seconds a user's reads stay on the primary after a request of theirs wrote;
+# longer than the replicas are expected to lag behind.
+DATABASE_REPLICA_PIN_SECONDS = 5
+# OpenAPI schema written by `manage.py build_api_schema` and served by
+# /api/schema/; a stale artifact fails the test suite.
+API_SCHEMA_ARTIFACT = APPS_DIR / "openapi.json"
+# breemind_back.users
+# Lifetimes of signed access and refresh tokens, in seconds.
+USERS_ACCESS_TOKEN_LIFETIME = 60 * 15
+USERS_REFRESH_TOKEN_LIFETIME = 60 * 60 * 24 * 14
+# How long a user's token version stays cached, in seconds.
+USERS_TOKEN_VERSION_CACHE_TIMEOUT = 60 * 60 * 24
+# How long users looked up by id, email or username stay cached, in seconds.
+# Writes invalidate them; lookups that found no user expire sooner.
+USERS_CACHE_TIMEOUT = 60 * 60
+USERS_CACHE_NEGATIVE_TIMEOUT = 30
+# Processes hashing passwords off the request thread, per web worker. 0 hashes
+# inline. Beyond workers + max queue concurrent hashes, requests fail fast
+# with a 503 asking clients to retry after the given number of seconds.
+USERS_PASSWORD_HASHING_WORKERS = env.int("USERS_PASSWORD_HASHING_WORKERS", default=2)
+USERS_PASSWORD_HASHING_MAX_QUEUE = env.int(
+    "USERS_PASSWORD_HASHING_MAX_QUEUE",
+    default=8,
+)
+USERS_PASSWORD_HASHING_RETRY_AFTER = 1
+# Seconds a request waits for its hash before giving up with a 503.
+USERS_PASSWORD_HASHING_TIMEOUT = 5
+# breemind_back.emails
+# Emails claimed and sent over one mail connection per worker iteration.
+EMAILS_BATCH_SIZE = 100
+# Failed sends are retried after EMAILS_RETRY_BACKOFF * 2 ** (attempts - 1)
+# seconds, capped at EMAILS_RETRY_BACKOFF_MAX, and given up after
+# EMAILS_MAX_ATTEMPTS.
+EMAILS_MAX_ATTEMPTS = 6
+EMAILS_RETRY_BACKOFF = 30
+EMAILS_RETRY_BACKOFF_MAX = 60 * 60
+# Emails claimed longer ago than this, in seconds, by a worker that never
+# reported back are claimed again.
+EMAILS_CLAIM_TIMEOUT = 60 * 10
+# breemind_back.care
+# Weekly (weekday, start, end) working hours used for doctors without any
+# WorkingHours rows. Weekdays follow date.weekday(): Monday is 0.
+CARE_DEFAULT_WORKING_HOURS = [(weekday, "09:00", "18:00") for weekday in range(6)]
+# Longest date range, in days, accepted by the availability endpoints.
+CARE_AVAILABILITY_MAX_DAYS = 31
+# Minimum trigram word similarity for a patient name search hit.
+CARE_PATIENT_SEARCH_SIMILARITY = 0.3
+# `%>` only uses the trigram index with the threshold set as a GUC, and the
+# pg_trgm default of 0.6 rejects most single-letter typos. Set it when each
+# connection opens instead of per search, keeping any libpq options (e.g.
+# search_path, statement_timeout) that DATABASE_URL already sets.
+for database in DATABASES.values():
+    database_options = database.setdefault("OPTIONS", {})
+    database_options["options"] = " ".join(
+        filter(
+            None,
+            [
+                database_options.get("options", ""),
+                f"-c pg_trgm.word_similarity_threshold={CARE_PATIENT_SEARCH_SIMILARITY}",
+            ],
+        ),
+    )
+# How long per-(doctor, day) availability bitsets stay cached, in seconds.
+CARE_AVAILABILITY_CACHE_TIMEOUT = 60 * 60 * 24
+# How long a doctor's daily agenda stays cached, in seconds. Appointment
+# writes invalidate it; the timeout bounds staleness of patient details.
+CARE_AGENDA_CACHE_TIMEOUT = 60 * 5